@@ -0,0 +1,394 @@
+"""
+## Нагрузочные замеры слоя `DAO`.
+
+Заполняет отдельную базу данных синтетическими пользователями и заказами
+заданного объёма, затем измеряет пропускную способность и задержки (p50/p99)
+операций `UserDAO`/`OrderDAO`, полных чтений, каскадного удаления и смешанной
+нагрузки из нескольких потоков. Результаты выводятся в `JSON` для сравнения запусков.
+
+Example:
+    >>> python benchmark.py --users 10000 --orders 100000 --output bench.json
+    >>> python benchmark.py --users 1000000 --orders 10000000 --skip full_scan
+"""
+from argparse import ArgumentParser
+from array import array
+from datetime import date, datetime, timedelta, timezone
+from json import dumps
+from os import remove
+from pathlib import Path
+from platform import python_version
+from random import Random
+from sqlite3 import sqlite_version
+from sys import stderr
+from threading import Barrier, Lock, Thread
+from time import perf_counter
+from typing import Any, Callable, Iterator, Optional
+
+from core.dao.orders import OrderDAO
+from core.dao.users import UserDAO
+from core.db.enums import OrderStatus
+from core.db.mapping import OrdersTableFields, UserTableFields
+from core.db.profiles import PROFILES
+from core.db.schemas import OrdersSchema, UpdateOrder, UserSchema, UserUpdate
+
+
+# Группы замеров, которые можно пропустить через `--skip`
+GROUPS = ('seed', 'crud', 'batch', 'full_scan', 'concurrent', 'cascade')
+
+
+
+class Recorder:
+    """
+    ## Накопитель замеров.
+
+    Attributes:
+        results (list[dict]): Результаты в порядке выполнения.
+    """
+    def __init__(self) -> None:
+        self.results: list[dict] = []
+
+    def add(self, name: str, latencies: list[float], elapsed: float, rows: Optional[int] = None, **extra) -> dict:
+        """
+        ## Добавляет результат замера.
+
+        Args:
+            name (str): Имя операции.
+            latencies (list[float]): Задержки отдельных вызовов (в секундах).
+            elapsed (float): Общее время замера (в секундах).
+            rows (Optional[int]): Количество обработанных строк, если отличается от числа вызовов.
+            **extra: Дополнительные поля результата.
+
+        Returns:
+            dict: Результат замера.
+        """
+        ordered = sorted(latencies)
+        count = len(ordered)
+        result = {
+            'name': name,
+            'calls': count,
+            'elapsed_s': round(elapsed, 6),
+            'ops_per_s': round(count / elapsed, 2) if count and elapsed else None,
+            'rows_per_s': round(rows / elapsed, 2) if rows is not None and elapsed else None,
+            'mean_ms': round(sum(ordered) / count * 1000, 4) if count else None,
+            'p50_ms': round(_percentile(ordered, 0.50) * 1000, 4) if count else None,
+            'p99_ms': round(_percentile(ordered, 0.99) * 1000, 4) if count else None,
+            'max_ms': round(ordered[-1] * 1000, 4) if count else None,
+            **extra,
+        }
+        self.results.append(result)
+        print(
+            f'{name:<32} calls={count:<8} ops/s={result["ops_per_s"]!s:<12} '
+            f'p50={result["p50_ms"]!s:<10} p99={result["p99_ms"]!s:<10} ms',
+            file=stderr,
+        )
+        return result
+
+    def measure(self, name: str, func: Callable[[int], Any], calls: int, rows_per_call: Optional[int] = None) -> dict:
+        """
+        ## Последовательно вызывает `func(i)` и записывает задержки.
+
+        Args:
+            name (str): Имя операции.
+            func (Callable[[int], Any]): Операция, получает номер вызова.
+            calls (int): Количество вызовов.
+            rows_per_call (Optional[int]): Количество строк, обрабатываемых одним вызовом.
+
+        Returns:
+            dict: Результат замера.
+        """
+        latencies: list[float] = []
+        started = perf_counter()
+        for i in range(calls):
+            t0 = perf_counter()
+            func(i)
+            latencies.append(perf_counter() - t0)
+        elapsed = perf_counter() - started
+        rows = calls * rows_per_call if rows_per_call is not None else None
+        return self.add(name, latencies, elapsed, rows)
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """
+    ## Перцентиль отсортированной выборки (метод ближайшего ранга).
+    """
+    return ordered[min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))]
+
+
+def _users(count: int, rng: Random, prefix: str = 'user') -> Iterator[UserSchema]:
+    """
+    ## Генератор синтетических пользователей.
+    """
+    start = date(2020, 1, 1)
+    for i in range(count):
+        yield UserSchema(
+            name=f'{prefix}_{i}',
+            email=f'{prefix}_{i}@bench.local',
+            registration_date=start + timedelta(days=rng.randrange(1500)),
+            is_active=rng.random() < 0.9,
+        )
+
+
+def _orders(count: int, users: int, rng: Random) -> Iterator[OrdersSchema]:
+    """
+    ## Генератор синтетических заказов случайных пользователей.
+    """
+    start = date(2023, 1, 1)
+    statuses = [status.value for status in OrderStatus]
+    for _ in range(count):
+        yield OrdersSchema(
+            user_id=rng.randint(1, users),
+            order_date=start + timedelta(days=rng.randrange(730)),
+            total_amount=round(rng.uniform(1, 500), 2),
+            status=rng.choice(statuses),
+        )
+
+
+def _live_user_ids(users: UserDAO) -> list[int]:
+    """
+    ## Идентификаторы существующих пользователей.
+
+    Замеры выбирают записи только из них: при `--keep` база может хранить
+    результаты каскадных удалений предыдущих запусков.
+    """
+    ids = [row.id for row in users.iter_find_users(users.query().select(UserTableFields.ID))]
+    if not ids:
+        raise SystemExit('В базе нет пользователей: заполните её без --skip seed')
+    return ids
+
+
+def _live_order_ids(orders: OrderDAO) -> array:
+    """
+    ## Идентификаторы существующих заказов, см. `_live_user_ids`.
+    """
+    ids = orders.fetch_columns((OrdersTableFields.ID,), as_numpy=False)[OrdersTableFields.ID]
+    if not ids:
+        raise SystemExit('В базе нет заказов: заполните её без --skip seed')
+    return ids
+
+
+def seed(users: UserDAO, orders: OrderDAO, args, rng: Random, recorder: Recorder) -> None:
+    """
+    ## Заполняет базу данных и замеряет пакетную вставку.
+    """
+    started = perf_counter()
+    users.insert_users(_users(args.users, rng), batch_size=args.batch_size)
+    recorder.add('seed.insert_users', [], perf_counter() - started, rows=args.users)
+
+    started = perf_counter()
+    orders.insert_orders(_orders(args.orders, args.users, rng), batch_size=args.batch_size)
+    recorder.add('seed.insert_orders', [], perf_counter() - started, rows=args.orders)
+
+
+def bench_crud(users: UserDAO, orders: OrderDAO, args, rng: Random, recorder: Recorder) -> None:
+    """
+    ## Замеры одиночных операций `CRUD`.
+    """
+    n = args.ops
+    live_users, live_orders = _live_user_ids(users), _live_order_ids(orders)
+    user_ids = [rng.choice(live_users) for _ in range(n)]
+    order_ids = [rng.choice(live_orders) for _ in range(n)]
+    today = date.today()
+
+    recorder.measure('users.get_user', lambda i: users.get_user(user_ids[i]), n)
+    recorder.measure('orders.get_order', lambda i: orders.get_order(order_ids[i]), n)
+    recorder.measure(
+        'users.update_user',
+        lambda i: users.update_user(UserUpdate(is_active=bool(i % 2)), user_ids[i]), n,
+    )
+    recorder.measure(
+        'orders.update_order',
+        lambda i: orders.update_order(UpdateOrder(status=OrderStatus.DONE.value), order_ids[i]), n,
+    )
+
+    created_users: list[int] = []
+    recorder.measure(
+        'users.insert_user',
+        lambda i: created_users.append(users.insert_user(
+            UserSchema(name=f'crud_{i}', email=f'crud_{i}@bench.local')
+        ).id), n,
+    )
+    created_orders: list[int] = []
+    recorder.measure(
+        'orders.insert_order',
+        lambda i: created_orders.append(orders.insert_order(
+            OrdersSchema(user_id=created_users[i], order_date=today, total_amount=10.0, status=1)
+        ).id), n,
+    )
+    recorder.measure('orders.delete_order', lambda i: orders.delete_order(created_orders[i]), n)
+    recorder.measure('users.delete_user', lambda i: users.delete_user(created_users[i]), n)
+
+
+def bench_batch(users: UserDAO, orders: OrderDAO, args, rng: Random, recorder: Recorder) -> None:
+    """
+    ## Замеры пакетных чтений и чтений по индексам.
+    """
+    n = max(1, args.ops // 10)
+    size = 100
+    live_users = _live_user_ids(users)
+    id_batches = [[rng.choice(live_users) for _ in range(size)] for _ in range(n)]
+    recorder.measure('users.get_users_by_ids[100]', lambda i: users.get_users_by_ids(id_batches[i]), n, size)
+    recorder.measure('orders.get_orders_for_user', lambda i: orders.get_orders_for_user(id_batches[i][0]), n)
+    recorder.measure(
+        'users.get_users_with_orders[100]', lambda i: users.get_users_with_orders(id_batches[i]), n, size
+    )
+
+    pages: dict[str, Optional[str]] = {'token': None}
+
+    def next_page(i: int) -> None:
+        page = users.get_users_page(limit=size, token=pages['token'])
+        pages['token'] = page.next_token
+
+    recorder.measure('users.get_users_page[100]', next_page, n, size)
+
+    start = date(2023, 1, 1)
+    recorder.measure(
+        'orders.aggregate_orders[by_status]',
+        lambda i: orders.aggregate_orders({'revenue': ('sum', 'total_amount'), 'orders': ('count', '*')}, ('status',)),
+        max(1, n // 10),
+    )
+    recorder.measure(
+        'orders.aggregate_orders[daily_30d]',
+        lambda i: orders.aggregate_orders(
+            {'orders': ('count', '*')}, ('order_date',), date_from=start, date_to=start + timedelta(days=30)
+        ),
+        max(1, n // 10),
+    )
+
+
+def bench_full_scan(users: UserDAO, orders: OrderDAO, args, rng: Random, recorder: Recorder) -> None:
+    """
+    ## Замеры полных чтений таблиц.
+    """
+    if args.orders <= args.max_materialize:
+        recorder.measure('users.get_users', lambda i: users.get_users(), 1, args.users)
+        recorder.measure('orders.get_orders', lambda i: orders.get_orders(), 1, args.orders)
+        recorder.measure('orders.get_orders[row]', lambda i: orders.get_orders(mode='row'), 1, args.orders)
+    recorder.measure('orders.iter_orders', lambda i: sum(1 for _ in orders.iter_orders()), 1, args.orders)
+    recorder.measure(
+        'orders.fetch_columns[id,total_amount]',
+        lambda i: orders.fetch_columns(('id', 'total_amount')), 1, args.orders,
+    )
+
+
+def bench_cascade(users: UserDAO, orders: OrderDAO, args, rng: Random, recorder: Recorder) -> None:
+    """
+    ## Замеры удаления пользователей с каскадным удалением их заказов.
+    """
+    live_users = _live_user_ids(users)
+    n = min(max(1, args.ops // 10), len(live_users))
+    ids = rng.sample(live_users, n)
+    recorder.measure('users.delete_user[cascade]', lambda i: users.delete_user(ids[i]), n)
+
+
+def bench_concurrent(users: UserDAO, orders: OrderDAO, args, rng: Random, recorder: Recorder) -> None:
+    """
+    ## Смешанная нагрузка из нескольких потоков: чтения и записи в заданной пропорции.
+    """
+    user_ids, order_ids = _live_user_ids(users), _live_order_ids(orders)
+    latencies: list[float] = []
+    errors: list[str] = []
+    lock = Lock()
+    barrier = Barrier(args.threads)
+    per_thread = args.ops
+
+    def worker(seed_value: int) -> None:
+        local_rng = Random(seed_value)
+        local: list[float] = []
+        barrier.wait()
+        for _ in range(per_thread):
+            t0 = perf_counter()
+            try:
+                if local_rng.random() < args.read_ratio:
+                    orders.get_orders_for_user(local_rng.choice(user_ids))
+                else:
+                    orders.update_order(UpdateOrder(status=OrderStatus.PENDING.value), local_rng.choice(order_ids))
+            except Exception as ex:
+                with lock:
+                    errors.append(type(ex).__name__)
+            local.append(perf_counter() - t0)
+        with lock:
+            latencies.extend(local)
+
+    threads = [Thread(target=worker, args=(args.seed + i,)) for i in range(args.threads)]
+    started = perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    recorder.add(
+        f'mixed[threads={args.threads},read={args.read_ratio}]',
+        latencies, perf_counter() - started, errors=len(errors),
+    )
+
+
+BENCHMARKS: dict[str, Callable] = {
+    'crud': bench_crud,
+    'batch': bench_batch,
+    'full_scan': bench_full_scan,
+    # Перед каскадным удалением, чтобы смешанная нагрузка работала с полной базой
+    'concurrent': bench_concurrent,
+    'cascade': bench_cascade,
+}
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Нагрузочные замеры слоя DAO')
+    parser.add_argument('--users', type=int, default=10_000, help='Количество пользователей')
+    parser.add_argument('--orders', type=int, default=100_000, help='Количество заказов')
+    parser.add_argument('--ops', type=int, default=1000, help='Количество вызовов каждой одиночной операции')
+    parser.add_argument('--threads', type=int, default=4, help='Количество потоков смешанной нагрузки')
+    parser.add_argument('--read-ratio', type=float, default=0.9, help='Доля чтений в смешанной нагрузке')
+    parser.add_argument('--batch-size', type=int, default=10_000, help='Размер пакета при заполнении')
+    parser.add_argument('--max-materialize', type=int, default=1_000_000,
+                        help='Максимальный размер таблицы для чтений целиком в память')
+    parser.add_argument('--profile', default='throughput', choices=tuple(PROFILES), help='Профиль подключений пула')
+    parser.add_argument('--db-name', default='bench', help='Имя файла базы данных (без .db)')
+    parser.add_argument('--keep', action='store_true', help='Использовать существующую базу без заполнения')
+    parser.add_argument('--seed', type=int, default=42, help='Зерно генератора данных')
+    parser.add_argument('--skip', nargs='*', default=(), choices=GROUPS, help='Пропускаемые группы замеров')
+    parser.add_argument('--output', help='Файл для результатов JSON (по умолчанию stdout)')
+    args = parser.parse_args()
+    if 'seed' in args.skip and not args.keep:
+        parser.error('--skip seed допустим только вместе с --keep: без --keep база пересоздаётся пустой')
+
+    if not args.keep:
+        for suffix in ('.db', '.db-wal', '.db-shm'):
+            path = Path(args.db_name + suffix)
+            if path.exists():
+                remove(path)
+
+    rng = Random(args.seed)
+    users = UserDAO(db_name=args.db_name, profile=args.profile)
+    orders = OrderDAO(db_name=args.db_name)
+    recorder = Recorder()
+
+    if not args.keep and 'seed' not in args.skip:
+        seed(users, orders, args, rng, recorder)
+    for name, bench in BENCHMARKS.items():
+        if name not in args.skip:
+            bench(users, orders, args, rng, recorder)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': python_version(),
+            'sqlite': sqlite_version,
+            'profile': args.profile,
+            'users': args.users,
+            'orders': args.orders,
+            'ops': args.ops,
+            'threads': args.threads,
+            'read_ratio': args.read_ratio,
+            'seed': args.seed,
+        },
+        'results': recorder.results,
+    }
+    payload = dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload, encoding='utf-8')
+    else:
+        print(payload)
+
+
+if __name__ == '__main__':
+    main()
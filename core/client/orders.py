@@ -52,6 +52,15 @@ class OrdersClient:
             id=id 
         )
 
+    def get_user_orders(self) -> list[SomeOrder]:
+        """
+        ## Получение заказов пользователя клиента.
+
+        Returns:
+            list[SomeOrder]: Заказы пользователя.
+        """
+        return self.dao.get_orders_for_user(self.user_id)
+
     def start(self):
         """
         ## Запуск клиента заказов.
@@ -60,20 +69,20 @@ class OrdersClient:
             - Создает новый заказ.
             - обновляет его информацию.
             - получает заказ по идентификатору.
-            - получает все заказы.
+            - получает заказы пользователя.
             - удаляет обновленный заказ.
             - Выводит информацию о всех операциях в консоль.
         """
         created_order: SomeOrder = self.create_order()
         updated_order: SomeOrder = self.update_order(id=created_order.id)
         order_by_id: SomeOrder = self.dao.get_order(id=updated_order.id)
-        all_orders: list[SomeOrder] = self.dao.get_orders()
+        user_orders: list[SomeOrder] = self.get_user_orders()
         deleted_order: SomeOrder = self.dao.delete_order(id=updated_order.id)
         print(f'\n\n***************** ЗАКАЗЫ *****************')
         print(f'\n{created_order=}')
         print(f'\n{updated_order=}')
         print(f'\n{order_by_id=}')
-        print(f'\n{all_orders=}')
+        print(f'\n{user_orders=}')
         print(f'\n{deleted_order=}')
 
 
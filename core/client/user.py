@@ -1,6 +1,7 @@
 from datetime import datetime
 from pydoc import cli
 
+from core.dao.uow import unit_of_work
 from core.dao.users import user_dao, UserDAO
 
 from core.db.schemas import SomeOrder, UserSchema, UserUpdate, SomeUser
@@ -89,10 +90,11 @@ class UserClient:
         print(f'\n{deleted_user=}\n\n')
 
         print(f'\n\n***************** СОЗДАЁМ ПОЛЬЗОВАТЕЛЯ, ДОБАВЛЯЕМ ЗАКАЗ, УДАЛЯЕМ ПОЛЬЗОВАТЕЛЯ ДЛЯ КАСКАДНОГО УДАЛЕНИЯ *****************')
-        created_user: SomeUser = self.create_user()
-        client = OrdersClient(user_id=created_user.id)
-        crearted_order: SomeOrder = client.create_order()
-        deleted_user: SomeUser = self.dao.delete_user(id=updated_user.id)
+        with unit_of_work():  # пользователь и его первый заказ создаются одной транзакцией
+            created_user: SomeUser = self.create_user()
+            client = OrdersClient(user_id=created_user.id)
+            crearted_order: SomeOrder = client.create_order()
+        deleted_user: SomeUser = self.dao.delete_user(id=created_user.id)
         all_orders: list[SomeOrder] = client.dao.get_orders()
         print(f'\n{created_user=}')
         print(f'\n{crearted_order=}')
@@ -0,0 +1,543 @@
+from asyncio import get_running_loop
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from datetime import date
+from threading import Lock
+from typing import Any, AsyncIterator, Callable, Iterable, Mapping, Optional, Sequence, TypeVar, Union
+
+from .base import BaseDAO, DEFAULT_BATCH_SIZE, DEFAULT_FETCH_SIZE
+from .query import Query
+from .orders import order_dao, OrderDAO
+from .payments import payment_dao, PaymentDAO
+from .users import user_dao, UserDAO
+
+from core.db.enums import AggregateFunc
+from core.db.schemas import (
+    BatchResult, OrdersSchema, Page, PaymentsSchema, SomeOrder, SomePayment, SomeUser, UpdateOrder, UpdatePayment,
+    UserSchema, UserUpdate, UserWithOrders,
+)
+
+
+R = TypeVar('R')
+
+
+_executors: dict[str, ThreadPoolExecutor] = {}
+_executors_lock = Lock()
+
+
+def get_executor(dao: BaseDAO) -> ThreadPoolExecutor:
+    """
+    ## Возвращает выделенный пул потоков для базы данных `DAO`.
+
+    Пул создаётся один раз на файл базы данных, его размер равен размеру пула
+    подключений, поэтому потоки не простаивают в ожидании подключения.
+
+    Args:
+        dao (BaseDAO): Синхронный `DAO`, чья база данных обслуживается.
+
+    Returns:
+        ThreadPoolExecutor: Пул потоков для запросов к базе данных.
+    """
+    with _executors_lock:
+        executor = _executors.get(dao.db_name)
+        if executor is None:
+            executor = _executors[dao.db_name] = ThreadPoolExecutor(
+                max_workers=dao.pool.max_size,
+                thread_name_prefix=f'dao-{dao.db_name}',
+            )
+        return executor
+
+
+
+class AsyncBaseDAO:
+    """
+    ## Базовый асинхронный `DAO`.
+
+    Оборачивает синхронный `DAO` и выполняет его методы в выделенном пуле потоков
+    базы данных, поэтому цикл событий не блокируется на вводе-выводе `SQLite`.
+    Итерируемые аргументы материализуются в списки до передачи в пул потоков.
+
+    Только синхронными остаются методы, которым корутина не нужна или вредна:
+    `query` (построение запроса без ввода-вывода) доступен напрямую;
+    `iter_find_*` удерживают подключение между итерациями и недоступны — вместо
+    них `find_*` или `iter_*`, читающие таблицу страницами; `*_deferred` уже не
+    блокируют и возвращают `Future`, которую можно ожидать через `asyncio.wrap_future`;
+    управление кэшем (`enable_cache`, `disable_cache`) — через атрибут `dao`.
+
+    Attributes:
+        dao (BaseDAO): Синхронный `DAO`, которому делегируются запросы.
+        executor (ThreadPoolExecutor): Пул потоков базы данных.
+    """
+    def __init__(self, dao: BaseDAO) -> None:
+        """
+        ## Инициализация асинхронного `DAO`.
+
+        Args:
+            dao (BaseDAO): Синхронный `DAO`, которому делегируются запросы.
+        """
+        self.dao = dao
+        self.executor: ThreadPoolExecutor = get_executor(dao)
+
+    def query(self) -> Query:
+        """
+        ## Создаёт построитель запроса к таблице `DAO` (без обращения к базе данных).
+        """
+        return self.dao.query()
+
+    async def run(self, func: Callable[..., R], *args, **kwargs) -> R:
+        """
+        ## Выполняет синхронный вызов в пуле потоков базы данных.
+
+        Args:
+            func (Callable[..., R]): Синхронная функция.
+            *args: Позиционные аргументы функции.
+            **kwargs: Именованные аргументы функции.
+
+        Returns:
+            R: Результат функции.
+        """
+        loop = get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+
+
+class AsyncUserDAO(AsyncBaseDAO):
+    """
+    ## Асинхронный `DAO` для работы с пользователями.
+
+    Повторяет интерфейс `UserDAO` в виде корутин.
+    """
+    def __init__(self, dao: UserDAO = user_dao) -> None:
+        """
+        ## Инициализация `AsyncUserDAO`.
+
+        Args:
+            dao (UserDAO): Синхронный `DAO` пользователей. По умолчанию `user_dao`.
+        """
+        super().__init__(dao)
+        self.dao: UserDAO = dao
+
+    async def get_users(self) -> list[SomeUser]:
+        """
+        ## Получение всех пользователей, см. `UserDAO.get_users`.
+        """
+        return await self.run(self.dao.get_users)
+
+    async def iter_users(self, page_size: int = 500) -> AsyncIterator[SomeUser]:
+        """
+        ## Потоковое получение всех пользователей.
+
+        Читает таблицу страницами по `page_size` через keyset-пагинацию:
+        каждая страница — отдельный запрос, поэтому подключение не удерживается
+        между итерациями.
+
+        Args:
+            page_size (int): Количество записей в одной странице. По умолчанию `500`.
+
+        Yields:
+            SomeUser: Очередной пользователь.
+        """
+        token: Optional[str] = None
+        while True:
+            page = await self.run(self.dao.get_users_page, page_size, token)
+            for user in page.items:
+                yield user
+            if page.next_token is None:
+                return
+            token = page.next_token
+
+    async def find_users(self, query: Query) -> Union[list[SomeUser], list[tuple]]:
+        """
+        ## Получение пользователей по запросу построителя, см. `UserDAO.find_users`.
+        """
+        return await self.run(self.dao.find_users, query)
+
+    async def get_users_page(
+        self,
+        limit: int = 50,
+        token: Optional[str] = None,
+        sort_by: Sequence[str] = (),
+        descending: bool = False,
+    ) -> Page[SomeUser]:
+        """
+        ## Постраничное получение пользователей, см. `UserDAO.get_users_page`.
+        """
+        return await self.run(self.dao.get_users_page, limit, token, sort_by, descending)
+
+    async def insert_user(self, user: UserSchema) -> SomeUser:
+        """
+        ## Вставка нового пользователя, см. `UserDAO.insert_user`.
+        """
+        return await self.run(self.dao.insert_user, user)
+
+    async def insert_users(
+        self,
+        users: Iterable[UserSchema],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        returning: bool = False,
+    ) -> list[SomeUser]:
+        """
+        ## Пакетная вставка пользователей, см. `UserDAO.insert_users`.
+        """
+        return await self.run(self.dao.insert_users, list(users), batch_size, returning)
+
+    async def update_user(self, user: UserUpdate, id: int) -> SomeUser:
+        """
+        ## Обновление информации о пользователе, см. `UserDAO.update_user`.
+        """
+        return await self.run(self.dao.update_user, user, id)
+
+    async def update_users(
+        self,
+        user: UserUpdate,
+        ids: Iterable[int],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[SomeUser]:
+        """
+        ## Пакетное обновление пользователей, см. `UserDAO.update_users`.
+        """
+        return await self.run(self.dao.update_users, user, list(ids), batch_size=batch_size)
+
+    async def get_user(self, id: int) -> SomeUser:
+        """
+        ## Получение информации о пользователе, см. `UserDAO.get_user`.
+        """
+        return await self.run(self.dao.get_user, id)
+
+    async def get_users_with_orders(
+        self,
+        ids: Optional[Iterable[int]] = None,
+        batch_size: int = DEFAULT_FETCH_SIZE,
+    ) -> list[UserWithOrders]:
+        """
+        ## Получение пользователей вместе с заказами, см. `UserDAO.get_users_with_orders`.
+        """
+        ids = list(ids) if ids is not None else None
+        return await self.run(self.dao.get_users_with_orders, ids, batch_size=batch_size)
+
+    async def get_users_by_ids(
+        self,
+        ids: Iterable[int],
+        batch_size: int = DEFAULT_FETCH_SIZE,
+    ) -> BatchResult[SomeUser]:
+        """
+        ## Пакетное получение пользователей по идентификаторам, см. `UserDAO.get_users_by_ids`.
+        """
+        return await self.run(self.dao.get_users_by_ids, list(ids), batch_size=batch_size)
+
+    async def delete_user(self, id: int) -> SomeUser:
+        """
+        ## Удаление пользователя, см. `UserDAO.delete_user`.
+        """
+        return await self.run(self.dao.delete_user, id)
+
+    async def delete_users(
+        self,
+        ids: Iterable[int],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        returning: bool = False,
+    ) -> list[SomeUser]:
+        """
+        ## Пакетное удаление пользователей, см. `UserDAO.delete_users`.
+        """
+        return await self.run(self.dao.delete_users, list(ids), batch_size, returning)
+
+
+
+class AsyncOrderDAO(AsyncBaseDAO):
+    """
+    ## Асинхронный `DAO` для работы с заказами.
+
+    Повторяет интерфейс `OrderDAO` в виде корутин.
+    """
+    def __init__(self, dao: OrderDAO = order_dao) -> None:
+        """
+        ## Инициализация `AsyncOrderDAO`.
+
+        Args:
+            dao (OrderDAO): Синхронный `DAO` заказов. По умолчанию `order_dao`.
+        """
+        super().__init__(dao)
+        self.dao: OrderDAO = dao
+
+    async def get_orders(self) -> list[SomeOrder]:
+        """
+        ## Получение всех заказов, см. `OrderDAO.get_orders`.
+        """
+        return await self.run(self.dao.get_orders)
+
+    async def iter_orders(self, page_size: int = 500) -> AsyncIterator[SomeOrder]:
+        """
+        ## Потоковое получение всех заказов.
+
+        Читает таблицу страницами по `page_size` через keyset-пагинацию:
+        каждая страница — отдельный запрос, поэтому подключение не удерживается
+        между итерациями.
+
+        Args:
+            page_size (int): Количество записей в одной странице. По умолчанию `500`.
+
+        Yields:
+            SomeOrder: Очередной заказ.
+        """
+        token: Optional[str] = None
+        while True:
+            page = await self.run(self.dao.get_orders_page, page_size, token)
+            for order in page.items:
+                yield order
+            if page.next_token is None:
+                return
+            token = page.next_token
+
+    async def find_orders(self, query: Query) -> Union[list[SomeOrder], list[tuple]]:
+        """
+        ## Получение заказов по запросу построителя, см. `OrderDAO.find_orders`.
+        """
+        return await self.run(self.dao.find_orders, query)
+
+    async def get_orders_page(
+        self,
+        limit: int = 50,
+        token: Optional[str] = None,
+        sort_by: Sequence[str] = (),
+        descending: bool = False,
+    ) -> Page[SomeOrder]:
+        """
+        ## Постраничное получение заказов, см. `OrderDAO.get_orders_page`.
+        """
+        return await self.run(self.dao.get_orders_page, limit, token, sort_by, descending)
+
+    async def insert_order(self, order: OrdersSchema) -> SomeOrder:
+        """
+        ## Вставка нового заказа, см. `OrderDAO.insert_order`.
+        """
+        return await self.run(self.dao.insert_order, order)
+
+    async def insert_orders(
+        self,
+        orders: Iterable[OrdersSchema],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        returning: bool = False,
+    ) -> list[SomeOrder]:
+        """
+        ## Пакетная вставка заказов, см. `OrderDAO.insert_orders`.
+        """
+        return await self.run(self.dao.insert_orders, list(orders), batch_size, returning)
+
+    async def update_order(self, order: UpdateOrder, id: int) -> SomeOrder:
+        """
+        ## Обновление информации о заказе, см. `OrderDAO.update_order`.
+        """
+        return await self.run(self.dao.update_order, order, id)
+
+    async def update_orders(
+        self,
+        order: UpdateOrder,
+        ids: Iterable[int],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[SomeOrder]:
+        """
+        ## Пакетное обновление заказов, см. `OrderDAO.update_orders`.
+        """
+        return await self.run(self.dao.update_orders, order, list(ids), batch_size=batch_size)
+
+    async def get_order(self, id: int) -> SomeOrder:
+        """
+        ## Получение информации о заказе, см. `OrderDAO.get_order`.
+        """
+        return await self.run(self.dao.get_order, id)
+
+    async def aggregate_orders(
+        self,
+        aggregates: Mapping[str, tuple[AggregateFunc, str]],
+        group_by: Sequence[str] = (),
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> list[tuple]:
+        """
+        ## Агрегация заказов, см. `OrderDAO.aggregate_orders`.
+        """
+        return await self.run(self.dao.aggregate_orders, aggregates, group_by, date_from, date_to)
+
+    async def fetch_columns(
+        self,
+        columns: Sequence[str],
+        batch_size: int = DEFAULT_FETCH_SIZE,
+        as_numpy: bool = False,
+    ) -> dict[str, Any]:
+        """
+        ## Столбцовое чтение заказов, см. `OrderDAO.fetch_columns`.
+        """
+        return await self.run(self.dao.fetch_columns, tuple(columns), batch_size, as_numpy)
+
+    async def get_orders_for_user(self, user_id: int) -> list[SomeOrder]:
+        """
+        ## Получение заказов пользователя, см. `OrderDAO.get_orders_for_user`.
+        """
+        return await self.run(self.dao.get_orders_for_user, user_id)
+
+    async def get_orders_by_ids(
+        self,
+        ids: Iterable[int],
+        batch_size: int = DEFAULT_FETCH_SIZE,
+    ) -> BatchResult[SomeOrder]:
+        """
+        ## Пакетное получение заказов по идентификаторам, см. `OrderDAO.get_orders_by_ids`.
+        """
+        return await self.run(self.dao.get_orders_by_ids, list(ids), batch_size=batch_size)
+
+    async def delete_order(self, id: int) -> SomeOrder:
+        """
+        ## Удаление заказа, см. `OrderDAO.delete_order`.
+        """
+        return await self.run(self.dao.delete_order, id)
+
+    async def delete_orders(
+        self,
+        ids: Iterable[int],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        returning: bool = False,
+    ) -> list[SomeOrder]:
+        """
+        ## Пакетное удаление заказов, см. `OrderDAO.delete_orders`.
+        """
+        return await self.run(self.dao.delete_orders, list(ids), batch_size, returning)
+
+
+
+
+class AsyncPaymentDAO(AsyncBaseDAO):
+    """
+    ## Асинхронный `DAO` для работы с платежами.
+
+    Повторяет интерфейс `PaymentDAO` в виде корутин.
+    """
+    def __init__(self, dao: PaymentDAO = payment_dao) -> None:
+        """
+        ## Инициализация `AsyncPaymentDAO`.
+
+        Args:
+            dao (PaymentDAO): Синхронный `DAO` платежей. По умолчанию `payment_dao`.
+        """
+        super().__init__(dao)
+        self.dao: PaymentDAO = dao
+
+    async def get_payments(self) -> list[SomePayment]:
+        """
+        ## Получение всех платежей, см. `PaymentDAO.get_payments`.
+        """
+        return await self.run(self.dao.get_payments)
+
+    async def iter_payments(self, page_size: int = 500) -> AsyncIterator[SomePayment]:
+        """
+        ## Потоковое получение всех платежей.
+
+        Читает таблицу страницами по `page_size` через keyset-пагинацию по `id`:
+        каждая страница — отдельный запрос, поэтому подключение не удерживается
+        между итерациями.
+
+        Args:
+            page_size (int): Количество записей в одной странице. По умолчанию `500`.
+
+        Yields:
+            SomePayment: Очередной платёж.
+        """
+        token: Optional[str] = None
+        while True:
+            payments, token = await self.run(self._get_payments_page, page_size, token)
+            for payment in payments:
+                yield payment
+            if token is None:
+                return
+
+    def _get_payments_page(self, limit: int, token: Optional[str]) -> tuple[list[SomePayment], Optional[str]]:
+        """
+        ## Страница платежей и токен следующей страницы (выполняется в пуле потоков).
+        """
+        rows, token = self.dao.get_page(self.dao.table_name, limit, token)
+        return self.dao.mapper.many(rows), token
+
+    async def find_payments(self, query: Query) -> list:
+        """
+        ## Получение платежей по запросу построителя, см. `PaymentDAO.find_payments`.
+        """
+        return await self.run(self.dao.find_payments, query)
+
+    async def get_payments_for_order(self, order_id: int) -> list[SomePayment]:
+        """
+        ## Получение платежей заказа, см. `PaymentDAO.get_payments_for_order`.
+        """
+        return await self.run(self.dao.get_payments_for_order, order_id)
+
+    async def get_payments_by_ids(
+        self,
+        ids: Iterable[int],
+        batch_size: int = DEFAULT_FETCH_SIZE,
+    ) -> BatchResult[SomePayment]:
+        """
+        ## Пакетное получение платежей по идентификаторам, см. `PaymentDAO.get_payments_by_ids`.
+        """
+        return await self.run(self.dao.get_payments_by_ids, list(ids), batch_size=batch_size)
+
+    async def insert_payment(self, payment: PaymentsSchema) -> SomePayment:
+        """
+        ## Вставка платежа, см. `PaymentDAO.insert_payment`.
+        """
+        return await self.run(self.dao.insert_payment, payment)
+
+    async def insert_payments(
+        self,
+        payments: Iterable[PaymentsSchema],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        returning: bool = False,
+    ) -> list[SomePayment]:
+        """
+        ## Пакетная вставка платежей, см. `PaymentDAO.insert_payments`.
+        """
+        return await self.run(self.dao.insert_payments, list(payments), batch_size, returning)
+
+    async def update_payment(self, payment: UpdatePayment, id: int) -> SomePayment:
+        """
+        ## Обновление платежа, см. `PaymentDAO.update_payment`.
+        """
+        return await self.run(self.dao.update_payment, payment, id)
+
+    async def update_payments(
+        self,
+        payment: UpdatePayment,
+        ids: Iterable[int],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[SomePayment]:
+        """
+        ## Пакетное обновление платежей, см. `PaymentDAO.update_payments`.
+        """
+        return await self.run(self.dao.update_payments, payment, list(ids), batch_size=batch_size)
+
+    async def get_payment(self, id: int) -> SomePayment:
+        """
+        ## Получение платежа, см. `PaymentDAO.get_payment`.
+        """
+        return await self.run(self.dao.get_payment, id)
+
+    async def delete_payment(self, id: int) -> SomePayment:
+        """
+        ## Удаление платежа, см. `PaymentDAO.delete_payment`.
+        """
+        return await self.run(self.dao.delete_payment, id)
+
+    async def delete_payments(
+        self,
+        ids: Iterable[int],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        returning: bool = False,
+    ) -> list[SomePayment]:
+        """
+        ## Пакетное удаление платежей, см. `PaymentDAO.delete_payments`.
+        """
+        return await self.run(self.dao.delete_payments, list(ids), batch_size, returning)
+
+
+
+async_user_dao = AsyncUserDAO()
+async_order_dao = AsyncOrderDAO()
+async_payment_dao = AsyncPaymentDAO()
@@ -1,7 +1,200 @@
-from typing import Optional
-from sqlite3 import IntegrityError
+from array import array
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import namedtuple
+from concurrent.futures import Future
+import contextlib
+from copy import copy
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from itertools import batched
+from json import dumps, loads
+from keyword import iskeyword
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Sequence
+from sqlite3 import Connection, Cursor, IntegrityError, SQLITE_LIMIT_VARIABLE_NUMBER
+from sys import _getframe
+from time import perf_counter
 
 from core.db.client import DataBase
+from core.db.enums import AggregateFunc
+from core.db.indexes import Index
+from core.db.mapping import StaticFields
+
+from .cache import LRUCache, MISSING
+from .instrumentation import instrumentation, QueryEvent
+from .query import Query
+from .sql_registry import sql_registry
+from .sql_templates import AGGREGATE, GET_BY_IDS, GET_FIRST_PAGE, GET_NEXT_PAGE, GET_ONE
+from .sql_templates import UPDATE_FIELDS, UPDATE_FIELDS_BY_IDS
+from .writer import get_writer
+
+
+# Количество записей, фиксируемых одной транзакцией в пакетных операциях
+DEFAULT_BATCH_SIZE = 1000
+# Количество строк, загружаемых за одно обращение `fetchmany` при потоковом чтении
+DEFAULT_FETCH_SIZE = 500
+
+# Фабрика строк курсора `sqlite3`: (курсор, кортеж значений) -> объект строки
+RowFactory = Callable[[Cursor, tuple], Any]
+
+# Файлы, кадры которых пропускаются при определении метода `DAO`, выполнившего запрос
+_INTERNAL_FILES = frozenset((__file__, contextlib.__file__))
+
+# Ключевые слова `SQLite` (https://sqlite.org/lang_keywords.html): недопустимы как имена результатов
+_SQLITE_KEYWORDS = frozenset("""
+    ABORT ACTION ADD AFTER ALL ALTER ALWAYS ANALYZE AND AS ASC ATTACH AUTOINCREMENT BEFORE BEGIN
+    BETWEEN BY CASCADE CASE CAST CHECK COLLATE COLUMN COMMIT CONFLICT CONSTRAINT CREATE CROSS
+    CURRENT CURRENT_DATE CURRENT_TIME CURRENT_TIMESTAMP DATABASE DEFAULT DEFERRABLE DEFERRED
+    DELETE DESC DETACH DISTINCT DO DROP EACH ELSE END ESCAPE EXCEPT EXCLUDE EXCLUSIVE EXISTS
+    EXPLAIN FAIL FILTER FIRST FOLLOWING FOR FOREIGN FROM FULL GENERATED GLOB GROUP GROUPS HAVING
+    IF IGNORE IMMEDIATE IN INDEX INDEXED INITIALLY INNER INSERT INSTEAD INTERSECT INTO IS ISNULL
+    JOIN KEY LAST LEFT LIKE LIMIT MATCH MATERIALIZED NATURAL NO NOT NOTHING NOTNULL NULL NULLS OF
+    OFFSET ON OR ORDER OTHERS OUTER OVER PARTITION PLAN PRAGMA PRECEDING PRIMARY QUERY RAISE RANGE
+    RECURSIVE REFERENCES REGEXP REINDEX RELEASE RENAME REPLACE RESTRICT RETURNING RIGHT ROLLBACK
+    ROW ROWS SAVEPOINT SELECT SET TABLE TEMP TEMPORARY THEN TIES TO TRANSACTION TRIGGER UNBOUNDED
+    UNION UNIQUE UPDATE USING VACUUM VALUES VIEW VIRTUAL WHEN WHERE WINDOW WITH WITHOUT
+""".split())
+
+
+
+def _encode_token(table_name: str, sort_fields: Sequence[str], descending: bool, key: Sequence) -> str:
+    """
+    ## Кодирует ключ последней записи страницы в токен продолжения.
+
+    Args:
+        table_name (str): Имя таблицы.
+        sort_fields (Sequence[str]): Поля сортировки.
+        descending (bool): Направление сортировки.
+        key (Sequence): Значения полей сортировки последней записи.
+
+    Returns:
+        str: Токен продолжения.
+    """
+    payload = dumps({'t': table_name, 's': list(sort_fields), 'd': descending, 'k': list(key)}, separators=(',', ':'))
+    return urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_token(token: str, table_name: str, sort_fields: Sequence[str], descending: bool) -> list:
+    """
+    ## Декодирует токен продолжения в ключ последней записи.
+
+    Args:
+        token (str): Токен продолжения.
+        table_name (str): Ожидаемое имя таблицы.
+        sort_fields (Sequence[str]): Ожидаемые поля сортировки.
+        descending (bool): Ожидаемое направление сортировки.
+
+    Returns:
+        list: Значения полей сортировки последней записи предыдущей страницы.
+
+    Raises:
+        ValueError: Если токен повреждён или выдан для другой таблицы или сортировки.
+    """
+    try:
+        payload = loads(urlsafe_b64decode(token.encode()))
+        key = payload['k']
+        matches = (
+            payload['t'] == table_name
+            and payload['s'] == list(sort_fields)
+            and payload['d'] == descending
+        )
+    except (ValueError, TypeError, KeyError) as ex:
+        raise ValueError('Некорректный токен продолжения') from ex
+    if not matches or len(key) != len(sort_fields):
+        raise ValueError('Токен продолжения выдан для другой таблицы или сортировки')
+    return key
+
+
+
+def _page_conditions(sort_field: Optional[str], descending: bool, key: Sequence) -> list[tuple[str, tuple]]:
+    """
+    ## Условия отбора записей, следующих за ключом страницы, в порядке их выдачи.
+
+    `SQLite` упорядочивает `NULL` раньше любых значений, а сравнение с `NULL`
+    ложно, поэтому записи с `NULL` в поле сортировки выбираются отдельным
+    условием: при сортировке по возрастанию они идут перед остальными, по
+    убыванию — после. Каждое условие обслуживается индексом `(поле, id)`.
+
+    Args:
+        sort_field (Optional[str]): Поле сортировки перед `id` или `None`.
+        descending (bool): Сортировка по убыванию.
+        key (Sequence): Ключ последней записи: значения `sort_field` (если задано) и `id`.
+
+    Returns:
+        list[tuple[str, tuple]]: Пары (условие `WHERE`, параметры).
+    """
+    operator = '<' if descending else '>'
+    if sort_field is None:
+        return [(f'{StaticFields.ID} {operator} ?', tuple(key))]
+    value, last_id = key
+    if value is None:
+        conditions = [(f'{sort_field} IS NULL AND {StaticFields.ID} {operator} ?', (last_id,))]
+        if not descending:
+            conditions.append((f'{sort_field} IS NOT NULL', ()))
+        return conditions
+    conditions = [(f'({sort_field}, {StaticFields.ID}) {operator} (?, ?)', (value, last_id))]
+    if descending:
+        conditions.append((f'{sort_field} IS NULL', ()))
+    return conditions
+
+
+def page_queries(
+    table_name: str,
+    sort_field: Optional[str] = None,
+    descending: bool = False,
+    key: Optional[Sequence] = None,
+) -> list[tuple[str, tuple]]:
+    """
+    ## Запросы страницы keyset-пагинации в порядке выдачи записей (без параметра `LIMIT`).
+
+    Args:
+        table_name (str): Имя таблицы.
+        sort_field (Optional[str]): Поле сортировки перед `id` или `None`. По умолчанию `None`.
+        descending (bool): Сортировка по убыванию. По умолчанию `False`.
+        key (Optional[Sequence]): Ключ последней записи предыдущей страницы, `None` — первая страница.
+
+    Returns:
+        list[tuple[str, tuple]]: Пары (`SQL`-запрос, параметры).
+    """
+    direction = 'DESC' if descending else 'ASC'
+    order_by = ', '.join(f'{field} {direction}' for field in (sort_field, StaticFields.ID) if field is not None)
+    if key is None:
+        return [(sql_registry.render(GET_FIRST_PAGE, table_name=table_name, order_by=order_by), ())]
+    return [
+        (
+            sql_registry.render(
+                GET_NEXT_PAGE,
+                    table_name=table_name,
+                    condition=condition,
+                    order_by=order_by,
+            ),
+            parameters,
+        )
+        for condition, parameters in _page_conditions(sort_field, descending, key)
+    ]
+
+
+def _row_count(result: Any) -> int:
+    """
+    ## Количество строк в результате `fetchall`/`fetchone`.
+    """
+    if isinstance(result, list):
+        return len(result)
+    return 0 if result is None else 1
+
+
+@lru_cache(maxsize=None)
+def _row_type(typename: str, fields: tuple[str, ...]) -> type[tuple]:
+    """
+    ## Возвращает тип компактной строки результата для набора полей.
+
+    Args:
+        typename (str): Имя типа.
+        fields (tuple[str, ...]): Поля строки.
+
+    Returns:
+        type[tuple]: Именованный кортеж с этими полями.
+    """
+    return namedtuple(typename, fields)
 
 
 
@@ -9,39 +202,480 @@ class BaseDAO(DataBase):
     """
     ## Базовый `Data Access Object` класс для работы с базой данных.
 
+    Не владеет собственным подключением: каждая операция берёт подключение
+    из общего пула на время выполнения и возвращает его обратно.
+
     Args:
         DataBase (DataBase): Базовый класс для работы с базой данных.
+
+    Attributes:
+        indexes (tuple[Index, ...]): Дополнительные (составные, частичные) индексы,
+            нужные запросам конкретного `DAO`. Создаются при первой выдаче подключения, если их ещё нет.
+        cache (Optional[LRUCache]): Кэш чтений по `id`, `None` — кэширование выключено.
     """
+    indexes: tuple[Index, ...] = ()
 
-    def __init__(self, db_name: str = 'raw_ipr') -> None:
+    def __init__(self, db_name: str = 'raw_ipr', cache: Optional[LRUCache] = None, **pool_options) -> None:
         """
         ## Инициализация базового `DAO`.
 
         Args:
             db_name (str): Имя базы данных. По умолчанию `'raw_ipr'`.
+            cache (Optional[LRUCache]): Кэш чтений по `id`. По умолчанию `None`.
+            **pool_options: Параметры пула подключений, см. `ConnectionPool`.
         """   
-        super().__init__(db_name)
+        super().__init__(db_name, **pool_options)
+        self.cache: Optional[LRUCache] = cache
+        if self.indexes and not self.pool.profile.query_only:
+            self._prepare(self.indexes, partial(self.create_indexes, self.indexes))
     
-    def get_all(self, sql: str) -> list[tuple]:
+    def enable_cache(self, maxsize: int = 1024, ttl: Optional[float] = None) -> LRUCache:
         """
-        ## Получение всех записей по `SQL`-запросу.
+        ## Включает кэш чтений по `id`.
 
         Args:
-            sql (str): `SQL`-запрос для получения данных.
+            maxsize (int): Максимальное количество записей. Defaults to 1024.
+            ttl (Optional[float]): Время жизни записи в секундах. Defaults to None.
+
+        Returns:
+            LRUCache: Новый кэш `DAO`.
+        """
+        self.cache = LRUCache(maxsize, ttl, name=self.table_name)
+        return self.cache
+
+    def disable_cache(self) -> None:
+        """
+        ## Выключает кэш чтений по `id`.
+        """
+        self.cache = None
+
+    def get_cached(self, id: int, load: Callable[[], Any]) -> Any:
+        """
+        ## Чтение записи через кэш.
+
+        Внутри открытой транзакции (например, `unit_of_work`) кэш не используется,
+        чтобы не сохранить незафиксированные данные. Вызывающий код получает
+        поверхностную копию значения: изменение полей модели не затрагивает кэш
+        и других получателей той же записи.
+
+        Args:
+            id (int): Идентификатор записи.
+            load (Callable[[], Any]): Чтение записи из базы данных при промахе.
 
         Returns:
-            list[tuple]: Список кортежей с данными.
+            Any: Копия значения из кэша или результат `load`.
+        """
+        cache = self.cache
+        if cache is None or self.pool.in_transaction():
+            return load()
+        key = (self.table_name, id)
+        value, epoch = cache.get(key)
+        if value is MISSING:
+            value = load()
+            cache.put(key, value, epoch)
+        return copy(value)
+
+    def invalidate_cached(self, ids: Iterable[int]) -> None:
+        """
+        ## Инвалидирует кэш для изменённых записей.
+
+        Запись удаляется сразу и повторно после возврата подключения в пул,
+        чтобы внутри `unit_of_work` в кэш не вернулось значение, прочитанное
+        другим потоком до фиксации транзакции.
+
+        Args:
+            ids (Iterable[int]): Идентификаторы изменённых записей.
         """
+        cache = self.cache
+        if cache is None:
+            return
+        keys = [(self.table_name, id) for id in ids]
+
+        def invalidate() -> None:
+            for key in keys:
+                cache.invalidate(key)
+
+        invalidate()
+        self.pool.call_on_release(invalidate)
+
+    def _source(self) -> str:
+        """
+        ## Метод `DAO`, из которого выполняется запрос (для инструментирования).
+
+        Returns:
+            str: Имя вида `'UserDAO.get_user'`.
+        """
+        frame = _getframe(2)
+        while frame is not None and (
+            frame.f_code.co_filename in _INTERNAL_FILES or frame.f_code.co_name.startswith('<')
+        ):
+            frame = frame.f_back
+        name = frame.f_code.co_name if frame is not None else '?'
+        return f'{type(self).__name__}.{name}'
+
+    def _execute(
+        self,
+        connection: Connection,
+        sql: str,
+        parameters: Any = (),
+        fetch: Callable[[Cursor], Any] = Cursor.fetchall,
+        row_factory: Optional[RowFactory] = None,
+        count: Callable[[Any], int] = _row_count,
+    ) -> Any:
+        """
+        ## Выполнение запроса с передачей замеров слушателям `instrumentation`.
+
+        Без слушателей запрос выполняется без замеров.
+
+        Args:
+            connection (Connection): Подключение.
+            sql (str): `SQL`-запрос.
+            parameters (Any): Параметры запроса. Defaults to ().
+            fetch (Callable[[Cursor], Any]): Чтение результата из курсора. Defaults to `Cursor.fetchall`.
+            row_factory (Optional[RowFactory]): Фабрика объектов строк. Defaults to None.
+            count (Callable[[Any], int]): Количество строк в результате `fetch`. Defaults to `_row_count`.
+
+        Returns:
+            Any: Результат `fetch`.
+        """
+        cursor = connection.cursor()
+        cursor.row_factory = row_factory
+        if not instrumentation.listeners:
+            cursor.execute(sql, parameters)
+            return fetch(cursor)
+        started = perf_counter()
         try:
-            cur = self.cursor.execute(sql)
-            data = cur.fetchall()
-            self.connection.commit()
-            return data
+            cursor.execute(sql, parameters)
+            result = fetch(cursor)
+        except Exception as ex:
+            instrumentation.emit(QueryEvent(sql, self._source(), perf_counter() - started, 0, ex))
+            raise
+        instrumentation.emit(QueryEvent(sql, self._source(), perf_counter() - started, count(result)))
+        return result
 
-        except (IntegrityError, Exception):
-            self.connection.rollback()
+    def _commit(self, connection: Connection) -> None:
+        """
+        ## Фиксация транзакции с передачей замеров слушателям `instrumentation` как запроса `COMMIT`.
+
+        Без открытой транзакции (например, после одного `SELECT`) фиксировать
+        нечего: `commit()` не вызывается и событие не создаётся.
+
+        Args:
+            connection (Connection): Подключение.
+        """
+        if not connection.in_transaction:
+            return
+        if not instrumentation.listeners:
+            connection.commit()
+            return
+        started = perf_counter()
+        try:
+            connection.commit()
+        except Exception as ex:
+            instrumentation.emit(QueryEvent('COMMIT', self._source(), perf_counter() - started, 0, ex))
             raise
+        instrumentation.emit(QueryEvent('COMMIT', self._source(), perf_counter() - started, 0))
+
+    @contextmanager
+    def _transaction(self) -> Iterator[Connection]:
+        """
+        ## Выполнение операции в транзакции.
+
+        Берёт подключение потока из пула и фиксирует изменения при успехе или
+        откатывает их при ошибке. Если на подключении уже открыта транзакция
+        (например, `unit_of_work`), фиксацией и откатом управляет её владелец.
+
+        Yields:
+            Connection: Подключение к базе данных.
+        """
+        with self.pool.connection() as connection:
+            if connection.in_transaction:
+                yield connection
+                return
+            try:
+                yield connection
+                self._commit(connection)
+
+            except (IntegrityError, Exception):
+                connection.rollback()
+                raise
+
+    def get_all(self, sql: str, row_factory: Optional[RowFactory] = None, parameters: tuple = ()) -> list:
+        """
+        ## Получение всех записей по `SQL`-запросу.
+
+        Args:
+            sql (str): `SQL`-запрос для получения данных.
+            row_factory (Optional[RowFactory]): Фабрика объектов строк вместо кортежей. Defaults to None.
+            parameters (tuple): Параметры для `SQL`-запроса. Defaults to ().
+
+        Returns:
+            list: Список кортежей (или объектов `row_factory`) с данными.
+        """
+        with self._transaction() as connection:
+            return self._execute(connection, sql, parameters, row_factory=row_factory)
     
+    def iter_all(
+        self,
+        sql: str,
+        parameters: tuple = (),
+        batch_size: int = DEFAULT_FETCH_SIZE,
+        row_factory: Optional[RowFactory] = None,
+    ) -> Iterator:
+        """
+        ## Потоковое получение записей по `SQL`-запросу.
+
+        Строки загружаются пакетами по `batch_size` через `fetchmany`.
+        Подключение удерживается до исчерпания или закрытия генератора,
+        поэтому генератор нужно потреблять в том же потоке, где он создан.
+        Время в событии `instrumentation` включает время обработки строк потребителем.
+
+        Args:
+            sql (str): `SQL`-запрос для получения данных.
+            parameters (tuple): Параметры для `SQL`-запроса. Defaults to ().
+            batch_size (int): Количество строк в одном пакете. Defaults to `DEFAULT_FETCH_SIZE`.
+            row_factory (Optional[RowFactory]): Фабрика объектов строк вместо кортежей. Defaults to None.
+
+        Yields:
+            tuple: Кортеж (или объект `row_factory`) с данными одной записи.
+        """
+        if batch_size < 1:
+            raise ValueError('Размер пакета должен быть положительным')
+        observed = bool(instrumentation.listeners)
+        if observed:
+            source = self._source()
+            started = perf_counter()
+        count = 0
+        error: Optional[BaseException] = None
+        with self.pool.connection() as connection:
+            cur = connection.cursor()
+            cur.row_factory = row_factory
+            try:
+                cur.execute(sql, parameters)
+                while rows := cur.fetchmany(batch_size):
+                    count += len(rows)
+                    yield from rows
+            except Exception as ex:
+                error = ex
+                raise
+            finally:
+                cur.close()
+                if observed:
+                    instrumentation.emit(QueryEvent(sql, source, perf_counter() - started, count, error))
+
+    def read_columns(
+        self,
+        sql: str,
+        typecodes: Sequence[str],
+        parameters: tuple = (),
+        batch_size: int = DEFAULT_FETCH_SIZE,
+    ) -> list[array]:
+        """
+        ## Потоковое чтение результата запроса по столбцам.
+
+        Строки читаются пакетами по `batch_size` и раскладываются в типизированные
+        буферы `array.array`, по одному на столбец, без создания объектов на каждую строку.
+        `NULL` в вещественных столбцах (`'d'`, `'f'`) заменяется на `nan`.
+
+        Args:
+            sql (str): `SQL`-запрос, возвращающий ровно `len(typecodes)` столбцов.
+            typecodes (Sequence[str]): Коды типов `array` для каждого столбца.
+            parameters (tuple): Параметры для `SQL`-запроса. Defaults to ().
+            batch_size (int): Количество строк в одном пакете. Defaults to `DEFAULT_FETCH_SIZE`.
+
+        Returns:
+            list[array]: Буферы столбцов в порядке `typecodes`.
+
+        Raises:
+            ValueError: Если в целочисленном столбце встретился `NULL` или нецелое значение.
+        """
+        columns = [array(typecode) for typecode in typecodes]
+        for rows in batched(self.iter_all(sql, parameters, batch_size=batch_size), batch_size):
+            for column, values in zip(columns, zip(*rows)):
+                try:
+                    column.fromlist(list(values))
+                except TypeError:
+                    if column.typecode not in 'fd':
+                        raise ValueError(f'NULL или нецелое значение в целочисленном столбце запроса: {sql}')
+                    column.fromlist([float('nan') if v is None else v for v in values])
+        return columns
+
+    def get_page(
+        self,
+        table_name: str,
+        limit: int,
+        token: Optional[str] = None,
+        sort_fields: Sequence[str] = (),
+        descending: bool = False,
+    ) -> tuple[list[tuple], Optional[str]]:
+        """
+        ## Получение страницы записей с keyset-пагинацией.
+
+        Записи упорядочиваются по полю `sort_fields` (не больше одного), к которому
+        всегда добавляется `id` для однозначности порядка. Следующая страница
+        выбирается условием `(поле, id) > (ключ последней записи)`, поэтому при
+        индексе `(поле, id)` стоимость запроса не зависит от глубины страницы.
+        Записи с `NULL` в поле сортировки идут первыми при сортировке по
+        возрастанию и последними по убыванию.
+
+        Args:
+            table_name (str): Имя таблицы.
+            limit (int): Максимальное количество записей на странице.
+            token (Optional[str]): Токен продолжения из предыдущей страницы. Defaults to None.
+            sort_fields (Sequence[str]): Поле сортировки перед `id` (не больше одного). Defaults to ().
+            descending (bool): Сортировка по убыванию. Defaults to False.
+
+        Returns:
+            tuple[list[tuple], Optional[str]]: Записи страницы и токен следующей страницы (`None` на последней).
+
+        Raises:
+            ValueError: Если `limit` не положительный, полей сортировки больше одного или токен некорректен.
+        """
+        if limit < 1:
+            raise ValueError('Размер страницы должен быть положительным')
+        sort_fields = [*(f for f in sort_fields if f != StaticFields.ID), StaticFields.ID]
+        if len(sort_fields) > 2:
+            raise ValueError('Keyset-пагинация поддерживает одно поле сортировки помимо id')
+        key = None if token is None else _decode_token(token, table_name, sort_fields, descending)
+        pages = page_queries(table_name, sort_fields[0] if len(sort_fields) > 1 else None, descending, key)
+
+        data: list[tuple] = []
+        columns: list[str] = []
+        with self.pool.connection() as connection:
+            for query, parameters in pages:
+                rows, columns = self._execute(
+                    connection, query, (*parameters, limit + 1 - len(data)),
+                    fetch=lambda cur: (cur.fetchall(), [column[0] for column in cur.description]),
+                    count=lambda result: len(result[0]),
+                )
+                data.extend(rows)
+                if len(data) > limit:
+                    break
+
+        if len(data) <= limit:
+            return data, None
+        data = data[:limit]
+        positions = [columns.index(field) for field in sort_fields]
+        next_token = _encode_token(table_name, sort_fields, descending, [data[-1][i] for i in positions])
+        return data, next_token
+
+    def find(self, query: Query) -> list[tuple]:
+        """
+        ## Получение записей по запросу построителя `Query`.
+
+        Args:
+            query (Query): Запрос.
+
+        Returns:
+            list[tuple]: Кортежи всех столбцов таблицы или, если задана проекция,
+                именованные кортежи `Row` с выбранными столбцами.
+        """
+        sql, parameters = query.compile()
+        if not query.projected:
+            return self.get_all(sql, parameters=parameters)
+        row_type = _row_type('Row', query.columns)
+        return self.get_all(sql, row_factory=lambda cursor, row: row_type._make(row), parameters=parameters)
+
+    def iter_find(self, query: Query, batch_size: int = DEFAULT_FETCH_SIZE) -> Iterator[tuple]:
+        """
+        ## Потоковое получение записей по запросу построителя `Query`, см. `find` и `iter_all`.
+
+        Args:
+            query (Query): Запрос.
+            batch_size (int): Количество строк в одном пакете. Defaults to `DEFAULT_FETCH_SIZE`.
+
+        Yields:
+            tuple: Кортеж всех столбцов или именованный кортеж `Row` с выбранными столбцами.
+        """
+        sql, parameters = query.compile()
+        row_factory = None
+        if query.projected:
+            row_type = _row_type('Row', query.columns)
+            row_factory = lambda cursor, row: row_type._make(row)
+        yield from self.iter_all(sql, parameters, batch_size=batch_size, row_factory=row_factory)
+
+    def aggregate(
+        self,
+        table_name: str,
+        aggregates: Mapping[str, tuple[AggregateFunc, str]],
+        group_by: Sequence[str] = (),
+        conditions: Sequence[str] = (),
+        parameters: tuple = (),
+        expressions: Optional[Mapping[str, str]] = None,
+    ) -> list[tuple]:
+        """
+        ## Агрегация записей на стороне `SQLite`.
+
+        Строит запрос `SELECT <группировка>, <агрегаты> ... GROUP BY <группировка>`,
+        упорядоченный по полям группировки. Текст запроса кэшируется в `sql_registry`
+        для каждого набора полей. Имена полей не экранируются и должны быть проверены вызывающим кодом.
+
+        Args:
+            table_name (str): Имя таблицы.
+            aggregates (Mapping[str, tuple[AggregateFunc, str]]): Имя результата -> (функция, поле);
+                поле `'*'` допустимо только для `count`.
+            group_by (Sequence[str]): Поля группировки. Defaults to ().
+            conditions (Sequence[str]): Условия `WHERE` с параметрами `?`, объединяемые через `AND`. Defaults to ().
+            parameters (tuple): Параметры условий. Defaults to ().
+            expressions (Optional[Mapping[str, str]]): `SQL`-выражения, по которым группируются
+                поля вместо их значений, например `{'order_date': 'date(order_date)'}`. Defaults to None.
+
+        Returns:
+            list[tuple]: Именованные кортежи `AggregateRow` с полями группировки и агрегатами.
+
+        Raises:
+            ValueError: Если не задан ни один агрегат, имя результата не является идентификатором,
+                начинается с `_`, совпадает с ключевым словом `Python` или `SQLite`, или функция неизвестна.
+        """
+        if not aggregates:
+            raise ValueError('Не задан ни один агрегат')
+        expressions = expressions or {}
+        keys = [expressions.get(field, field) for field in group_by]
+        columns = [key if key == field else f'{key} AS {field}' for key, field in zip(keys, group_by)]
+        for name, (func, field) in aggregates.items():
+            if (
+                not name.isidentifier() or name.startswith('_') or iskeyword(name)
+                or name.upper() in _SQLITE_KEYWORDS or name in group_by
+            ):
+                raise ValueError(f'Некорректное имя агрегата: {name}')
+            if func not in ('count', 'sum', 'avg', 'min', 'max') or (field == '*' and func != 'count'):
+                raise ValueError(f'Некорректный агрегат: {func}({field})')
+            columns.append(f'{func.upper()}({field}) AS {name}')
+
+        fields = ', '.join(keys)
+        query = sql_registry.render(
+            AGGREGATE,
+                table_name=table_name,
+                columns=', '.join(columns),
+                where=f'WHERE {" AND ".join(conditions)}' if conditions else '',
+                group_by=f'GROUP BY {fields} ORDER BY {fields}' if group_by else '',
+        )
+        row_type = _row_type('AggregateRow', (*group_by, *aggregates))
+        return self.get_all(query, row_factory=lambda cursor, row: row_type._make(row), parameters=parameters)
+
+    def submit_write(
+        self,
+        sql: str,
+        parameters: tuple = (),
+        mapper: Optional[Callable[[tuple], Any]] = None,
+    ) -> Future:
+        """
+        ## Отложенная запись через общий поток записи базы данных.
+
+        Операция выполняется потоком `GroupCommitWriter` вместе с другими
+        операциями в одной транзакции, что резко снижает число синхронизаций
+        с диском при большом количестве параллельных вставок.
+
+        Args:
+            sql (str): `SQL`-запрос на изменение данных.
+            parameters (tuple): Параметры для `SQL`-запроса. Defaults to ().
+            mapper (Optional[Callable[[tuple], Any]]): Преобразование строки `RETURNING *`. Defaults to None.
+
+        Returns:
+            Future: Результат операции после фиксации транзакции.
+        """
+        return get_writer(self.pool).submit(sql, parameters, mapper)
+
     def insert_one(self, sql: str, parameters: tuple = ()) -> tuple:
         """
         ## Вставка одной записи в базу данных.
@@ -53,15 +687,8 @@ class BaseDAO(DataBase):
         Returns:
             tuple: Кортеж с данными вставленной записи.
         """ 
-        try:
-            cur = self.cursor.execute(sql, parameters)
-            data = cur.fetchone()
-            self.connection.commit()
-            return data
-
-        except (IntegrityError, Exception):
-            self.connection.rollback()
-            raise
+        with self._transaction() as connection:
+            return self._execute(connection, sql, parameters, fetch=Cursor.fetchone)
         
     def update_one(self, sql: str, parameters: tuple = ()) -> tuple:
         """
@@ -74,16 +701,69 @@ class BaseDAO(DataBase):
         Returns:
             tuple: Кортеж с обновленными данными.
         """       
-        try:
-            cur = self.cursor.execute(sql, parameters)
-            data = cur.fetchone()
-            self.connection.commit()
-            return data
-
-        except (IntegrityError, Exception):
-            self.connection.rollback()
-            raise
+        with self._transaction() as connection:
+            return self._execute(connection, sql, parameters, fetch=Cursor.fetchone)
         
+    def update_fields(self, table_name: str, id: int, values: Mapping[str, Any]) -> Optional[tuple]:
+        """
+        ## Частичное обновление записи.
+
+        Запрос `SET a = ?, b = ?, updated_at = CURRENT_TIMESTAMP` строится
+        только из переданных полей, его текст кэшируется для каждого набора полей.
+        Без полей запись не изменяется и просто читается.
+
+        Args:
+            table_name (str): Имя таблицы.
+            id (int): Идентификатор записи.
+            values (Mapping[str, Any]): Новые значения полей. Имена полей не экранируются.
+
+        Returns:
+            Optional[tuple]: Обновлённая запись или `None`, если записи нет.
+        """
+        if not values:
+            query = sql_registry.render(GET_ONE, table_name=table_name, main_field=StaticFields.ID)
+            return self.get_one(query, (id,))
+        query = sql_registry.render(
+            UPDATE_FIELDS,
+                table_name=table_name,
+                assignments=', '.join(f'{field} = ?' for field in values),
+                updated_at=StaticFields.UPDATED_AT,
+                main_field=StaticFields.ID,
+        )
+        return self.update_one(query, (*values.values(), id))
+
+    def update_fields_by_ids(
+        self,
+        table_name: str,
+        ids: Iterable[int],
+        values: Mapping[str, Any],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[tuple]:
+        """
+        ## Частичное обновление нескольких записей одинаковыми значениями.
+
+        Записи обновляются запросами `UPDATE ... WHERE id IN (...)`, по одному
+        на пакет идентификаторов, в одной транзакции, см. `execute_by_ids`.
+
+        Args:
+            table_name (str): Имя таблицы.
+            ids (Iterable[int]): Идентификаторы записей.
+            values (Mapping[str, Any]): Новые значения полей. Имена полей не экранируются.
+            batch_size (int): Максимальное количество идентификаторов в одном запросе. Defaults to `DEFAULT_BATCH_SIZE`.
+
+        Returns:
+            list[tuple]: Обновлённые записи.
+        """
+        if not values:
+            raise ValueError('Не задано ни одно поле для обновления')
+        return self.execute_by_ids(
+            UPDATE_FIELDS_BY_IDS, list(dict.fromkeys(ids)), batch_size, tuple(values.values()),
+                table_name=table_name,
+                assignments=', '.join(f'{field} = ?' for field in values),
+                updated_at=StaticFields.UPDATED_AT,
+                main_field=StaticFields.ID,
+        )
+
     def get_one(self, sql: str, parameters: tuple = ()) -> tuple:
         """
         ## Получение одной записи по `SQL`-запросу.
@@ -95,15 +775,74 @@ class BaseDAO(DataBase):
         Returns:
             tuple: Кортеж с данными одной записи.
         """
-        try:
-            cur = self.cursor.execute(sql, parameters)
-            data = cur.fetchone()
-            self.connection.commit()
-            return data
-        
-        except Exception as ex:
-            raise ex
+        with self._transaction() as connection:
+            return self._execute(connection, sql, parameters, fetch=Cursor.fetchone)
     
+    def execute_by_ids(
+        self,
+        template: str,
+        ids: Sequence[int],
+        batch_size: int = DEFAULT_FETCH_SIZE,
+        parameters: tuple = (),
+        **fields: str,
+    ) -> list[tuple]:
+        """
+        ## Выполнение запроса для списка идентификаторов пакетами `IN (...)`.
+
+        Идентификаторы разбиваются на пакеты размером не больше `batch_size`
+        и лимита `SQLite` на число параметров запроса. Неполный пакет дополняется
+        повтором последнего идентификатора до степени двойки, чтобы число различных
+        текстов запроса в кэше подготовленных выражений оставалось небольшим.
+        Все пакеты выполняются на одном подключении в одной транзакции.
+
+        Args:
+            template (str): Шаблон запроса с полем `{placeholders}` внутри `IN (...)`.
+            ids (Sequence[int]): Идентификаторы.
+            batch_size (int): Максимальное количество идентификаторов в одном запросе. Defaults to `DEFAULT_FETCH_SIZE`.
+            parameters (tuple): Параметры запроса, предшествующие списку `IN`. Defaults to ().
+            **fields (str): Остальные поля шаблона.
+
+        Returns:
+            list[tuple]: Строки результатов всех пакетов в порядке выполнения.
+        """
+        if batch_size < 1:
+            raise ValueError('Размер пакета должен быть положительным')
+        rows: list[tuple] = []
+        with self._transaction() as connection:
+            size = min(batch_size, connection.getlimit(SQLITE_LIMIT_VARIABLE_NUMBER) - len(parameters))
+            for chunk in batched(ids, size):
+                width = min(size, 1 << (len(chunk) - 1).bit_length())
+                query = sql_registry.render(template, placeholders=', '.join('?' * width), **fields)
+                rows.extend(self._execute(connection, query, (*parameters, *chunk, *chunk[-1:] * (width - len(chunk)))))
+        return rows
+
+    def get_by_ids(
+        self,
+        table_name: str,
+        ids: Iterable[int],
+        batch_size: int = DEFAULT_FETCH_SIZE,
+    ) -> tuple[list[tuple], list[int]]:
+        """
+        ## Пакетное получение записей по списку идентификаторов.
+
+        Args:
+            table_name (str): Имя таблицы.
+            ids (Iterable[int]): Идентификаторы записей.
+            batch_size (int): Максимальное количество идентификаторов в одном запросе. Defaults to `DEFAULT_FETCH_SIZE`.
+
+        Returns:
+            tuple[list[tuple], list[int]]: Найденные записи в порядке первого вхождения
+                идентификаторов и идентификаторы, для которых записи не найдены.
+        """
+        ids = list(dict.fromkeys(ids))
+        rows = self.execute_by_ids(
+            GET_BY_IDS, ids, batch_size,
+                table_name=table_name,
+                main_field=StaticFields.ID,
+        )
+        found = {row[0]: row for row in rows}
+        return [found[id] for id in ids if id in found], [id for id in ids if id not in found]
+
     def delete_one(self, sql: str, parameters: tuple = ()) -> tuple:
         """
         ## Удаление одной записи из базы данных.
@@ -115,81 +854,124 @@ class BaseDAO(DataBase):
         Returns:
             tuple: Кортеж с данными удаленной записи.
         """     
-        try:
-            cur = self.cursor.execute(sql, parameters)
-            data = cur.fetchone()
-            self.connection.commit()
-            return data
+        with self._transaction() as connection:
+            return self._execute(connection, sql, parameters, fetch=Cursor.fetchone)
+    
+    def _execute_many(self, sql: str, parameters: Iterable[tuple], batch_size: int, returning: bool) -> list[tuple]:
+        """
+        ## Пакетное выполнение `SQL`-запроса.
+
+        Параметры разбиваются на пакеты по `batch_size` записей, каждый пакет
+        выполняется в отдельной транзакции с одной фиксацией (внутри `unit_of_work` —
+        в его общей транзакции).
+
+        Args:
+            sql (str): `SQL`-запрос.
+            parameters (Iterable[tuple]): Наборы параметров, по одному на запись.
+            batch_size (int): Количество записей в одной транзакции.
+            returning (bool): Собирать ли строки, возвращаемые `RETURNING *`.
 
-        except (IntegrityError, Exception):
-            self.connection.rollback()
+        Returns:
+            list[tuple]: Возвращённые строки или пустой список, если `returning=False`.
+        """
+        if batch_size < 1:
+            raise ValueError('Размер пакета должен быть положительным')
+        data: list[tuple] = []
+        with self.pool.connection():
+            for chunk in batched(parameters, batch_size):
+                with self._transaction() as connection:
+                    if returning:
+                        for params in chunk:
+                            data.extend(self._execute(connection, sql, params))
+                    else:
+                        self._execute_batch(connection, sql, chunk)
+        return data
+
+    def _execute_batch(self, connection: Connection, sql: str, chunk: Sequence[tuple]) -> None:
+        """
+        ## Выполнение `executemany` для пакета с передачей замеров слушателям `instrumentation`.
+
+        Args:
+            connection (Connection): Подключение.
+            sql (str): `SQL`-запрос.
+            chunk (Sequence[tuple]): Наборы параметров пакета.
+        """
+        if not instrumentation.listeners:
+            connection.executemany(sql, chunk)
+            return
+        started = perf_counter()
+        try:
+            cursor = connection.executemany(sql, chunk)
+        except Exception as ex:
+            instrumentation.emit(QueryEvent(sql, self._source(), perf_counter() - started, 0, ex))
             raise
-    
-    def insert_many(self, sql: str, parameters: tuple = (), size: Optional[int] = 1) -> list[tuple]:
+        instrumentation.emit(QueryEvent(sql, self._source(), perf_counter() - started, cursor.rowcount))
+
+    def insert_many(
+        self,
+        sql: str,
+        parameters: Iterable[tuple] = (),
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        returning: bool = False,
+    ) -> list[tuple]:
         """
         ## Вставка нескольких записей в базу данных.
 
+        Без `returning` пакет выполняется через `executemany`.
+        При ошибке откатывается только текущий пакет, ранее зафиксированные остаются в базе.
+
         Args:
             sql (str): `SQL`-запрос для вставки данных.
-            parameters (tuple): Параметры для `SQL`-запроса. Defaults to ().
-            size (Optional[int]): Количество записей для вставки. Defaults to 1.
+            parameters (Iterable[tuple]): Наборы параметров, по одному на запись. Defaults to ().
+            batch_size (int): Количество записей в одной транзакции. Defaults to `DEFAULT_BATCH_SIZE`.
+            returning (bool): Возвращать ли строки из `RETURNING *`. Defaults to False.
 
         Returns:
             List[tuple]: Список кортежей с данными вставленных записей.
         """
-        try:
-            cur = self.cursor.execute(sql, parameters)
-            data = cur.fetchmany(size)
-            self.connection.commit()
-            return data
-
-        except (IntegrityError, Exception):
-            self.connection.rollback()
-            raise
+        return self._execute_many(sql, parameters, batch_size, returning)
     
-    def update_many(self, sql: str, parameters: tuple = (), size: Optional[int] = 1) -> list[tuple]:
+    def update_many(
+        self,
+        sql: str,
+        parameters: Iterable[tuple] = (),
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        returning: bool = False,
+    ) -> list[tuple]:
         """
         ## Обновление нескольких записей в базе данных.
 
         Args:
             sql (str): `SQL`-запрос для обновления данных.
-            parameters (tuple): Параметры для `SQL`-запроса. Defaults to ().
-            size (Optional[int]): Количество записей для обновления. Defaults to 1.
+            parameters (Iterable[tuple]): Наборы параметров, по одному на запись. Defaults to ().
+            batch_size (int): Количество записей в одной транзакции. Defaults to `DEFAULT_BATCH_SIZE`.
+            returning (bool): Возвращать ли строки из `RETURNING *`. Defaults to False.
 
         Returns:
             List[tuple]: Список кортежей с обновленными данными.
         """
-        try:
-            cur = self.cursor.execute(sql, parameters)
-            data = cur.fetchmany(size)
-            self.connection.commit()
-            return data
-
-        except (IntegrityError, Exception):
-            self.connection.rollback()
-            raise
+        return self._execute_many(sql, parameters, batch_size, returning)
     
-    def delete_many(self, sql: str, parameters: tuple = (), size: Optional[int] = 1) -> list[tuple]:
+    def delete_many(
+        self,
+        sql: str,
+        parameters: Iterable[tuple] = (),
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        returning: bool = False,
+    ) -> list[tuple]:
         """
         ## Удаление нескольких записей из базы данных.
 
         Args:
             sql (str): `SQL`-запрос для удаления данных.
-            parameters (tuple): Параметры для `SQL`-запроса. Defaults to ().
-            size (Optional[int]): Количество записей для удаления. Defaults to 1.
+            parameters (Iterable[tuple]): Наборы параметров, по одному на запись. Defaults to ().
+            batch_size (int): Количество записей в одной транзакции. Defaults to `DEFAULT_BATCH_SIZE`.
+            returning (bool): Возвращать ли строки из `RETURNING *`. Defaults to False.
 
         Returns:
             List[tuple]: Список кортежей с данными удаленных записей.
         """
-        try:
-            cur = self.cursor.execute(sql, parameters)
-            data = cur.fetchmany(size)
-            self.connection.commit()
-            return data
-
-        except (IntegrityError, Exception):
-            self.connection.rollback()
-            raise
+        return self._execute_many(sql, parameters, batch_size, returning)
 
 
 
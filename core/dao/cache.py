@@ -0,0 +1,188 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Hashable, Optional
+from weakref import WeakSet
+
+
+# Признак отсутствия значения в кэше
+MISSING = object()
+
+
+
+class LRUCache:
+    """
+    ## Потокобезопасный `LRU`-кэш с необязательным временем жизни записей.
+
+    Ключи имеют вид `(имя таблицы, id)`. Чтобы чтение, начатое до изменения
+    записи, не положило в кэш устаревшее значение, промах возвращает номер
+    эпохи кэша, а `put` принимает значение только если с тех пор не было
+    ни одной инвалидации.
+
+    Attributes:
+        maxsize (int): Максимальное количество записей.
+        ttl (Optional[float]): Время жизни записи (в секундах), `None` — без ограничения.
+        name (str): Имя кэша в метриках.
+        hits (int): Количество попаданий.
+        misses (int): Количество промахов.
+    """
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None, name: str = 'default') -> None:
+        """
+        ## Инициализация кэша.
+
+        Args:
+            maxsize (int): Максимальное количество записей. По умолчанию `1024`.
+            ttl (Optional[float]): Время жизни записи в секундах. По умолчанию `None`.
+            name (str): Имя кэша в метриках. По умолчанию `'default'`.
+        """
+        if maxsize < 1:
+            raise ValueError('Размер кэша должен быть положительным')
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[Any, Optional[float]]] = OrderedDict()
+        self._epoch = 0
+        self._lock = Lock()
+        _caches.add(self)
+
+    def get(self, key: Hashable) -> tuple[Any, int]:
+        """
+        ## Получение значения из кэша.
+
+        Args:
+            key (Hashable): Ключ записи.
+
+        Returns:
+            tuple[Any, int]: Значение (или `MISSING`) и номер эпохи для последующего `put`.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value, self._epoch
+                del self._data[key]
+            self.misses += 1
+            return MISSING, self._epoch
+
+    def put(self, key: Hashable, value: Any, epoch: int) -> None:
+        """
+        ## Сохранение значения, прочитанного из базы данных.
+
+        Args:
+            key (Hashable): Ключ записи.
+            value (Any): Значение.
+            epoch (int): Номер эпохи, полученный из `get` до чтения из базы.
+        """
+        expires_at = monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if epoch != self._epoch:
+                return
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        ## Удаление записи из кэша после её изменения.
+
+        Args:
+            key (Hashable): Ключ записи.
+        """
+        with self._lock:
+            self._epoch += 1
+            self._data.pop(key, None)
+
+    def invalidate_where(self, table_name: str, predicate: Callable[[Any], bool]) -> None:
+        """
+        ## Удаление записей таблицы, удовлетворяющих условию.
+
+        Args:
+            table_name (str): Имя таблицы.
+            predicate (Callable[[Any], bool]): Условие для закэшированного значения.
+        """
+        with self._lock:
+            self._epoch += 1
+            stale = [k for k, (v, _) in self._data.items() if k[0] == table_name and predicate(v)]
+            for key in stale:
+                del self._data[key]
+
+    def holds(self, table_name: str) -> bool:
+        """
+        ## Есть ли в кэше записи таблицы.
+
+        Args:
+            table_name (str): Имя таблицы.
+
+        Returns:
+            bool: `True`, если хотя бы одна запись таблицы закэширована.
+        """
+        with self._lock:
+            return any(key[0] == table_name for key in self._data)
+
+    def clear(self) -> None:
+        """
+        ## Очистка кэша и счётчиков.
+        """
+        with self._lock:
+            self._epoch += 1
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        ## Доля попаданий среди всех обращений.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+
+_caches: WeakSet[LRUCache] = WeakSet()
+
+
+def get_caches() -> list[LRUCache]:
+    """
+    ## Возвращает все существующие кэши.
+
+    Returns:
+        list[LRUCache]: Кэши.
+    """
+    return list(_caches)
+
+
+def is_cached(table_name: str) -> bool:
+    """
+    ## Есть ли записи таблицы хотя бы в одном кэше.
+
+    Args:
+        table_name (str): Имя таблицы.
+
+    Returns:
+        bool: `True`, если хотя бы одна запись таблицы закэширована.
+    """
+    return any(cache.holds(table_name) for cache in list(_caches))
+
+
+def invalidate_cascade(table_name: str, predicate: Callable[[Any], bool]) -> None:
+    """
+    ## Инвалидирует записи таблицы во всех кэшах.
+
+    Используется для строк, удалённых каскадно (`ON DELETE CASCADE`),
+    о которых `DAO` дочерней таблицы не знает.
+
+    Args:
+        table_name (str): Имя дочерней таблицы.
+        predicate (Callable[[Any], bool]): Условие для закэшированного значения.
+    """
+    for cache in list(_caches):
+        cache.invalidate_where(table_name, predicate)
@@ -0,0 +1,221 @@
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from logging import Logger
+from threading import Lock
+from typing import Callable, NamedTuple, Optional
+
+from core.modules.app_logger import app_logger
+
+
+# Верхние границы корзин гистограммы задержек (в секундах)
+LATENCY_BUCKETS: tuple[float, ...] = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, float('inf'))
+# Верхние границы корзин гистограммы количества строк
+ROW_BUCKETS: tuple[float, ...] = (0, 1, 10, 100, 1000, 10000, 100000, float('inf'))
+
+
+
+class QueryEvent(NamedTuple):
+    """
+    ## Сведения о выполненном `SQL`-запросе.
+
+    Attributes:
+        sql (str): Текст запроса.
+        source (str): Метод `DAO`, выполнивший запрос (`'UserDAO.get_user'`).
+        elapsed (float): Время выполнения вместе с чтением строк (в секундах).
+        rows (int): Количество прочитанных или изменённых строк.
+        error (Optional[BaseException]): Исключение, если запрос завершился ошибкой.
+    """
+    sql: str
+    source: str
+    elapsed: float
+    rows: int
+    error: Optional[BaseException] = None
+
+
+# Слушатель событий запросов
+QueryListener = Callable[[QueryEvent], None]
+
+
+
+class Instrumentation:
+    """
+    ## Точка подключения слушателей выполнения запросов.
+
+    `DAO` проверяет `listeners` перед каждым запросом и без слушателей
+    не замеряет время и не создаёт событий, поэтому выключенные замеры
+    почти ничего не стоят. Слушатели вызываются синхронно в потоке запроса,
+    их ошибки записываются в журнал и не прерывают запрос.
+
+    Attributes:
+        listeners (tuple[QueryListener, ...]): Подключённые слушатели.
+    """
+    def __init__(self) -> None:
+        self.listeners: tuple[QueryListener, ...] = ()
+        self._lock = Lock()
+
+    def add_listener(self, listener: QueryListener) -> QueryListener:
+        """
+        ## Подключает слушателя.
+
+        Args:
+            listener (QueryListener): Слушатель.
+
+        Returns:
+            QueryListener: Этот же слушатель, чтобы его можно было отключить.
+        """
+        with self._lock:
+            self.listeners = (*self.listeners, listener)
+        return listener
+
+    def remove_listener(self, listener: QueryListener) -> None:
+        """
+        ## Отключает слушателя.
+
+        Args:
+            listener (QueryListener): Слушатель.
+        """
+        with self._lock:
+            self.listeners = tuple(l for l in self.listeners if l is not listener)
+
+    def emit(self, event: QueryEvent) -> None:
+        """
+        ## Передаёт событие всем слушателям.
+
+        Args:
+            event (QueryEvent): Событие запроса.
+        """
+        for listener in self.listeners:
+            try:
+                listener(event)
+            except Exception as ex:
+                app_logger.exception('Ошибка слушателя запросов', exc_info=ex)
+
+
+
+class SlowQueryLogger:
+    """
+    ## Журнал медленных запросов.
+
+    Attributes:
+        threshold (float): Порог времени выполнения (в секундах).
+        logger (Logger): Журнал.
+    """
+    def __init__(self, threshold: float = 0.1, logger: Logger = app_logger) -> None:
+        """
+        ## Инициализация журнала медленных запросов.
+
+        Args:
+            threshold (float): Порог времени выполнения в секундах. По умолчанию `0.1`.
+            logger (Logger): Журнал. По умолчанию `app_logger`.
+        """
+        self.threshold = threshold
+        self.logger = logger
+
+    def __call__(self, event: QueryEvent) -> None:
+        if event.elapsed < self.threshold:
+            return
+        self.logger.warning(
+            'Медленный запрос: %.1f мс, строк: %d, источник: %s%s\n%s',
+            event.elapsed * 1000,
+            event.rows,
+            event.source,
+            f', ошибка: {event.error!r}' if event.error is not None else '',
+            ' '.join(event.sql.split()),
+        )
+
+
+
+@dataclass(slots=True)
+class ShapeStats:
+    """
+    ## Статистика запросов одной формы.
+
+    Attributes:
+        count (int): Количество выполнений.
+        errors (int): Количество ошибок.
+        total_time (float): Суммарное время (в секундах).
+        max_time (float): Максимальное время (в секундах).
+        total_rows (int): Суммарное количество строк.
+        latency (list[int]): Количество выполнений по корзинам `LATENCY_BUCKETS`.
+        rows (list[int]): Количество выполнений по корзинам `ROW_BUCKETS`.
+        sources (set[str]): Методы `DAO`, выполнявшие запрос.
+    """
+    count: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    total_rows: int = 0
+    latency: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+    rows: list[int] = field(default_factory=lambda: [0] * len(ROW_BUCKETS))
+    sources: set[str] = field(default_factory=set)
+
+
+
+class QueryHistogram:
+    """
+    ## Гистограммы задержек и количества строк по формам запросов.
+
+    Формой считается текст запроса с нормализованными пробелами: значения
+    передаются параметрами, поэтому текст не зависит от них. Фиксации
+    транзакций с изменениями учитываются отдельной формой `COMMIT`.
+    """
+    def __init__(self) -> None:
+        self._stats: dict[str, ShapeStats] = {}
+        self._shapes: dict[str, str] = {}
+        self._lock = Lock()
+
+    def __call__(self, event: QueryEvent) -> None:
+        shape = self._shapes.get(event.sql)
+        if shape is None:
+            shape = self._shapes[event.sql] = ' '.join(event.sql.split())
+        with self._lock:
+            stats = self._stats.get(shape)
+            if stats is None:
+                stats = self._stats[shape] = ShapeStats()
+            stats.count += 1
+            stats.errors += event.error is not None
+            stats.total_time += event.elapsed
+            stats.max_time = max(stats.max_time, event.elapsed)
+            stats.total_rows += event.rows
+            stats.latency[bisect_left(LATENCY_BUCKETS, event.elapsed)] += 1
+            stats.rows[bisect_left(ROW_BUCKETS, event.rows)] += 1
+            stats.sources.add(event.source)
+
+    def snapshot(self) -> dict[str, ShapeStats]:
+        """
+        ## Копия накопленной статистики.
+
+        Returns:
+            dict[str, ShapeStats]: Форма запроса -> статистика.
+        """
+        with self._lock:
+            return {
+                shape: ShapeStats(
+                    s.count, s.errors, s.total_time, s.max_time, s.total_rows,
+                    list(s.latency), list(s.rows), set(s.sources),
+                )
+                for shape, s in self._stats.items()
+            }
+
+    def top(self, limit: int = 10) -> list[tuple[str, ShapeStats]]:
+        """
+        ## Формы запросов с наибольшим суммарным временем.
+
+        Args:
+            limit (int): Количество форм. По умолчанию `10`.
+
+        Returns:
+            list[tuple[str, ShapeStats]]: Формы и их статистика по убыванию суммарного времени.
+        """
+        return sorted(self.snapshot().items(), key=lambda item: item[1].total_time, reverse=True)[:limit]
+
+    def reset(self) -> None:
+        """
+        ## Сбрасывает статистику.
+        """
+        with self._lock:
+            self._stats.clear()
+
+
+
+instrumentation = Instrumentation()
@@ -0,0 +1,136 @@
+from datetime import date, datetime
+from types import UnionType
+from typing import Any, Callable, Generic, Iterable, Optional, Sequence, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+
+M = TypeVar('M', bound=BaseModel)
+
+
+def _to_date(value: Any) -> date:
+    """
+    ## Приводит значение столбца `DATE`/`TIMESTAMP` к `date`.
+
+    `sqlite3` хранит даты строками `YYYY-MM-DD`, а значения по умолчанию
+    `CURRENT_TIMESTAMP` — строками `YYYY-MM-DD HH:MM:SS`.
+    """
+    if isinstance(value, str):
+        return date.fromisoformat(value) if len(value) == 10 else datetime.fromisoformat(value).date()
+    return value
+
+
+def _to_datetime(value: Any) -> datetime:
+    """
+    ## Приводит значение столбца `TIMESTAMP` к `datetime`.
+    """
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+# Преобразования значений `SQLite` к типам полей моделей.
+# Типы, которые `sqlite3` возвращает как есть (`int`, `str`), не преобразуются.
+_CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    bool: bool,
+    float: float,
+    date: _to_date,
+    datetime: _to_datetime,
+}
+
+
+def _converter_for(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """
+    ## Подбирает преобразование для аннотации поля модели.
+
+    Args:
+        annotation (Any): Аннотация поля, в том числе `Optional[...]`.
+
+    Returns:
+        Optional[Callable[[Any], Any]]: Функция преобразования или `None`, если оно не нужно.
+    """
+    if get_origin(annotation) in (Union, UnionType):
+        annotation = next((a for a in get_args(annotation) if a is not type(None)), annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return None
+    for kind, converter in _CONVERTERS.items():
+        if annotation is kind:
+            return converter
+    if isinstance(annotation, type) and not issubclass(annotation, (int, str)):
+        return annotation
+    return None
+
+
+
+class RowMapper(Generic[M]):
+    """
+    ## Преобразование строк `SQLite` в модели `Pydantic`.
+
+    План преобразования (позиция столбца, имя поля, функция приведения типа)
+    вычисляется один раз при создании. В доверенном режиме (`trusted=True`)
+    модели собираются через `model_construct` без валидации — строки приходят
+    из нашей собственной схемы, поэтому достаточно привести типы `SQLite`.
+    В строгом режиме каждая строка проходит полную валидацию `Pydantic`.
+
+    Если строка покрывает все поля модели, экземпляр собирается напрямую,
+    минуя `model_construct` с его обработкой значений по умолчанию.
+
+    Attributes:
+        model (type[M]): Класс модели.
+        columns (tuple[str, ...]): Столбцы таблицы в порядке `SELECT *`.
+        trusted (bool): Собирать модели без валидации.
+    """
+    def __init__(self, model: type[M], columns: Sequence[str], trusted: bool = True) -> None:
+        """
+        ## Инициализация преобразователя.
+
+        Args:
+            model (type[M]): Класс модели.
+            columns (Sequence[str]): Столбцы таблицы в порядке `SELECT *`.
+            trusted (bool): Собирать модели без валидации. По умолчанию `True`.
+        """
+        self.model = model
+        self.columns = tuple(columns)
+        self.trusted = trusted
+        self._plan: tuple[tuple[int, str, Optional[Callable[[Any], Any]]], ...] = tuple(
+            (position, column, _converter_for(model.model_fields[column].annotation))
+            for position, column in enumerate(self.columns)
+            if column in model.model_fields
+        )
+        self._fields_set = frozenset(column for _, column, _ in self._plan)
+        self._direct = self._fields_set == set(model.model_fields) and not model.__private_attributes__
+
+    def __call__(self, row: Sequence) -> M:
+        """
+        ## Преобразует одну строку в модель.
+
+        Args:
+            row (Sequence): Строка результата запроса.
+
+        Returns:
+            M: Модель с данными строки.
+        """
+        if not self.trusted:
+            return self.model(**{column: row[position] for position, column, _ in self._plan})
+        values = {}
+        for position, column, converter in self._plan:
+            value = row[position]
+            values[column] = value if converter is None or value is None else converter(value)
+        if not self._direct:
+            return self.model.model_construct(**values)
+        instance = self.model.__new__(self.model)
+        object.__setattr__(instance, '__dict__', values)
+        object.__setattr__(instance, '__pydantic_fields_set__', set(self._fields_set))
+        object.__setattr__(instance, '__pydantic_extra__', None)
+        object.__setattr__(instance, '__pydantic_private__', None)
+        return instance
+
+    def many(self, rows: Iterable[Sequence]) -> list[M]:
+        """
+        ## Преобразует набор строк в список моделей.
+
+        Args:
+            rows (Iterable[Sequence]): Строки результата запроса.
+
+        Returns:
+            list[M]: Список моделей.
+        """
+        return [self(row) for row in rows]
@@ -0,0 +1,319 @@
+import os
+import re
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from sqlite3 import IntegrityError
+from tempfile import NamedTemporaryFile
+from threading import Lock, Thread
+from typing import Callable, Iterable, Optional
+
+from core.db.pool import get_pools
+
+from .cache import get_caches
+from .instrumentation import instrumentation, QueryEvent
+
+
+# Тип содержимого текстового формата `Prometheus`
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Операция и таблица запроса: первое слово и имя сразу после `UPDATE`
+# или после первого `FROM`/`INTO` (`SELECT`, `INSERT INTO`, `DELETE FROM`)
+_STATEMENT = re.compile(
+    r'\s*(?:(UPDATE)\s+(\w+)|(\w+)(?:.*?\b(?:FROM|INTO)\s+(\w+))?)',
+    re.IGNORECASE | re.DOTALL,
+)
+# Операции, изменяющие строки
+_WRITES = frozenset(('INSERT', 'UPDATE', 'DELETE', 'REPLACE'))
+
+# Метки метрики: пары (имя, значение)
+Labels = tuple[tuple[str, str], ...]
+# Образцы метрики: метки -> значение
+Samples = dict[Labels, float]
+# Сборщик метрик, вычисляемых при выгрузке: (имя, тип, описание, образцы)
+Collector = Callable[[], Iterable[tuple[str, str, str, Samples]]]
+
+
+
+class MetricsRegistry:
+    """
+    ## Реестр метрик процесса в текстовом формате `Prometheus`.
+
+    Счётчики накапливаются слушателем `instrumentation` по событиям `DAO`:
+    запросы по таблицам и операциям, ошибки (`integrity` — нарушения ограничений,
+    `other` — прочие), прочитанные и изменённые строки, фиксации транзакций и
+    время выполнения. Состояние пулов подключений и кэшей собирается в момент
+    выгрузки, поэтому не стоит ничего между выгрузками.
+
+    Attributes:
+        prefix (str): Префикс имён метрик.
+
+    Example:
+        >>> metrics.enable()
+        >>> metrics.serve(9464)
+        >>> metrics.write('/var/lib/node_exporter/app.prom')
+    """
+    def __init__(self, prefix: str = 'dao') -> None:
+        """
+        ## Инициализация реестра.
+
+        Args:
+            prefix (str): Префикс имён метрик. По умолчанию `'dao'`.
+        """
+        self.prefix = prefix
+        self._counters: dict[str, tuple[str, Samples]] = {}
+        self._collectors: list[Collector] = []
+        self._statements: dict[str, tuple[str, str]] = {}
+        self._lock = Lock()
+
+    def inc(self, name: str, value: float = 1, description: str = '', **labels: str) -> None:
+        """
+        ## Увеличивает счётчик.
+
+        Args:
+            name (str): Имя счётчика без префикса.
+            value (float): Приращение. По умолчанию `1`.
+            description (str): Описание счётчика для `# HELP`.
+            **labels (str): Метки образца.
+        """
+        key = tuple(labels.items())
+        with self._lock:
+            counter = self._counters.get(name)
+            if counter is None:
+                counter = self._counters[name] = (description, {})
+            samples = counter[1]
+            samples[key] = samples.get(key, 0) + value
+
+    def add_collector(self, collector: Collector) -> Collector:
+        """
+        ## Подключает сборщик метрик, вычисляемых при выгрузке.
+
+        Args:
+            collector (Collector): Сборщик.
+
+        Returns:
+            Collector: Этот же сборщик.
+        """
+        with self._lock:
+            self._collectors.append(collector)
+        return collector
+
+    def _statement(self, sql: str) -> tuple[str, str]:
+        """
+        ## Операция и таблица запроса (кэшируется по тексту `SQL`).
+
+        Args:
+            sql (str): Текст запроса.
+
+        Returns:
+            tuple[str, str]: Операция в верхнем регистре и имя таблицы (пустое, если его нет).
+        """
+        statement = self._statements.get(sql)
+        if statement is None:
+            match = _STATEMENT.match(sql)
+            if match is None:
+                operation, table = 'OTHER', ''
+            else:
+                operation = (match.group(1) or match.group(3)).upper()
+                table = match.group(2) or match.group(4) or ''
+            statement = self._statements[sql] = (operation, table)
+        return statement
+
+    def __call__(self, event: QueryEvent) -> None:
+        operation, table = self._statement(event.sql)
+        if operation == 'COMMIT':
+            self.inc('commits_total', description='Фиксации транзакций.')
+        else:
+            self.inc('queries_total', description='Выполненные запросы.', table=table, operation=operation)
+            if operation in _WRITES:
+                self.inc('rows_written_total', event.rows, 'Изменённые строки.', table=table)
+            else:
+                self.inc('rows_read_total', event.rows, 'Прочитанные строки.', table=table)
+        self.inc(
+            'query_seconds_total', event.elapsed, 'Суммарное время выполнения запросов.',
+            table=table, operation=operation,
+        )
+        if event.error is not None:
+            self.inc(
+                'errors_total', description='Запросы, завершившиеся ошибкой.',
+                table=table, operation=operation,
+                kind='integrity' if isinstance(event.error, IntegrityError) else 'other',
+            )
+
+    def enable(self) -> None:
+        """
+        ## Подключает реестр к `instrumentation` (повторный вызов ничего не делает).
+        """
+        if self not in instrumentation.listeners:
+            instrumentation.add_listener(self)
+
+    def disable(self) -> None:
+        """
+        ## Отключает реестр от `instrumentation`. Накопленные значения сохраняются.
+        """
+        instrumentation.remove_listener(self)
+
+    def reset(self) -> None:
+        """
+        ## Сбрасывает накопленные счётчики.
+        """
+        with self._lock:
+            self._counters.clear()
+
+    def render(self) -> str:
+        """
+        ## Выгружает метрики в текстовом формате `Prometheus`.
+
+        Returns:
+            str: Текст выгрузки.
+        """
+        with self._lock:
+            metrics = [
+                (name, 'counter', description, dict(samples))
+                for name, (description, samples) in sorted(self._counters.items())
+            ]
+            collectors = list(self._collectors)
+        for collector in collectors:
+            metrics.extend(collector())
+        lines = []
+        for name, kind, description, samples in metrics:
+            name = f'{self.prefix}_{name}'
+            lines.append(f'# HELP {name} {description}')
+            lines.append(f'# TYPE {name} {kind}')
+            for labels, value in samples.items():
+                lines.append(f'{name}{_format_labels(labels)} {value!r}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path: str) -> None:
+        """
+        ## Атомарно записывает выгрузку в файл (для `textfile`-сборщика `node_exporter`).
+
+        Args:
+            path (str): Путь к файлу.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        with NamedTemporaryFile('w', dir=directory, suffix='.tmp', delete=False, encoding='utf-8') as file:
+            file.write(self.render())
+        os.replace(file.name, path)
+
+    def serve(self, port: int = 9464, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+        """
+        ## Запускает локальный `HTTP`-сервер выгрузки в фоновом потоке.
+
+        Args:
+            port (int): Порт. По умолчанию `9464`, `0` — любой свободный.
+            host (str): Адрес. По умолчанию `'127.0.0.1'`.
+
+        Returns:
+            ThreadingHTTPServer: Сервер; остановить — `shutdown()`.
+        """
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        Thread(target=server.serve_forever, name='metrics-server', daemon=True).start()
+        return server
+
+
+def _format_labels(labels: Labels) -> str:
+    """
+    ## Форматирует метки образца.
+
+    Args:
+        labels (Labels): Метки.
+
+    Returns:
+        str: Метки вида `{table="users",operation="SELECT"}` или пустая строка.
+    """
+    if not labels:
+        return ''
+    escaped = (
+        (name, str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n'))
+        for name, value in labels
+    )
+    return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+
+def _collect_pools() -> list[tuple[str, str, str, Samples]]:
+    """
+    ## Состояние пулов подключений.
+    """
+    pools = get_pools()
+    samples: dict[str, Samples] = {
+        'pool_connections': {}, 'pool_idle_connections': {},
+        'pool_checkouts_total': {}, 'pool_waits_total': {},
+        'pool_wait_seconds_total': {}, 'pool_timeouts_total': {},
+    }
+    for pool in pools:
+        labels = (('database', pool.database),)
+        samples['pool_connections'][labels] = pool.size
+        samples['pool_idle_connections'][labels] = pool.idle
+        samples['pool_checkouts_total'][labels] = pool.checkouts
+        samples['pool_waits_total'][labels] = pool.waits
+        samples['pool_wait_seconds_total'][labels] = pool.wait_time
+        samples['pool_timeouts_total'][labels] = pool.timeouts
+    return [
+        ('pool_connections', 'gauge', 'Открытые подключения.', samples['pool_connections']),
+        ('pool_idle_connections', 'gauge', 'Свободные подключения.', samples['pool_idle_connections']),
+        ('pool_checkouts_total', 'counter', 'Выдачи подключений.', samples['pool_checkouts_total']),
+        ('pool_waits_total', 'counter', 'Выдачи с ожиданием свободного подключения.', samples['pool_waits_total']),
+        ('pool_wait_seconds_total', 'counter', 'Время ожидания свободного подключения.', samples['pool_wait_seconds_total']),
+        ('pool_timeouts_total', 'counter', 'Выдачи, завершившиеся таймаутом.', samples['pool_timeouts_total']),
+    ]
+
+
+def _collect_caches() -> list[tuple[str, str, str, Samples]]:
+    """
+    ## Состояние кэшей `DAO` (кэши с одинаковым именем суммируются).
+    """
+    hits: Samples = {}
+    misses: Samples = {}
+    entries: Samples = {}
+    for cache in get_caches():
+        labels = (('cache', cache.name),)
+        hits[labels] = hits.get(labels, 0) + cache.hits
+        misses[labels] = misses.get(labels, 0) + cache.misses
+        entries[labels] = entries.get(labels, 0) + len(cache)
+    ratio = {labels: hits[labels] / total if (total := hits[labels] + misses[labels]) else 0.0 for labels in hits}
+    return [
+        ('cache_hits_total', 'counter', 'Попадания в кэш.', hits),
+        ('cache_misses_total', 'counter', 'Промахи кэша.', misses),
+        ('cache_entries', 'gauge', 'Записи в кэше.', entries),
+        ('cache_hit_ratio', 'gauge', 'Доля попаданий в кэш.', ratio),
+    ]
+
+
+
+metrics = MetricsRegistry()
+metrics.add_collector(_collect_pools)
+metrics.add_collector(_collect_caches)
+
+
+def enable_metrics(port: Optional[int] = None, host: str = '127.0.0.1') -> MetricsRegistry:
+    """
+    ## Включает сбор метрик `DAO` и, при указании порта, `HTTP`-выгрузку.
+
+    Args:
+        port (Optional[int]): Порт `HTTP`-выгрузки, `None` — без сервера. По умолчанию `None`.
+        host (str): Адрес `HTTP`-выгрузки. По умолчанию `'127.0.0.1'`.
+
+    Returns:
+        MetricsRegistry: Реестр метрик.
+    """
+    metrics.enable()
+    if port is not None:
+        metrics.serve(port, host)
+    return metrics
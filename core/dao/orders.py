@@ -1,13 +1,27 @@
+from array import array
+from concurrent.futures import Future
 from sqlite3 import IntegrityError
+from datetime import date
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence, Union
 from unittest import result
 
-from .base import BaseDAO
+try:
+    import numpy
+except ImportError:  # numpy нужен только для `fetch_columns(as_numpy=True)`
+    numpy = None
 
-from core.db.enums import TableNames
-from core.db.schemas import OrdersSchema, SomeOrder, UpdateOrder
-from core.db.mapping import OrdersTableFields
+from .base import BaseDAO, DEFAULT_BATCH_SIZE, DEFAULT_FETCH_SIZE
 
+from core.db.enums import AggregateFunc, ResultMode, TableNames
+from core.db.schemas import BatchResult, Page, OrdersSchema, SomeOrder, UpdateOrder
+from core.db.mapping import OrdersTableFields, TablesName, ORDER_COLUMNS
+from core.db.rows import OrderRow
 
+
+from .cache import LRUCache, invalidate_cascade
+from .mappers import RowMapper
+from .query import Query
+from .sql_registry import sql_registry
 from .sql_templates import *
 
 
@@ -18,44 +32,348 @@ class OrderDAO(BaseDAO):
 
     Наследуется от `BaseDAO` и предоставляет методы для выполнения операций `CRUD` с заказами.
     """
-    def __init__(self) -> None:
+    # Поля, по которым допускается сортировка при постраничном чтении:
+    # у каждого есть индекс (поле, `id`) в `ALL_INDEXES`
+    SORTABLE_FIELDS = frozenset((
+        OrdersTableFields.ID,
+        OrdersTableFields.USER_ID,
+        OrdersTableFields.ORDER_DATE,
+        OrdersTableFields.TOTAL_AMOUNT,
+        OrdersTableFields.STATUS,
+    ))
+
+    # Поля, по которым допускается группировка при агрегации
+    GROUPABLE_FIELDS = frozenset((
+        OrdersTableFields.USER_ID,
+        OrdersTableFields.ORDER_DATE,
+        OrdersTableFields.STATUS,
+    ))
+
+    # Выражения группировки и фильтрации полей при агрегации:
+    # `order_date` хранит как даты, так и `CURRENT_TIMESTAMP` ('YYYY-MM-DD HH:MM:SS'), поэтому сравнивается по дню
+    AGGREGATE_EXPRESSIONS: dict[str, str] = {
+        OrdersTableFields.ORDER_DATE: f'date({OrdersTableFields.ORDER_DATE})',
+    }
+
+    # Поля, по которым допускается агрегация (`'*'` — только для `count`)
+    AGGREGATABLE_FIELDS = frozenset((
+        '*',
+        OrdersTableFields.ID,
+        OrdersTableFields.USER_ID,
+        OrdersTableFields.TOTAL_AMOUNT,
+    ))
+
+    # Выражения и коды типов `array` для столбцового чтения.
+    # Даты возвращаются целым числом дней от 1970-01-01.
+    COLUMNAR_FIELDS: dict[str, tuple[str, str]] = {
+        OrdersTableFields.ID: (OrdersTableFields.ID, 'q'),
+        OrdersTableFields.USER_ID: (OrdersTableFields.USER_ID, 'q'),
+        OrdersTableFields.ORDER_DATE: (
+            f'CAST(julianday(date({OrdersTableFields.ORDER_DATE})) - 2440587.5 AS INTEGER)', 'q'
+        ),
+        OrdersTableFields.TOTAL_AMOUNT: (OrdersTableFields.TOTAL_AMOUNT, 'd'),
+        OrdersTableFields.STATUS: (OrdersTableFields.STATUS, 'q'),
+    }
+
+    def __init__(
+        self,
+        trusted_rows: bool = True,
+        result_mode: ResultMode = 'model',
+        cache: Optional[LRUCache] = None,
+        db_name: str = 'raw_ipr',
+        **pool_options,
+    ) -> None:
         """
         ## Инициализация `OrderDAO`.
 
-        Устанавливает имя таблицы заказов.
+        Устанавливает имя таблицы заказов и один раз подготавливает `SQL`-запросы к ней.
+
+        Args:
+            trusted_rows (bool): Собирать модели из строк базы без валидации `Pydantic`. По умолчанию `True`.
+            result_mode (ResultMode): Формат результатов `get_orders`/`iter_orders` по умолчанию: модели `SomeOrder`
+                (`'model'`) или компактные `OrderRow` (`'row'`). По умолчанию `'model'`.
+            cache (Optional[LRUCache]): Кэш `get_order` по `id`, инвалидируемый при изменениях.
+                Можно включить позже через `enable_cache`. По умолчанию `None`.
+            db_name (str): Имя базы данных. По умолчанию `'raw_ipr'`.
+            **pool_options: Параметры пула подключений, см. `ConnectionPool`.
         """
-        super().__init__()
+        super().__init__(db_name, cache=cache, **pool_options)
         self.table_name: TableNames = 'orders'
+        self.result_mode: ResultMode = result_mode
+        self.mapper: RowMapper[SomeOrder] = RowMapper(SomeOrder, ORDER_COLUMNS, trusted=trusted_rows)
+        self.sql_get_all = sql_registry.render(GET_ALL, table_name=self.table_name)
+        self.sql_get_one = sql_registry.render(
+            GET_ONE,
+                table_name=self.table_name,
+                main_field=OrdersTableFields.ID,
+        )
+        self.sql_create_one = sql_registry.render(
+            CREATE_ONE,
+                table_name=self.table_name,
+                field_1=OrdersTableFields.USER_ID,
+                field_2=OrdersTableFields.ORDER_DATE,
+                field_3=OrdersTableFields.TOTAL_AMOUNT,
+                field_4=OrdersTableFields.STATUS,
+        )
+        self.sql_create_many = sql_registry.render(
+            CREATE_MANY,
+                table_name=self.table_name,
+                field_1=OrdersTableFields.USER_ID,
+                field_2=OrdersTableFields.ORDER_DATE,
+                field_3=OrdersTableFields.TOTAL_AMOUNT,
+                field_4=OrdersTableFields.STATUS,
+        )
+        self.sql_delete_one = sql_registry.render(
+            DELETE_ONE,
+                table_name=self.table_name,
+                main_field=OrdersTableFields.ID,
+        )
+        self.sql_delete_many = sql_registry.render(
+            DELETE_MANY,
+                table_name=self.table_name,
+                main_field=OrdersTableFields.ID,
+        )
+        self.sql_get_for_user = sql_registry.render(
+            GET_BY_FIELD,
+                table_name=self.table_name,
+                field=OrdersTableFields.USER_ID,
+                main_field=OrdersTableFields.ID,
+        )
         
-    def get_orders(self) -> list[SomeOrder]:
+    def get_orders(self, mode: Optional[ResultMode] = None) -> Union[list[SomeOrder], list[OrderRow]]:
         """
         ## Получение всех заказов.
 
         Выполняет запрос к базе данных для получения всех заказов.
 
+        Args:
+            mode (Optional[ResultMode]): Формат результатов, по умолчанию `result_mode` объекта.
+                В режиме `'row'` возвращаются `OrderRow` без `Pydantic`, преобразуемые в модель через `to_model()`.
+
         Returns:
-            list[SomeOrder]: Список заказов из базы данных.
+            Union[list[SomeOrder], list[OrderRow]]: Список заказов из базы данных.
 
         Raises:
             IntegrityError: Если возникает ошибка целостности.
             Exception: Для обработки других исключений.
         """
         try:
-            result = self.get_all(GET_ALL.format(table_name=self.table_name))
-            data = [
-                SomeOrder(
-                    id=i[0],
-                    user_id=i[1],
-                    order_date=i[2],
-                    total_amount=i[3],
-                    status=i[4]
-                ) for i in result
-            ]
+            if (mode or self.result_mode) == 'row':
+                return self.get_all(self.sql_get_all, row_factory=OrderRow.from_db)
+            result = self.get_all(self.sql_get_all)
+            data = self.mapper.many(result)
             return data
 
         except (IntegrityError, Exception):
             raise
     
+    def iter_orders(
+        self,
+        batch_size: int = DEFAULT_FETCH_SIZE,
+        mode: Optional[ResultMode] = None,
+    ) -> Iterator[Union[SomeOrder, OrderRow]]:
+        """
+        ## Потоковое получение всех заказов.
+
+        В отличие от `get_orders` не загружает таблицу целиком:
+        строки читаются пакетами по `batch_size`, модели создаются по мере итерации.
+
+        Args:
+            batch_size (int): Количество строк в одном пакете. По умолчанию `DEFAULT_FETCH_SIZE`.
+            mode (Optional[ResultMode]): Формат результатов, по умолчанию `result_mode` объекта.
+
+        Yields:
+            Union[SomeOrder, OrderRow]: Очередная запись.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        if (mode or self.result_mode) == 'row':
+            yield from self.iter_all(self.sql_get_all, batch_size=batch_size, row_factory=OrderRow.from_db)
+            return
+        for i in self.iter_all(self.sql_get_all, batch_size=batch_size):
+            yield self.mapper(i)
+    
+    def query(self) -> Query:
+        """
+        ## Создаёт построитель запроса к таблице заказов.
+
+        Returns:
+            Query: Пустой запрос с полями `OrdersTableFields`.
+        """
+        return Query(self.table_name, ORDER_COLUMNS)
+
+    def find_orders(self, query: Query) -> Union[list[SomeOrder], list[tuple]]:
+        """
+        ## Получение заказов по запросу построителя.
+
+        Args:
+            query (Query): Запрос, созданный через `query()`.
+
+        Returns:
+            Union[list[SomeOrder], list[tuple]]: Модели `SomeOrder` или, если задана проекция
+                через `select`, именованные кортежи `Row` с выбранными столбцами.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        try:
+            result = self.find(query)
+            return result if query.projected else self.mapper.many(result)
+
+        except (IntegrityError, Exception):
+            raise
+
+    def iter_find_orders(
+        self,
+        query: Query,
+        batch_size: int = DEFAULT_FETCH_SIZE,
+    ) -> Iterator[Union[SomeOrder, tuple]]:
+        """
+        ## Потоковое получение заказов по запросу построителя, см. `find_orders`.
+
+        Args:
+            query (Query): Запрос, созданный через `query()`.
+            batch_size (int): Количество строк в одном пакете. По умолчанию `DEFAULT_FETCH_SIZE`.
+
+        Yields:
+            Union[SomeOrder, tuple]: Очередная модель или именованный кортеж `Row`.
+        """
+        if query.projected:
+            yield from self.iter_find(query, batch_size=batch_size)
+            return
+        for row in self.iter_find(query, batch_size=batch_size):
+            yield self.mapper(row)
+
+    def aggregate_orders(
+        self,
+        aggregates: Mapping[str, tuple[AggregateFunc, str]],
+        group_by: Sequence[str] = (),
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> list[tuple]:
+        """
+        ## Агрегация заказов на стороне `SQLite`.
+
+        Даты сравниваются и группируются по дню `date(order_date)`, в том числе для
+        записей со временем; диапазон фильтруется по индексу `ix_orders_order_day`.
+
+        Args:
+            aggregates (Mapping[str, tuple[AggregateFunc, str]]): Имя результата -> (функция, поле из `AGGREGATABLE_FIELDS`).
+            group_by (Sequence[str]): Поля группировки из `GROUPABLE_FIELDS`. По умолчанию без группировки.
+            date_from (Optional[date]): Начало диапазона `order_date` включительно. По умолчанию `None`.
+            date_to (Optional[date]): Конец диапазона `order_date` включительно. По умолчанию `None`.
+
+        Returns:
+            list[tuple]: Именованные кортежи с полями группировки и агрегатами, упорядоченные по группировке.
+
+        Raises:
+            ValueError: Если поле не допускает группировку или агрегацию.
+
+        Example:
+            >>> order_dao.aggregate_orders({'revenue': ('sum', 'total_amount')}, group_by=('user_id',))
+            [AggregateRow(user_id=1, revenue=4.5), ...]
+            >>> order_dao.aggregate_orders({'orders': ('count', '*')}, group_by=('order_date',), date_from=date(2024, 1, 1))
+            [AggregateRow(order_date='2024-01-01', orders=12), ...]
+        """
+        unknown = set(group_by) - self.GROUPABLE_FIELDS
+        unknown |= {field for _, field in aggregates.values()} - self.AGGREGATABLE_FIELDS
+        if unknown:
+            raise ValueError(f'Недопустимые поля агрегации: {", ".join(sorted(unknown))}')
+        order_day = self.AGGREGATE_EXPRESSIONS[OrdersTableFields.ORDER_DATE]
+        conditions: list[str] = []
+        parameters: list[str] = []
+        if date_from is not None:
+            conditions.append(f'{order_day} >= ?')
+            parameters.append(date_from.isoformat())
+        if date_to is not None:
+            conditions.append(f'{order_day} <= ?')
+            parameters.append(date_to.isoformat())
+        return self.aggregate(
+            self.table_name, aggregates, group_by, conditions, tuple(parameters), self.AGGREGATE_EXPRESSIONS,
+        )
+
+    def fetch_columns(
+        self,
+        columns: Sequence[str],
+        batch_size: int = DEFAULT_FETCH_SIZE,
+        as_numpy: bool = False,
+    ) -> dict[str, Any]:
+        """
+        ## Столбцовое чтение заказов для аналитики.
+
+        Значения каждого столбца складываются в типизированный буфер без создания
+        объектов заказов: целые — `int64`, суммы — `float64` (`NULL` -> `nan`),
+        `order_date` — целое число дней от 1970-01-01.
+
+        Args:
+            columns (Sequence[str]): Столбцы из `COLUMNAR_FIELDS`.
+            batch_size (int): Количество строк в одном пакете. По умолчанию `DEFAULT_FETCH_SIZE`.
+            as_numpy (bool): Вернуть массивы `numpy` (без копирования) вместо `array.array`.
+                Требует дополнительной зависимости `analytics`. По умолчанию `False`.
+
+        Returns:
+            dict[str, Any]: Буферы столбцов по именам полей.
+
+        Raises:
+            ValueError: Если столбцы не заданы или столбец не поддерживается.
+            ImportError: Если запрошен `as_numpy=True`, а `numpy` не установлен.
+        """
+        if not columns:
+            raise ValueError('Не задан ни один столбец')
+        unknown = set(columns) - self.COLUMNAR_FIELDS.keys()
+        if unknown:
+            raise ValueError(f'Недопустимые столбцы: {", ".join(sorted(unknown))}')
+        if as_numpy and numpy is None:
+            raise ImportError('Для as_numpy=True требуется пакет numpy')
+
+        expressions, typecodes = zip(*(self.COLUMNAR_FIELDS[column] for column in columns))
+        query = sql_registry.render(GET_COLUMNS, table_name=self.table_name, columns=', '.join(expressions))
+        buffers: list[array] = self.read_columns(query, typecodes, batch_size=batch_size)
+        if as_numpy:
+            return {column: numpy.frombuffer(buffer, dtype=buffer.typecode) for column, buffer in zip(columns, buffers)}
+        return dict(zip(columns, buffers))
+
+    def get_orders_page(
+        self,
+        limit: int = 50,
+        token: Optional[str] = None,
+        sort_by: Sequence[str] = (),
+        descending: bool = False,
+    ) -> Page[SomeOrder]:
+        """
+        ## Постраничное получение заказов.
+
+        Использует keyset-пагинацию по `id` (и полям `sort_by`, например `OrdersTableFields.ORDER_DATE`),
+        поэтому стоимость любой страницы одинакова независимо от её глубины.
+        Записи с `NULL` в поле сортировки идут первыми по возрастанию и последними по убыванию.
+
+        Args:
+            limit (int): Максимальное количество записей на странице. По умолчанию `50`.
+            token (Optional[str]): Токен продолжения из предыдущей страницы. По умолчанию `None`.
+            sort_by (Sequence[str]): Поле сортировки из `SORTABLE_FIELDS` (не больше одного). По умолчанию `()`.
+            descending (bool): Сортировка по убыванию. По умолчанию `False`.
+
+        Returns:
+            Page[SomeOrder]: Страница заказов и токен следующей страницы.
+
+        Raises:
+            ValueError: Если поле сортировки не поддерживается, их больше одного или токен некорректен.
+            Exception: Для обработки других исключений.
+        """
+        unknown = set(sort_by) - self.SORTABLE_FIELDS
+        if unknown:
+            raise ValueError(f'Недопустимые поля сортировки: {", ".join(sorted(unknown))}')
+        result, next_token = self.get_page(
+            self.table_name, limit, token=token, sort_fields=sort_by, descending=descending
+        )
+        return Page[SomeOrder](
+            items=self.mapper.many(result),
+            next_token=next_token,
+        )
+    
     def insert_order(self, order: OrdersSchema) -> SomeOrder:
         """
         ## Вставка нового заказа в базу данных.
@@ -71,29 +389,35 @@ class OrderDAO(BaseDAO):
             Exception: Для обработки других исключений.
         """
         try:
-            query = CREATE_ONE.format(
-                table_name=self.table_name,
-                    field_1=OrdersTableFields.USER_ID,
-                    field_2=OrdersTableFields.ORDER_DATE,
-                    field_3=OrdersTableFields.TOTAL_AMOUNT,
-                    field_4=OrdersTableFields.STATUS,
-            )
+            query = self.sql_create_one
             data = self.insert_one(query, (order.user_id, order.order_date, order.total_amount, order.status))
-            return SomeOrder(
-                id=data[0],
-                user_id=data[1],
-                order_date=data[2],
-                total_amount=data[3],
-                status=data[4]
-            )
+            return self.mapper(data)
 
         except (IntegrityError, Exception):
             raise
     
+    def insert_order_deferred(self, order: OrdersSchema) -> Future:
+        """
+        ## Отложенная вставка заказа с групповой фиксацией.
+
+        Вставка выполняется общим потоком записи в одной транзакции с другими
+        отложенными операциями. Подходит для большого числа параллельных вставок,
+        когда допустима задержка в несколько миллисекунд.
+
+        Args:
+            order (OrdersSchema): Схема нового заказа.
+
+        Returns:
+            Future: Результат `SomeOrder` после фиксации транзакции.
+        """
+        return self.submit_write(self.sql_create_one, (order.user_id, order.order_date, order.total_amount, order.status), self.mapper)
+    
     def update_order(self, order: UpdateOrder, id: int) -> SomeOrder:
         """
         ## Обновление информации о заказе.
 
+        Записываются только поля, явно заданные в `order`, и время обновления `updated_at`.
+
         Args:
             order (UpdateOrder): Обновленная информация о заказе.
             id (int): Идентификатор заказа, который нужно обновить.
@@ -107,24 +431,49 @@ class OrderDAO(BaseDAO):
         """
         try:
             up_order = order.model_dump(exclude_unset=True)
-            cortege = up_order.values()
-            query = UPDATE_ONE.format(
-                table_name=self.table_name,
-                    field_1=OrdersTableFields.ORDER_DATE,
-                    main_field=OrdersTableFields.ID
-            )
-            data = self.update_one(query, (*cortege, id))
-            return SomeOrder(
-                id=data[0],
-                user_id=data[1],
-                order_date=data[2],
-                total_amount=data[3],
-                status=data[4]
-            )
+            data = self.update_fields(self.table_name, id, up_order)
+            self.invalidate_cached((id,))
+            return self.mapper(data)
 
         except (IntegrityError, Exception):
             raise
     
+    def update_orders(
+        self,
+        order: UpdateOrder,
+        ids: Iterable[int],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[SomeOrder]:
+        """
+        ## Пакетное обновление заказов одинаковыми значениями.
+
+        Записываются только поля, явно заданные в `order`, одним запросом
+        `UPDATE ... WHERE id IN (...)` на пакет идентификаторов.
+
+        Args:
+            order (UpdateOrder): Новые значения полей.
+            ids (Iterable[int]): Идентификаторы заказов.
+            batch_size (int): Максимальное количество идентификаторов в одном запросе. По умолчанию `DEFAULT_BATCH_SIZE`.
+
+        Returns:
+            list[SomeOrder]: Обновлённые записи.
+
+        Raises:
+            ValueError: Если в `order` не задано ни одно поле.
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        try:
+            ids = list(ids)
+            result = self.update_fields_by_ids(
+                self.table_name, ids, order.model_dump(exclude_unset=True), batch_size=batch_size
+            )
+            self.invalidate_cached(ids)
+            return self.mapper.many(result)
+
+        except (IntegrityError, Exception):
+            raise
+
     def get_order(self, id: int) -> SomeOrder:
         """
         ## Получение информации о конкретном заказе.
@@ -140,22 +489,67 @@ class OrderDAO(BaseDAO):
             Exception: Для обработки других исключений.
         """
         try:
-            query = GET_ONE.format(
-                table_name=self.table_name,
-                    main_field=OrdersTableFields.ID
-            )
-            data = self.get_one(query, (id,))
-            return SomeOrder(
-                id=data[0],
-                user_id=data[1],
-                order_date=data[2],
-                total_amount=data[3],
-                status=data[4]
-            )
+            query = self.sql_get_one
+            return self.get_cached(id, lambda: self.mapper(self.get_one(query, (id,))))
 
         except (IntegrityError, Exception):
             raise
     
+    def get_orders_for_user(
+        self,
+        user_id: int,
+        mode: Optional[ResultMode] = None,
+    ) -> Union[list[SomeOrder], list[OrderRow]]:
+        """
+        ## Получение заказов пользователя.
+
+        Выбирает заказы по индексу `orders.user_id` вместо чтения всей таблицы.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            mode (Optional[ResultMode]): Формат результатов, по умолчанию `result_mode` объекта.
+
+        Returns:
+            Union[list[SomeOrder], list[OrderRow]]: Заказы пользователя в порядке идентификаторов.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        try:
+            if (mode or self.result_mode) == 'row':
+                return self.get_all(self.sql_get_for_user, row_factory=OrderRow.from_db, parameters=(user_id,))
+            result = self.get_all(self.sql_get_for_user, parameters=(user_id,))
+            return self.mapper.many(result)
+
+        except (IntegrityError, Exception):
+            raise
+
+    def get_orders_by_ids(self, ids: Iterable[int], batch_size: int = DEFAULT_FETCH_SIZE) -> BatchResult[SomeOrder]:
+        """
+        ## Пакетное получение заказов по идентификаторам.
+
+        Заменяет вызов `get_order` в цикле: идентификаторы читаются пакетами
+        запросов `IN (...)` вместо отдельного запроса на каждый.
+
+        Args:
+            ids (Iterable[int]): Идентификаторы заказов.
+            batch_size (int): Максимальное количество идентификаторов в одном запросе. По умолчанию `DEFAULT_FETCH_SIZE`.
+
+        Returns:
+            BatchResult[SomeOrder]: Найденные записи в порядке идентификаторов и ненайденные идентификаторы.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        try:
+            rows, missing = self.get_by_ids(self.table_name, ids, batch_size=batch_size)
+            return BatchResult[SomeOrder](items=self.mapper.many(rows), missing=missing)
+
+        except (IntegrityError, Exception):
+            raise
+
     def delete_order(self, id: int) -> SomeOrder:
         """
         ## Удаление заказа из базы данных.
@@ -171,22 +565,99 @@ class OrderDAO(BaseDAO):
             Exception: Для обработки других исключений.
         """        
         try:
-            query = DELETE_ONE.format(
-                table_name=self.table_name,
-                    main_field=OrdersTableFields.ID
-            )
+            query = self.sql_delete_one
             data = self.delete_one(query, (id,))
-            return SomeOrder(
-                id=data[0],
-                user_id=data[1],
-                order_date=data[2],
-                total_amount=data[3],
-                status=data[4]
+            self._invalidate_orders((id,))
+            return self.mapper(data)
+
+        except (IntegrityError, Exception):
+            raise
+
+
+    def insert_orders(
+        self,
+        orders: Iterable[OrdersSchema],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        returning: bool = False,
+    ) -> list[SomeOrder]:
+        """
+        ## Пакетная вставка заказов.
+
+        Заказы вставляются пакетами по `batch_size`, по одной транзакции на пакет.
+
+        Args:
+            orders (Iterable[OrdersSchema]): Заказы для вставки.
+            batch_size (int): Количество записей в одной транзакции. По умолчанию `DEFAULT_BATCH_SIZE`.
+            returning (bool): Возвращать ли созданные заказы. По умолчанию `False`.
+
+        Returns:
+            list[SomeOrder]: Созданные заказы или пустой список, если `returning=False`.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        try:
+            query = self.sql_create_one if returning else self.sql_create_many
+            result = self.insert_many(
+                query,
+                ((order.user_id, order.order_date, order.total_amount, order.status) for order in orders),
+                batch_size=batch_size,
+                returning=returning,
             )
+            return self.mapper.many(result)
 
         except (IntegrityError, Exception):
             raise
 
+    def delete_orders(
+        self,
+        ids: Iterable[int],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        returning: bool = False,
+    ) -> list[SomeOrder]:
+        """
+        ## Пакетное удаление заказов.
+
+        Args:
+            ids (Iterable[int]): Идентификаторы удаляемых заказов.
+            batch_size (int): Количество записей в одной транзакции. По умолчанию `DEFAULT_BATCH_SIZE`.
+            returning (bool): Возвращать ли удалённые заказы. По умолчанию `False`.
+
+        Returns:
+            list[SomeOrder]: Удалённые заказы или пустой список, если `returning=False`.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        try:
+            query = self.sql_delete_one if returning else self.sql_delete_many
+            ids = list(ids)
+            result = self.delete_many(query, ((id,) for id in ids), batch_size=batch_size, returning=returning)
+            self._invalidate_orders(ids)
+            return self.mapper.many(result)
+
+        except (IntegrityError, Exception):
+            raise
+
+
+    def _invalidate_orders(self, ids: Iterable[int]) -> None:
+        """
+        ## Инвалидирует кэш удалённых заказов и их каскадно удалённых платежей.
+
+        Args:
+            ids (Iterable[int]): Идентификаторы удалённых заказов.
+        """
+        self.invalidate_cached(ids)
+        deleted = frozenset(ids)
+
+        def invalidate_payments() -> None:
+            invalidate_cascade(TablesName.PAYMENTS, lambda payment: payment.order_id in deleted)
+
+        invalidate_payments()
+        self.pool.call_on_release(invalidate_payments)
+
 
 
 order_dao = OrderDAO()
\ No newline at end of file
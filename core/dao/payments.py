@@ -1,38 +1,435 @@
-from .base import BaseDAO
+from concurrent.futures import Future
+from sqlite3 import IntegrityError
+from typing import Any, Iterable, Iterator, Optional
+
+from .base import BaseDAO, DEFAULT_BATCH_SIZE, DEFAULT_FETCH_SIZE
 from core.db.enums import PayMethods, TableNames
+from core.db.mapping import PaymentsTableFields, PAYMENT_COLUMNS
+from core.db.schemas import BatchResult, PaymentsSchema, SomePayment, UpdatePayment
+
+from .cache import LRUCache
+from .mappers import RowMapper
+from .query import Query
+from .sql_registry import sql_registry
+from .sql_templates import *
+
+
+
+def _payment_values(payment: PaymentsSchema) -> tuple:
+    """
+    ## Параметры вставки платежа в порядке полей `CREATE_ONE`.
+
+    Args:
+        payment (PaymentsSchema): Схема платежа.
+
+    Returns:
+        tuple: (`user_id`, `order_id`, `payment_date`, значение `PayMethods`).
+    """
+    return (payment.user_id, payment.order_id, payment.payment_date, payment.payment_method.value)
+
+
+def _update_values(payment: UpdatePayment) -> dict[str, Any]:
+    """
+    ## Явно заданные поля обновления платежа со значениями для `SQLite`.
+
+    Args:
+        payment (UpdatePayment): Обновленная информация о платеже.
+
+    Returns:
+        dict[str, Any]: Поле -> значение, `PayMethods` заменён своим значением.
+    """
+    values = payment.model_dump(exclude_unset=True)
+    method = values.get(PaymentsTableFields.PAY_METHOD)
+    if isinstance(method, PayMethods):
+        values[PaymentsTableFields.PAY_METHOD] = method.value
+    return values
 
 
 
 class PaymentDAO(BaseDAO):
-    
-    def __init__(self) -> None:
-        super().__init__()
+    """
+    ## Класс для работы с платежами в базе данных.
+
+    Наследуется от `BaseDAO` и предоставляет методы для выполнения операций `CRUD` с платежами.
+    Метод оплаты хранится целым значением `PayMethods` и преобразуется обратно при чтении.
+    Для массовой загрузки предназначены `insert_payments` (пакеты в одной транзакции)
+    и `insert_payment_deferred` (групповая фиксация параллельных вставок).
+    """
+    def __init__(
+        self,
+        trusted_rows: bool = True,
+        cache: Optional[LRUCache] = None,
+        db_name: str = 'raw_ipr',
+        **pool_options,
+    ) -> None:
+        """
+        ## Инициализация `PaymentDAO`.
+
+        Устанавливает имя таблицы платежей и один раз подготавливает `SQL`-запросы к ней.
+
+        Args:
+            trusted_rows (bool): Собирать модели из строк базы без валидации `Pydantic`. По умолчанию `True`.
+            cache (Optional[LRUCache]): Кэш `get_payment` по `id`, инвалидируемый при изменениях.
+                Можно включить позже через `enable_cache`. По умолчанию `None`.
+            db_name (str): Имя базы данных. По умолчанию `'raw_ipr'`.
+            **pool_options: Параметры пула подключений, см. `ConnectionPool`.
+        """
+        super().__init__(db_name, cache=cache, **pool_options)
         self.table_name: TableNames = 'payments'
-        
-    def get_payments(self):
-        pass    
-    
-    def insert_payment(self):
-        pass
-    
-    def update_payment(self):
-        pass
-    
-    def get_payment(self):
-        pass
-    
-    def delete_payment(self):
-        pass
-    
-    def insert_payments(self):
-        pass
-    
-    def update_payments(self):
-        pass
-    
-    def delete_payments(self):
-        pass
-
-
-
-payment_dao = PaymentDAO()
\ No newline at end of file
+        self.mapper: RowMapper[SomePayment] = RowMapper(SomePayment, PAYMENT_COLUMNS, trusted=trusted_rows)
+        self.sql_get_all = sql_registry.render(GET_ALL, table_name=self.table_name)
+        self.sql_get_one = sql_registry.render(
+            GET_ONE,
+                table_name=self.table_name,
+                main_field=PaymentsTableFields.ID,
+        )
+        self.sql_get_for_order = sql_registry.render(
+            GET_BY_FIELD,
+                table_name=self.table_name,
+                field=PaymentsTableFields.ORDER_ID,
+                main_field=PaymentsTableFields.ID,
+        )
+        self.sql_create_one = sql_registry.render(
+            CREATE_ONE,
+                table_name=self.table_name,
+                field_1=PaymentsTableFields.USER_ID,
+                field_2=PaymentsTableFields.ORDER_ID,
+                field_3=PaymentsTableFields.PAYMENT_DATE,
+                field_4=PaymentsTableFields.PAY_METHOD,
+        )
+        self.sql_create_many = sql_registry.render(
+            CREATE_MANY,
+                table_name=self.table_name,
+                field_1=PaymentsTableFields.USER_ID,
+                field_2=PaymentsTableFields.ORDER_ID,
+                field_3=PaymentsTableFields.PAYMENT_DATE,
+                field_4=PaymentsTableFields.PAY_METHOD,
+        )
+        self.sql_delete_one = sql_registry.render(
+            DELETE_ONE,
+                table_name=self.table_name,
+                main_field=PaymentsTableFields.ID,
+        )
+        self.sql_delete_many = sql_registry.render(
+            DELETE_MANY,
+                table_name=self.table_name,
+                main_field=PaymentsTableFields.ID,
+        )
+
+    def get_payments(self) -> list[SomePayment]:
+        """
+        ## Получение всех платежей.
+
+        Returns:
+            list[SomePayment]: Список платежей из базы данных.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        try:
+            result = self.get_all(self.sql_get_all)
+            return self.mapper.many(result)
+
+        except (IntegrityError, Exception):
+            raise
+
+    def iter_payments(self, batch_size: int = DEFAULT_FETCH_SIZE) -> Iterator[SomePayment]:
+        """
+        ## Потоковое получение всех платежей.
+
+        Строки читаются пакетами по `batch_size`, модели создаются по мере итерации.
+
+        Args:
+            batch_size (int): Количество строк в одном пакете. По умолчанию `DEFAULT_FETCH_SIZE`.
+
+        Yields:
+            SomePayment: Очередной платёж.
+        """
+        for row in self.iter_all(self.sql_get_all, batch_size=batch_size):
+            yield self.mapper(row)
+
+    def query(self) -> Query:
+        """
+        ## Создаёт построитель запроса к таблице платежей.
+
+        Returns:
+            Query: Пустой запрос с полями `PaymentsTableFields`.
+        """
+        return Query(self.table_name, PAYMENT_COLUMNS)
+
+    def find_payments(self, query: Query) -> list:
+        """
+        ## Получение платежей по запросу построителя.
+
+        Args:
+            query (Query): Запрос, созданный через `query()`.
+
+        Returns:
+            list: Модели `SomePayment` или, если задана проекция, именованные кортежи `Row`.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        try:
+            result = self.find(query)
+            return result if query.projected else self.mapper.many(result)
+
+        except (IntegrityError, Exception):
+            raise
+
+    def get_payments_for_order(self, order_id: int) -> list[SomePayment]:
+        """
+        ## Получение платежей заказа.
+
+        Выбирает платежи по индексу `payments.order_id`.
+
+        Args:
+            order_id (int): Идентификатор заказа.
+
+        Returns:
+            list[SomePayment]: Платежи заказа в порядке идентификаторов.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        try:
+            result = self.get_all(self.sql_get_for_order, parameters=(order_id,))
+            return self.mapper.many(result)
+
+        except (IntegrityError, Exception):
+            raise
+
+    def get_payments_by_ids(
+        self,
+        ids: Iterable[int],
+        batch_size: int = DEFAULT_FETCH_SIZE,
+    ) -> BatchResult[SomePayment]:
+        """
+        ## Пакетное получение платежей по идентификаторам.
+
+        Args:
+            ids (Iterable[int]): Идентификаторы платежей.
+            batch_size (int): Максимальное количество идентификаторов в одном запросе. По умолчанию `DEFAULT_FETCH_SIZE`.
+
+        Returns:
+            BatchResult[SomePayment]: Найденные платежи в порядке идентификаторов и ненайденные идентификаторы.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        try:
+            rows, missing = self.get_by_ids(self.table_name, ids, batch_size=batch_size)
+            return BatchResult[SomePayment](items=self.mapper.many(rows), missing=missing)
+
+        except (IntegrityError, Exception):
+            raise
+
+    def insert_payment(self, payment: PaymentsSchema) -> SomePayment:
+        """
+        ## Вставка нового платежа в базу данных.
+
+        Args:
+            payment (PaymentsSchema): Схема платежа.
+
+        Returns:
+            SomePayment: Созданный платёж.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности (например, заказ не существует).
+            Exception: Для обработки других исключений.
+        """
+        try:
+            data = self.insert_one(self.sql_create_one, _payment_values(payment))
+            return self.mapper(data)
+
+        except (IntegrityError, Exception):
+            raise
+
+    def insert_payment_deferred(self, payment: PaymentsSchema) -> Future:
+        """
+        ## Отложенная вставка платежа с групповой фиксацией.
+
+        Args:
+            payment (PaymentsSchema): Схема платежа.
+
+        Returns:
+            Future: Результат `SomePayment` после фиксации транзакции.
+        """
+        return self.submit_write(self.sql_create_one, _payment_values(payment), self.mapper)
+
+    def update_payment(self, payment: UpdatePayment, id: int) -> SomePayment:
+        """
+        ## Обновление информации о платеже.
+
+        Записываются только поля, явно заданные в `payment`, и время обновления `updated_at`.
+
+        Args:
+            payment (UpdatePayment): Обновленная информация о платеже.
+            id (int): Идентификатор платежа.
+
+        Returns:
+            SomePayment: Обновленный платёж.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        try:
+            data = self.update_fields(self.table_name, id, _update_values(payment))
+            self.invalidate_cached((id,))
+            return self.mapper(data)
+
+        except (IntegrityError, Exception):
+            raise
+
+    def get_payment(self, id: int) -> SomePayment:
+        """
+        ## Получение информации о платеже.
+
+        Args:
+            id (int): Идентификатор платежа.
+
+        Returns:
+            SomePayment: Платёж.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        try:
+            query = self.sql_get_one
+            return self.get_cached(id, lambda: self.mapper(self.get_one(query, (id,))))
+
+        except (IntegrityError, Exception):
+            raise
+
+    def delete_payment(self, id: int) -> SomePayment:
+        """
+        ## Удаление платежа из базы данных.
+
+        Args:
+            id (int): Идентификатор платежа.
+
+        Returns:
+            SomePayment: Удаленный платёж.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        try:
+            data = self.delete_one(self.sql_delete_one, (id,))
+            self.invalidate_cached((id,))
+            return self.mapper(data)
+
+        except (IntegrityError, Exception):
+            raise
+
+
+    def insert_payments(
+        self,
+        payments: Iterable[PaymentsSchema],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        returning: bool = False,
+    ) -> list[SomePayment]:
+        """
+        ## Пакетная вставка платежей.
+
+        Платежи вставляются через `executemany` пакетами по `batch_size`,
+        по одной транзакции на пакет. Без `returning` строки не возвращаются,
+        что заметно быстрее при массовой загрузке.
+
+        Args:
+            payments (Iterable[PaymentsSchema]): Платежи для вставки.
+            batch_size (int): Количество записей в одной транзакции. По умолчанию `DEFAULT_BATCH_SIZE`.
+            returning (bool): Возвращать ли созданные платежи. По умолчанию `False`.
+
+        Returns:
+            list[SomePayment]: Созданные платежи или пустой список, если `returning=False`.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности (например, заказ не существует).
+            Exception: Для обработки других исключений.
+        """
+        try:
+            query = self.sql_create_one if returning else self.sql_create_many
+            result = self.insert_many(
+                query,
+                (_payment_values(payment) for payment in payments),
+                batch_size=batch_size,
+                returning=returning,
+            )
+            return self.mapper.many(result)
+
+        except (IntegrityError, Exception):
+            raise
+
+    def update_payments(
+        self,
+        payment: UpdatePayment,
+        ids: Iterable[int],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[SomePayment]:
+        """
+        ## Пакетное обновление платежей одинаковыми значениями.
+
+        Args:
+            payment (UpdatePayment): Новые значения полей.
+            ids (Iterable[int]): Идентификаторы платежей.
+            batch_size (int): Максимальное количество идентификаторов в одном запросе. По умолчанию `DEFAULT_BATCH_SIZE`.
+
+        Returns:
+            list[SomePayment]: Обновлённые платежи.
+
+        Raises:
+            ValueError: Если в `payment` не задано ни одно поле.
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        try:
+            ids = list(ids)
+            result = self.update_fields_by_ids(self.table_name, ids, _update_values(payment), batch_size=batch_size)
+            self.invalidate_cached(ids)
+            return self.mapper.many(result)
+
+        except (IntegrityError, Exception):
+            raise
+
+    def delete_payments(
+        self,
+        ids: Iterable[int],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        returning: bool = False,
+    ) -> list[SomePayment]:
+        """
+        ## Пакетное удаление платежей.
+
+        Args:
+            ids (Iterable[int]): Идентификаторы удаляемых платежей.
+            batch_size (int): Количество записей в одной транзакции. По умолчанию `DEFAULT_BATCH_SIZE`.
+            returning (bool): Возвращать ли удалённые платежи. По умолчанию `False`.
+
+        Returns:
+            list[SomePayment]: Удалённые платежи или пустой список, если `returning=False`.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        try:
+            ids = list(ids)
+            query = self.sql_delete_one if returning else self.sql_delete_many
+            result = self.delete_many(query, ((id,) for id in ids), batch_size=batch_size, returning=returning)
+            self.invalidate_cached(ids)
+            return self.mapper.many(result)
+
+        except (IntegrityError, Exception):
+            raise
+
+
+
+payment_dao = PaymentDAO()
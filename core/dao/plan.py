@@ -0,0 +1,327 @@
+import re
+from argparse import ArgumentParser
+from sqlite3 import Connection, DatabaseError
+from typing import Iterable, NamedTuple, Optional, Pattern, Union
+
+from core.db.mapping import StaticFields
+from core.db.pool import ConnectionPool
+
+from .sql_registry import sql_registry
+
+
+# Шаг плана с обращением к таблице: `SCAN users`, `SEARCH orders USING INDEX ix_orders_user_id (user_id=?)`
+_ACCESS = re.compile(r'(SCAN|SEARCH) (\w+)(?: AS \w+)?(.*)')
+# Наличие условия отбора в запросе
+_WHERE = re.compile(r'\bWHERE\b', re.IGNORECASE)
+
+# Намеренные полные сканирования, которые `python -m core.dao.plan` не считает нарушением.
+# `LIKE` с параметром не использует индекс: шаблон может начинаться с `%`, а `LIKE`
+# без учёта регистра несовместим с индексом с сортировкой `BINARY`.
+# Выборки без `WHERE` (`get_all`, первая страница, агрегаты) нарушением не считаются и так.
+INTENTIONAL_SCANS: tuple[Pattern[str], ...] = (
+    re.compile(r'\bLIKE\b', re.IGNORECASE),
+)
+
+
+
+class FullScanError(AssertionError):
+    """
+    ## Запросы читают большие таблицы полным сканированием.
+    """
+
+
+
+class TableAccess(NamedTuple):
+    """
+    ## Обращение запроса к таблице по плану выполнения.
+
+    Attributes:
+        table (str): Имя таблицы.
+        kind (str): `'search'` — поиск по индексу, `'index scan'` — обход индекса,
+            `'full scan'` — полное сканирование таблицы.
+        detail (str): Строка плана `EXPLAIN QUERY PLAN`.
+        nested (bool): Обращение выполняется во вложенном цикле (не первая таблица плана).
+    """
+    table: str
+    kind: str
+    detail: str
+    nested: bool
+
+
+
+class QueryPlan(NamedTuple):
+    """
+    ## План выполнения одного запроса.
+
+    Attributes:
+        sql (str): Текст запроса.
+        accesses (tuple[TableAccess, ...]): Обращения к таблицам.
+        temp_btree (bool): Для сортировки или группировки строится временное B-дерево.
+        error (Optional[str]): Ошибка построения плана.
+    """
+    sql: str
+    accesses: tuple[TableAccess, ...]
+    temp_btree: bool
+    error: Optional[str] = None
+
+    @property
+    def filtered(self) -> bool:
+        """
+        ## Запрос содержит условие отбора `WHERE`.
+        """
+        return _WHERE.search(self.sql) is not None
+
+
+
+class ForeignKeyIndex(NamedTuple):
+    """
+    ## Внешний ключ без индекса по столбцам дочерней таблицы.
+
+    Каскадное удаление или проверка ключа при удалении родительской записи
+    сканирует дочернюю таблицу целиком.
+
+    Attributes:
+        table (str): Дочерняя таблица.
+        columns (tuple[str, ...]): Столбцы внешнего ключа.
+        parent (str): Родительская таблица.
+    """
+    table: str
+    columns: tuple[str, ...]
+    parent: str
+
+
+
+class PlanAudit(NamedTuple):
+    """
+    ## Результат проверки планов запросов.
+
+    Attributes:
+        plans (tuple[QueryPlan, ...]): Планы всех проверенных запросов.
+        violations (tuple[tuple[QueryPlan, TableAccess], ...]): Полные сканирования больших таблиц.
+        foreign_keys (tuple[ForeignKeyIndex, ...]): Внешние ключи больших таблиц без индекса.
+    """
+    plans: tuple[QueryPlan, ...]
+    violations: tuple[tuple[QueryPlan, TableAccess], ...]
+    foreign_keys: tuple[ForeignKeyIndex, ...]
+
+    @property
+    def ok(self) -> bool:
+        """
+        ## Нарушений нет.
+        """
+        return not self.violations and not self.foreign_keys
+
+    def report(self) -> str:
+        """
+        ## Текстовый отчёт: сводка по видам обращений и список нарушений.
+
+        Returns:
+            str: Отчёт.
+        """
+        kinds: dict[str, int] = {}
+        for plan in self.plans:
+            for access in plan.accesses:
+                kinds[access.kind] = kinds.get(access.kind, 0) + 1
+        lines = [
+            f'Запросов: {len(self.plans)}, '
+            + ', '.join(f'{kind}: {count}' for kind, count in sorted(kinds.items()))
+        ]
+        for plan in self.plans:
+            if plan.error is not None:
+                lines.append(f'Ошибка плана: {plan.error}\n    {" ".join(plan.sql.split())}')
+        for plan, access in self.violations:
+            lines.append(f'Полное сканирование {access.table}: {access.detail}\n    {" ".join(plan.sql.split())}')
+        for key in self.foreign_keys:
+            lines.append(f'Внешний ключ {key.table}({", ".join(key.columns)}) -> {key.parent} без индекса')
+        return '\n'.join(lines)
+
+
+def explain(connection: Connection, sql: str) -> QueryPlan:
+    """
+    ## Строит план выполнения запроса через `EXPLAIN QUERY PLAN`.
+
+    Параметры `?` заменяются на `NULL`: план зависит от формы запроса, а не от значений.
+
+    Args:
+        connection (Connection): Подключение.
+        sql (str): Текст запроса.
+
+    Returns:
+        QueryPlan: План выполнения.
+    """
+    try:
+        rows = connection.execute(f'EXPLAIN QUERY PLAN {sql}', (None,) * sql.count('?')).fetchall()
+    except DatabaseError as ex:
+        return QueryPlan(sql, (), False, str(ex))
+    accesses = []
+    temp_btree = False
+    for row in rows:
+        detail = row[-1]
+        temp_btree = temp_btree or detail.startswith('USE TEMP B-TREE')
+        match = _ACCESS.match(detail)
+        if match is None:
+            continue
+        operation, table, rest = match.groups()
+        if operation == 'SEARCH':
+            kind = 'search'
+        elif ' INDEX ' in f'{rest} ':
+            kind = 'index scan'
+        else:
+            kind = 'full scan'
+        accesses.append(TableAccess(table, kind, detail, bool(accesses)))
+    return QueryPlan(sql, tuple(accesses), temp_btree)
+
+
+def unindexed_foreign_keys(connection: Connection) -> list[ForeignKeyIndex]:
+    """
+    ## Находит внешние ключи, столбцы которых не являются началом ни одного индекса.
+
+    Args:
+        connection (Connection): Подключение.
+
+    Returns:
+        list[ForeignKeyIndex]: Внешние ключи без индекса.
+    """
+    tables = [
+        row[0] for row in connection.execute(
+            "SELECT name FROM sqlite_schema WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        )
+    ]
+    result = []
+    for table in tables:
+        keys: dict[int, tuple[str, list[str]]] = {}
+        for row in connection.execute(f'PRAGMA foreign_key_list({table})'):
+            keys.setdefault(row[0], (row[2], []))[1].append(row[3])
+        if not keys:
+            continue
+        prefixes = [
+            [info[2] for info in connection.execute(f'PRAGMA index_info({index[1]})')]
+            for index in connection.execute(f'PRAGMA index_list({table})')
+        ]
+        for parent, columns in keys.values():
+            if not any(index[:len(columns)] == columns for index in prefixes):
+                result.append(ForeignKeyIndex(table, tuple(columns), parent))
+    return result
+
+
+def audit(
+    connection: Connection,
+    queries: Iterable[str] = sql_registry,
+    min_rows: int = 0,
+    allow: Iterable[Union[str, Pattern[str]]] = (),
+) -> PlanAudit:
+    """
+    ## Проверяет планы запросов на полные сканирования больших таблиц.
+
+    Нарушением считается полное сканирование таблицы, в которой не меньше
+    `min_rows` записей, если запрос содержит условие `WHERE` или таблица
+    сканируется во вложенном цикле соединения. Сканирование без условий
+    (`get_all`, первая страница, агрегаты по всей таблице) намеренное.
+
+    Args:
+        connection (Connection): Подключение.
+        queries (Iterable[str]): Запросы. По умолчанию все запросы `sql_registry`.
+        min_rows (int): Минимальное количество записей большой таблицы. По умолчанию `0` — все таблицы.
+        allow (Iterable[Union[str, Pattern[str]]]): Запросы, которым полное сканирование
+            разрешено: текст запроса или регулярное выражение для поиска в нём.
+
+    Returns:
+        PlanAudit: Результат проверки.
+    """
+    allow = tuple(allow)
+    allowed = {' '.join(sql.split()) for sql in allow if isinstance(sql, str)}
+    patterns = [pattern for pattern in allow if not isinstance(pattern, str)]
+    sizes: dict[str, int] = {}
+
+    def large(table: str) -> bool:
+        if min_rows <= 0:
+            return True
+        if table not in sizes:
+            sizes[table] = connection.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+        return sizes[table] >= min_rows
+
+    plans = tuple(explain(connection, sql) for sql in dict.fromkeys(queries))
+    violations = tuple(
+        (plan, access)
+        for plan in plans
+        if ' '.join(plan.sql.split()) not in allowed
+        and not any(pattern.search(plan.sql) for pattern in patterns)
+        for access in plan.accesses
+        if access.kind == 'full scan' and (plan.filtered or access.nested) and large(access.table)
+    )
+    foreign_keys = tuple(key for key in unindexed_foreign_keys(connection) if large(key.table))
+    return PlanAudit(plans, violations, foreign_keys)
+
+
+def assert_indexed(
+    pool: ConnectionPool,
+    queries: Iterable[str] = sql_registry,
+    min_rows: int = 0,
+    allow: Iterable[Union[str, Pattern[str]]] = (),
+) -> PlanAudit:
+    """
+    ## Проверяет планы запросов и падает при полных сканированиях (для тестов и разработки).
+
+    Args:
+        pool (ConnectionPool): Пул подключений проверяемой базы данных.
+        queries (Iterable[str]): Запросы. По умолчанию все запросы `sql_registry`.
+        min_rows (int): Минимальное количество записей большой таблицы. По умолчанию `0`.
+        allow (Iterable[Union[str, Pattern[str]]]): Запросы, которым полное сканирование разрешено.
+
+    Returns:
+        PlanAudit: Результат проверки без нарушений.
+
+    Raises:
+        FullScanError: Если найдены полные сканирования или внешние ключи без индекса.
+    """
+    with pool.connection() as connection:
+        result = audit(connection, queries, min_rows, allow)
+    if not result.ok:
+        raise FullScanError(result.report())
+    return result
+
+
+def main() -> int:
+    """
+    ## Проверяет запросы всех `DAO` приложения: `python -m core.dao.plan`.
+
+    Кроме запросов, подготовленных при создании `DAO`, проверяются запросы
+    keyset-пагинации по каждому полю `SORTABLE_FIELDS`. Сканирования из
+    `INTENTIONAL_SCANS` нарушением не считаются (кроме режима `--strict`).
+
+    Returns:
+        int: Код завершения: `1`, если найдены нарушения.
+    """
+    parser = ArgumentParser(description='Проверка планов запросов DAO на полные сканирования таблиц')
+    parser.add_argument('--min-rows', type=int, default=0, help='минимальное количество записей большой таблицы')
+    parser.add_argument('--verbose', action='store_true', help='вывести план каждого запроса')
+    parser.add_argument('--strict', action='store_true', help='не учитывать список намеренных сканирований')
+    args = parser.parse_args()
+
+    # Запросы регистрируются в `sql_registry` при создании `DAO`
+    from .base import page_queries
+    from .payments import payment_dao
+    from .orders import order_dao
+    from .users import user_dao
+
+    # Запросы страниц строятся при обращении: первая страница и продолжения после ключа с `NULL` и без
+    for dao in (user_dao, order_dao):
+        for field in sorted(dao.SORTABLE_FIELDS):
+            keys = (None, (0,)) if field == StaticFields.ID else (None, (None, 0), (0, 0))
+            for descending in (False, True):
+                for key in keys:
+                    page_queries(dao.table_name, None if field == StaticFields.ID else field, descending, key)
+
+    with user_dao.pool.connection() as connection:
+        result = audit(connection, min_rows=args.min_rows, allow=() if args.strict else INTENTIONAL_SCANS)
+    if args.verbose:
+        for plan in result.plans:
+            print(' '.join(plan.sql.split()))
+            for access in plan.accesses:
+                print(f'    {access.kind}: {access.detail}')
+    print(result.report())
+    return 0 if result.ok else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
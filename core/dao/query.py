@@ -0,0 +1,269 @@
+from functools import lru_cache
+from sys import intern
+from typing import Any, Iterable, Optional, Sequence
+
+from .sql_templates import SELECT_QUERY
+
+
+# Операторы сравнения, доступные в условиях запроса
+_OPERATORS = frozenset(('=', '!=', '<', '<=', '>', '>=', 'LIKE', 'IN'))
+
+
+
+class Query:
+    """
+    ## Параметризованный запрос `SELECT` к одной таблице.
+
+    Поля запроса проверяются по списку столбцов таблицы (`USER_COLUMNS`,
+    `ORDER_COLUMNS` в `mapping.py`), значения всегда передаются параметрами `?`.
+    Текст `SQL` зависит только от формы запроса (столбцы, поля и операторы
+    условий, сортировка, наличие лимита), поэтому компилируется один раз на форму
+    и кэшируется. Список `IN` дополняется повтором последнего значения до степени двойки,
+    чтобы число форм оставалось небольшим.
+
+    Методы изменяют запрос и возвращают его же, чтобы вызовы можно было объединять в цепочку.
+
+    Attributes:
+        table_name (str): Имя таблицы.
+        fields (tuple[str, ...]): Допустимые столбцы таблицы в порядке `SELECT *`.
+
+    Example:
+        >>> query = order_dao.query().select('id', 'status').where_in('status', [1, 2]).limit(100)
+        >>> order_dao.find_orders(query)
+        [Row(id=1, status=1), ...]
+    """
+    def __init__(self, table_name: str, fields: Sequence[str]) -> None:
+        """
+        ## Инициализация запроса.
+
+        Args:
+            table_name (str): Имя таблицы.
+            fields (Sequence[str]): Допустимые столбцы таблицы в порядке `SELECT *`.
+        """
+        self.table_name = table_name
+        self.fields = tuple(fields)
+        self._columns: tuple[str, ...] = ()
+        self._conditions: list[tuple[str, str, int]] = []
+        self._parameters: list[Any] = []
+        self._order_by: list[tuple[str, bool]] = []
+        self._limit: Optional[int] = None
+        self._offset: Optional[int] = None
+
+    def _check(self, *fields: str) -> None:
+        """
+        ## Проверяет, что поля есть в таблице.
+
+        Raises:
+            ValueError: Если поле не относится к таблице.
+        """
+        unknown = set(fields).difference(self.fields)
+        if unknown:
+            raise ValueError(f'Неизвестные поля таблицы {self.table_name}: {", ".join(sorted(unknown))}')
+
+    def select(self, *columns: str) -> 'Query':
+        """
+        ## Задаёт столбцы результата вместо `SELECT *`.
+
+        Args:
+            *columns (str): Столбцы таблицы, без повторов.
+
+        Returns:
+            Query: Этот же запрос.
+
+        Raises:
+            ValueError: Если столбец не относится к таблице или указан дважды.
+        """
+        self._check(*columns)
+        repeated = {column for column in columns if columns.count(column) > 1}
+        if repeated:
+            raise ValueError(f'Повторяющиеся столбцы результата: {", ".join(sorted(repeated))}')
+        self._columns = columns
+        return self
+
+    def where(self, field: str, operator: str, value: Any) -> 'Query':
+        """
+        ## Добавляет условие `field <operator> ?`.
+
+        Условия объединяются через `AND`.
+
+        Args:
+            field (str): Столбец таблицы.
+            operator (str): Оператор сравнения: `=`, `!=`, `<`, `<=`, `>`, `>=`, `LIKE`.
+            value (Any): Значение параметра.
+
+        Returns:
+            Query: Этот же запрос.
+        """
+        self._check(field)
+        operator = operator.upper()
+        if operator not in _OPERATORS or operator == 'IN':
+            raise ValueError(f'Недопустимый оператор: {operator}')
+        self._conditions.append((field, operator, 1))
+        self._parameters.append(value)
+        return self
+
+    def eq(self, **values: Any) -> 'Query':
+        """
+        ## Добавляет условия равенства `field = ?` для каждого аргумента.
+
+        Returns:
+            Query: Этот же запрос.
+        """
+        for field, value in values.items():
+            self.where(field, '=', value)
+        return self
+
+    def between(self, field: str, low: Any = None, high: Any = None) -> 'Query':
+        """
+        ## Добавляет условие диапазона `low <= field <= high`.
+
+        Args:
+            field (str): Столбец таблицы.
+            low (Any): Нижняя граница включительно, `None` — без границы. Defaults to None.
+            high (Any): Верхняя граница включительно, `None` — без границы. Defaults to None.
+
+        Returns:
+            Query: Этот же запрос.
+        """
+        if low is not None:
+            self.where(field, '>=', low)
+        if high is not None:
+            self.where(field, '<=', high)
+        return self
+
+    def where_in(self, field: str, values: Iterable[Any]) -> 'Query':
+        """
+        ## Добавляет условие `field IN (...)`.
+
+        Args:
+            field (str): Столбец таблицы.
+            values (Iterable[Any]): Допустимые значения, не более лимита параметров `SQLite`.
+
+        Returns:
+            Query: Этот же запрос.
+        """
+        self._check(field)
+        values = list(values)
+        if not values:
+            raise ValueError('Список значений IN не может быть пустым')
+        width = 1 << (len(values) - 1).bit_length()
+        self._conditions.append((field, 'IN', width))
+        self._parameters.extend(values + values[-1:] * (width - len(values)))
+        return self
+
+    def like(self, field: str, pattern: str) -> 'Query':
+        """
+        ## Добавляет условие `field LIKE ?`.
+
+        Args:
+            field (str): Столбец таблицы.
+            pattern (str): Шаблон `LIKE` (`%`, `_`).
+
+        Returns:
+            Query: Этот же запрос.
+        """
+        return self.where(field, 'LIKE', pattern)
+
+    def order_by(self, field: str, descending: bool = False) -> 'Query':
+        """
+        ## Добавляет поле сортировки.
+
+        Args:
+            field (str): Столбец таблицы.
+            descending (bool): Сортировка по убыванию. Defaults to False.
+
+        Returns:
+            Query: Этот же запрос.
+        """
+        self._check(field)
+        self._order_by.append((field, descending))
+        return self
+
+    def limit(self, limit: int, offset: Optional[int] = None) -> 'Query':
+        """
+        ## Ограничивает количество записей.
+
+        Args:
+            limit (int): Максимальное количество записей.
+            offset (Optional[int]): Количество пропускаемых записей. Defaults to None.
+
+        Returns:
+            Query: Этот же запрос.
+        """
+        if limit < 1 or (offset is not None and offset < 0):
+            raise ValueError('Лимит должен быть положительным, а смещение — неотрицательным')
+        self._limit = limit
+        self._offset = offset
+        return self
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        """
+        ## Столбцы результата в порядке выборки.
+        """
+        return self._columns or self.fields
+
+    @property
+    def projected(self) -> bool:
+        """
+        ## Выбирается ли подмножество столбцов вместо `SELECT *`.
+        """
+        return bool(self._columns)
+
+    @property
+    def shape(self) -> tuple:
+        """
+        ## Форма запроса: всё, от чего зависит текст `SQL`, без значений параметров.
+        """
+        return (
+            self.table_name,
+            self._columns,
+            tuple(self._conditions),
+            tuple(self._order_by),
+            self._limit is not None,
+            self._offset is not None,
+        )
+
+    def compile(self) -> tuple[str, tuple]:
+        """
+        ## Компилирует запрос.
+
+        Returns:
+            tuple[str, tuple]: Текст `SQL` из кэша форм и параметры запроса.
+        """
+        parameters = list(self._parameters)
+        if self._limit is not None:
+            parameters.append(self._limit)
+        if self._offset is not None:
+            parameters.append(self._offset)
+        return _compile(self.shape), tuple(parameters)
+
+
+
+@lru_cache(maxsize=1024)
+def _compile(shape: tuple) -> str:
+    """
+    ## Строит текст `SQL` для формы запроса.
+
+    Формы задаются вызывающим кодом и не ограничены, поэтому текст не заносится
+    в `sql_registry`: число хранимых строк ограничено размером кэша.
+
+    Args:
+        shape (tuple): Форма запроса, см. `Query.shape`.
+
+    Returns:
+        str: Текст `SQL`.
+    """
+    table_name, columns, conditions, order_by, has_limit, has_offset = shape
+    where = ' AND '.join(
+        f'{field} IN ({", ".join("?" * width)})' if operator == 'IN' else f'{field} {operator} ?'
+        for field, operator, width in conditions
+    )
+    order = ', '.join(f'{field} {"DESC" if descending else "ASC"}' for field, descending in order_by)
+    return intern(SELECT_QUERY.format(
+        table_name=table_name,
+        columns=', '.join(columns) or '*',
+        where=f'WHERE {where}' if where else '',
+        order_by=f'ORDER BY {order}' if order else '',
+        limit=('LIMIT ? OFFSET ?' if has_offset else 'LIMIT ?') if has_limit else '',
+    ))
@@ -0,0 +1,57 @@
+from sys import intern
+from threading import Lock
+from typing import Iterator
+
+
+
+class SqlRegistry:
+    """
+    ## Реестр готовых `SQL`-запросов.
+
+    Каждая комбинация шаблона из `sql_templates` и подставляемых в него имён
+    таблиц и полей форматируется один раз. Повторные запросы получают тот же
+    интернированный объект строки, поэтому не тратят время на `str.format`
+    и быстрее находятся в кэше подготовленных выражений `sqlite3`.
+    """
+    def __init__(self) -> None:
+        """
+        ## Инициализация реестра.
+        """
+        self._queries: dict[tuple, str] = {}
+        self._lock = Lock()
+
+    def render(self, template: str, **fields: str) -> str:
+        """
+        ## Возвращает готовый `SQL`-запрос по шаблону.
+
+        Args:
+            template (str): Шаблон `SQL`-запроса.
+            **fields (str): Значения для подстановки в шаблон.
+
+        Returns:
+            str: Интернированная строка `SQL`-запроса.
+        """
+        key = (template, *sorted(fields.items()))
+        query = self._queries.get(key)
+        if query is None:
+            with self._lock:
+                query = self._queries.setdefault(key, intern(template.format(**fields)))
+        return query
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        ## Перебирает все зарегистрированные `SQL`-запросы.
+
+        Yields:
+            str: Готовый `SQL`-запрос.
+        """
+        with self._lock:
+            queries = list(self._queries.values())
+        yield from queries
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+
+
+sql_registry = SqlRegistry()
@@ -3,12 +3,66 @@ GET_ALL = """
     SELECT * FROM {table_name}
 """
 
+# Получение выбранных столбцов всех записей
+GET_COLUMNS = """
+    SELECT {columns} FROM {table_name}
+"""
+
+# Выборка столбцов с условиями, сортировкой и лимитом (см. `query.py`)
+SELECT_QUERY = """
+    SELECT {columns} FROM {table_name}
+    {where}
+    {order_by}
+    {limit}
+"""
+
+# Агрегация записей с необязательными условием и группировкой
+AGGREGATE = """
+    SELECT {columns} FROM {table_name}
+    {where}
+    {group_by}
+"""
+
 # Получение одной записи по условию
 GET_ONE = """
     SELECT * FROM {table_name}
     WHERE {main_field} = ?
 """
 
+# Получение записей по списку значений поля
+GET_BY_IDS = """
+    SELECT * FROM {table_name}
+    WHERE {main_field} IN ({placeholders})
+"""
+
+# Идентификаторы записей, у которых поле принимает одно из значений списка
+GET_IDS_BY_FIELD = """
+    SELECT {main_field} FROM {table_name}
+    WHERE {field} IN ({placeholders})
+"""
+
+# Получение всех записей с заданным значением поля (например, внешнего ключа)
+GET_BY_FIELD = """
+    SELECT * FROM {table_name}
+    WHERE {field} = ?
+    ORDER BY {main_field}
+"""
+
+# Получение записей вместе с дочерними записями одним запросом
+GET_WITH_CHILDREN = """
+    SELECT {table_name}.*, {child_table}.* FROM {table_name}
+    LEFT JOIN {child_table} ON {child_table}.{foreign_key} = {table_name}.{main_field}
+    ORDER BY {table_name}.{main_field}, {child_table}.{main_field}
+"""
+
+# Получение записей с заданными идентификаторами вместе с дочерними записями
+GET_WITH_CHILDREN_BY_IDS = """
+    SELECT {table_name}.*, {child_table}.* FROM {table_name}
+    LEFT JOIN {child_table} ON {child_table}.{foreign_key} = {table_name}.{main_field}
+    WHERE {table_name}.{main_field} IN ({placeholders})
+    ORDER BY {table_name}.{main_field}, {child_table}.{main_field}
+"""
+
 # Создание одной записи с возвратом всех полей записи
 CREATE_ONE = """
     INSERT INTO {table_name}
@@ -17,6 +71,13 @@ CREATE_ONE = """
     RETURNING *
 """
 
+# Создание записи без возврата полей (для пакетной вставки через executemany)
+CREATE_MANY = """
+    INSERT INTO {table_name}
+    ({field_1}, {field_2}, {field_3}, {field_4})
+    VALUES (?, ?, ?, ?)
+"""
+
 # Обновление одной записи по условию
 UPDATE_ONE = """
     UPDATE {table_name}
@@ -25,9 +86,48 @@ UPDATE_ONE = """
     RETURNING *
 """
 
+# Частичное обновление одной записи: только переданные поля и время обновления
+UPDATE_FIELDS = """
+    UPDATE {table_name}
+    SET {assignments}, {updated_at} = CURRENT_TIMESTAMP
+    WHERE {main_field} = ?
+    RETURNING *
+"""
+
+# Частичное обновление записей с заданными идентификаторами одинаковыми значениями
+UPDATE_FIELDS_BY_IDS = """
+    UPDATE {table_name}
+    SET {assignments}, {updated_at} = CURRENT_TIMESTAMP
+    WHERE {main_field} IN ({placeholders})
+    RETURNING *
+"""
+
 # Удаление одной записи
 DELETE_ONE = """
     DELETE FROM {table_name}
     WHERE {main_field} = ?
     RETURNING *
-"""
\ No newline at end of file
+"""
+
+# Удаление записи без возврата полей (для пакетного удаления через executemany:
+# `sqlite3` не допускает `RETURNING` в executemany с несколькими наборами параметров)
+DELETE_MANY = """
+    DELETE FROM {table_name}
+    WHERE {main_field} = ?
+"""
+
+# Первая страница записей (keyset-пагинация)
+GET_FIRST_PAGE = """
+    SELECT * FROM {table_name}
+    ORDER BY {order_by}
+    LIMIT ?
+"""
+
+# Страница записей, следующая за ключом предыдущей страницы (keyset-пагинация):
+# условие — часть порядка после ключа, например `(order_date, id) > (?, ?)`
+GET_NEXT_PAGE = """
+    SELECT * FROM {table_name}
+    WHERE {condition}
+    ORDER BY {order_by}
+    LIMIT ?
+"""
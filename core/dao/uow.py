@@ -0,0 +1,110 @@
+from itertools import count
+from sqlite3 import Connection
+from typing import Optional
+
+from .orders import order_dao, OrderDAO
+from .users import user_dao, UserDAO
+
+
+# Счётчик для уникальных имён точек сохранения
+_savepoints = count()
+
+
+
+class UnitOfWork:
+    """
+    ## Единица работы: одна транзакция для нескольких `DAO`.
+
+    На время блока `with` подключение потока закрепляется за единицей работы,
+    а `DAO`, использующие тот же пул, выполняют свои операции на нём без
+    собственных фиксаций. Изменения фиксируются одной транзакцией при выходе
+    из блока или целиком откатываются при исключении. Вложенная единица работы
+    в том же потоке открывает точку сохранения (`SAVEPOINT`).
+
+    Attributes:
+        users (UserDAO): `DAO` пользователей.
+        orders (OrderDAO): `DAO` заказов.
+        connection (Optional[Connection]): Подключение единицы работы внутри блока `with`.
+
+    Example:
+        >>> with unit_of_work() as uow:
+        ...     user = uow.users.insert_user(new_user)
+        ...     uow.orders.insert_order(OrdersSchema(user_id=user.id, ...))
+    """
+    def __init__(self, users: UserDAO = user_dao, orders: OrderDAO = order_dao) -> None:
+        """
+        ## Инициализация единицы работы.
+
+        Args:
+            users (UserDAO): `DAO` пользователей. По умолчанию `user_dao`.
+            orders (OrderDAO): `DAO` заказов. По умолчанию `order_dao`.
+
+        Raises:
+            ValueError: Если `DAO` работают с разными базами данных.
+        """
+        if users.pool is not orders.pool:
+            raise ValueError('DAO единицы работы должны использовать одну базу данных')
+        self.users = users
+        self.orders = orders
+        self.pool = users.pool
+        self.connection: Optional[Connection] = None
+        self._savepoint: Optional[str] = None
+
+    def __enter__(self) -> 'UnitOfWork':
+        """
+        ## Открывает транзакцию или точку сохранения.
+        """
+        self.connection = self.pool.acquire()
+        try:
+            if self.connection.in_transaction:
+                self._savepoint = f'uow_{next(_savepoints)}'
+                self.connection.execute(f'SAVEPOINT {self._savepoint}')
+            else:
+                self.connection.execute('BEGIN')
+        except Exception:
+            self.pool.release(self.connection)
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """
+        ## Фиксирует или откатывает изменения и возвращает подключение в пул.
+        """
+        connection, self.connection = self.connection, None
+        try:
+            if self._savepoint is not None:
+                if exc_type is not None:
+                    connection.execute(f'ROLLBACK TO {self._savepoint}')
+                connection.execute(f'RELEASE {self._savepoint}')
+            elif exc_type is None:
+                self.users._commit(connection)
+            else:
+                connection.rollback()
+        finally:
+            self._savepoint = None
+            self.pool.release(connection)
+
+    def commit(self) -> None:
+        """
+        ## Досрочно фиксирует транзакцию и сразу открывает новую.
+
+        Допустимо только для внешней единицы работы.
+        """
+        if self.connection is None or self._savepoint is not None:
+            raise RuntimeError('Фиксация доступна только внешней единице работы внутри блока with')
+        self.users._commit(self.connection)
+        self.connection.execute('BEGIN')
+
+
+def unit_of_work(users: UserDAO = user_dao, orders: OrderDAO = order_dao) -> UnitOfWork:
+    """
+    ## Создаёт единицу работы для пользователей и заказов.
+
+    Args:
+        users (UserDAO): `DAO` пользователей. По умолчанию `user_dao`.
+        orders (OrderDAO): `DAO` заказов. По умолчанию `order_dao`.
+
+    Returns:
+        UnitOfWork: Контекстный менеджер единицы работы.
+    """
+    return UnitOfWork(users, orders)
@@ -1,11 +1,19 @@
+from concurrent.futures import Future
+from itertools import groupby
 from sqlite3 import IntegrityError
+from typing import Iterable, Iterator, Optional, Sequence, Union
 
-from .base import BaseDAO
+from .base import BaseDAO, DEFAULT_BATCH_SIZE, DEFAULT_FETCH_SIZE
 
 from core.db.enums import *
-from core.db.mapping import UserTableFields
-from core.db.schemas import UserSchema, UserUpdate, SomeUser
-
+from core.db.mapping import OrdersTableFields, TablesName, UserTableFields, ORDER_COLUMNS, USER_COLUMNS
+from core.db.schemas import BatchResult, Page, UserSchema, UserUpdate, UserWithOrders, SomeOrder, SomeUser
+from core.db.rows import UserRow
+
+from .cache import LRUCache, invalidate_cascade, is_cached
+from .mappers import RowMapper
+from .query import Query
+from .sql_registry import sql_registry
 from .sql_templates import *
 
 
@@ -17,44 +25,228 @@ class UserDAO(BaseDAO):
     Наследуется от `BaseDAO` и предоставляет методы для выполнения операций `CRUD`.
     """
 
-    def __init__(self) -> None:
+    # Поля, по которым допускается сортировка при постраничном чтении:
+    # у каждого есть индекс (поле, `id`) в `ALL_INDEXES`
+    SORTABLE_FIELDS = frozenset((
+        UserTableFields.ID,
+        UserTableFields.FIRST_NAME,
+        UserTableFields.EMAIL,
+        UserTableFields.REG_DATE,
+    ))
+
+    def __init__(
+        self,
+        trusted_rows: bool = True,
+        result_mode: ResultMode = 'model',
+        cache: Optional[LRUCache] = None,
+        db_name: str = 'raw_ipr',
+        **pool_options,
+    ) -> None:
         """
         ## Инициализация `UserDAO`.
 
-        Устанавливает имя таблицы пользователей.
+        Устанавливает имя таблицы пользователей и один раз подготавливает `SQL`-запросы к ней.
+
+        Args:
+            trusted_rows (bool): Собирать модели из строк базы без валидации `Pydantic`. По умолчанию `True`.
+            result_mode (ResultMode): Формат результатов `get_users`/`iter_users` по умолчанию: модели `SomeUser`
+                (`'model'`) или компактные `UserRow` (`'row'`). По умолчанию `'model'`.
+            cache (Optional[LRUCache]): Кэш `get_user` по `id`, инвалидируемый при изменениях.
+                Можно включить позже через `enable_cache`. По умолчанию `None`.
+            db_name (str): Имя базы данных. По умолчанию `'raw_ipr'`.
+            **pool_options: Параметры пула подключений, см. `ConnectionPool`.
         """
-        super().__init__()
+        super().__init__(db_name, cache=cache, **pool_options)
         self.table_name: TableNames = 'users'
+        self.result_mode: ResultMode = result_mode
+        self.mapper: RowMapper[SomeUser] = RowMapper(SomeUser, USER_COLUMNS, trusted=trusted_rows)
+        self.with_orders_mapper: RowMapper[UserWithOrders] = RowMapper(UserWithOrders, USER_COLUMNS, trusted=trusted_rows)
+        self.order_mapper: RowMapper[SomeOrder] = RowMapper(SomeOrder, ORDER_COLUMNS, trusted=trusted_rows)
+        self.sql_get_all = sql_registry.render(GET_ALL, table_name=self.table_name)
+        self.sql_get_one = sql_registry.render(
+            GET_ONE,
+                table_name=self.table_name,
+                main_field=UserTableFields.ID,
+        )
+        self.sql_create_one = sql_registry.render(
+            CREATE_ONE,
+                table_name=self.table_name,
+                field_1=UserTableFields.FIRST_NAME,
+                field_2=UserTableFields.EMAIL,
+                field_3=UserTableFields.REG_DATE,
+                field_4=UserTableFields.IS_ACTIVE,
+        )
+        self.sql_create_many = sql_registry.render(
+            CREATE_MANY,
+                table_name=self.table_name,
+                field_1=UserTableFields.FIRST_NAME,
+                field_2=UserTableFields.EMAIL,
+                field_3=UserTableFields.REG_DATE,
+                field_4=UserTableFields.IS_ACTIVE,
+        )
+        self.sql_delete_one = sql_registry.render(
+            DELETE_ONE,
+                table_name=self.table_name,
+                main_field=UserTableFields.ID,
+        )
+        self.sql_delete_many = sql_registry.render(
+            DELETE_MANY,
+                table_name=self.table_name,
+                main_field=UserTableFields.ID,
+        )
+        self.sql_get_with_orders = sql_registry.render(
+            GET_WITH_CHILDREN,
+                table_name=self.table_name,
+                child_table=TablesName.ORDERS,
+                foreign_key=OrdersTableFields.USER_ID,
+                main_field=UserTableFields.ID,
+        )
         
-    def get_users(self) -> list[SomeUser]:
+    def get_users(self, mode: Optional[ResultMode] = None) -> Union[list[SomeUser], list[UserRow]]:
         """
         ## Получение всех пользователей.
 
         Выполняет запрос к базе данных для получения всех пользователей.
 
+        Args:
+            mode (Optional[ResultMode]): Формат результатов, по умолчанию `result_mode` объекта.
+                В режиме `'row'` возвращаются `UserRow` без `Pydantic`, преобразуемые в модель через `to_model()`.
+
         Returns:
-            list[SomeUser]: Список пользователей из базы данных.
+            Union[list[SomeUser], list[UserRow]]: Список пользователей из базы данных.
 
         Raises:
             IntegrityError: Если возникает ошибка целостности.
             Exception: Для обработки других исключений.
         """
         try:
-            result = self.get_all(GET_ALL.format(table_name=self.table_name))
-            data = [
-                SomeUser(
-                    id=i[0],
-                    name=i[1],
-                    email=i[2],
-                    registration_date=i[3],
-                    is_active=i[4]
-                ) for i in result
-            ]
+            if (mode or self.result_mode) == 'row':
+                return self.get_all(self.sql_get_all, row_factory=UserRow.from_db)
+            result = self.get_all(self.sql_get_all)
+            data = self.mapper.many(result)
             return data
 
         except (IntegrityError, Exception):
             raise
     
+    def iter_users(
+        self,
+        batch_size: int = DEFAULT_FETCH_SIZE,
+        mode: Optional[ResultMode] = None,
+    ) -> Iterator[Union[SomeUser, UserRow]]:
+        """
+        ## Потоковое получение всех пользователей.
+
+        В отличие от `get_users` не загружает таблицу целиком:
+        строки читаются пакетами по `batch_size`, модели создаются по мере итерации.
+
+        Args:
+            batch_size (int): Количество строк в одном пакете. По умолчанию `DEFAULT_FETCH_SIZE`.
+            mode (Optional[ResultMode]): Формат результатов, по умолчанию `result_mode` объекта.
+
+        Yields:
+            Union[SomeUser, UserRow]: Очередная запись.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        if (mode or self.result_mode) == 'row':
+            yield from self.iter_all(self.sql_get_all, batch_size=batch_size, row_factory=UserRow.from_db)
+            return
+        for i in self.iter_all(self.sql_get_all, batch_size=batch_size):
+            yield self.mapper(i)
+    
+    def query(self) -> Query:
+        """
+        ## Создаёт построитель запроса к таблице пользователей.
+
+        Returns:
+            Query: Пустой запрос с полями `UserTableFields`.
+        """
+        return Query(self.table_name, USER_COLUMNS)
+
+    def find_users(self, query: Query) -> Union[list[SomeUser], list[tuple]]:
+        """
+        ## Получение пользователей по запросу построителя.
+
+        Args:
+            query (Query): Запрос, созданный через `query()`.
+
+        Returns:
+            Union[list[SomeUser], list[tuple]]: Модели `SomeUser` или, если задана проекция
+                через `select`, именованные кортежи `Row` с выбранными столбцами.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        try:
+            result = self.find(query)
+            return result if query.projected else self.mapper.many(result)
+
+        except (IntegrityError, Exception):
+            raise
+
+    def iter_find_users(
+        self,
+        query: Query,
+        batch_size: int = DEFAULT_FETCH_SIZE,
+    ) -> Iterator[Union[SomeUser, tuple]]:
+        """
+        ## Потоковое получение пользователей по запросу построителя, см. `find_users`.
+
+        Args:
+            query (Query): Запрос, созданный через `query()`.
+            batch_size (int): Количество строк в одном пакете. По умолчанию `DEFAULT_FETCH_SIZE`.
+
+        Yields:
+            Union[SomeUser, tuple]: Очередная модель или именованный кортеж `Row`.
+        """
+        if query.projected:
+            yield from self.iter_find(query, batch_size=batch_size)
+            return
+        for row in self.iter_find(query, batch_size=batch_size):
+            yield self.mapper(row)
+
+    def get_users_page(
+        self,
+        limit: int = 50,
+        token: Optional[str] = None,
+        sort_by: Sequence[str] = (),
+        descending: bool = False,
+    ) -> Page[SomeUser]:
+        """
+        ## Постраничное получение пользователей.
+
+        Использует keyset-пагинацию по `id` (и полям `sort_by`, например `UserTableFields.REG_DATE`),
+        поэтому стоимость любой страницы одинакова независимо от её глубины.
+        Записи с `NULL` в поле сортировки идут первыми по возрастанию и последними по убыванию.
+
+        Args:
+            limit (int): Максимальное количество записей на странице. По умолчанию `50`.
+            token (Optional[str]): Токен продолжения из предыдущей страницы. По умолчанию `None`.
+            sort_by (Sequence[str]): Поле сортировки из `SORTABLE_FIELDS` (не больше одного). По умолчанию `()`.
+            descending (bool): Сортировка по убыванию. По умолчанию `False`.
+
+        Returns:
+            Page[SomeUser]: Страница пользователей и токен следующей страницы.
+
+        Raises:
+            ValueError: Если поле сортировки не поддерживается, их больше одного или токен некорректен.
+            Exception: Для обработки других исключений.
+        """
+        unknown = set(sort_by) - self.SORTABLE_FIELDS
+        if unknown:
+            raise ValueError(f'Недопустимые поля сортировки: {", ".join(sorted(unknown))}')
+        result, next_token = self.get_page(
+            self.table_name, limit, token=token, sort_fields=sort_by, descending=descending
+        )
+        return Page[SomeUser](
+            items=self.mapper.many(result),
+            next_token=next_token,
+        )
+    
     def insert_user(self, user: UserSchema) -> SomeUser:
         """
         ## Вставка нового пользователя в базу данных.
@@ -70,29 +262,35 @@ class UserDAO(BaseDAO):
             Exception: Для обработки других исключений.
         """
         try:
-            query = CREATE_ONE.format(
-                table_name=self.table_name,
-                    field_1=UserTableFields.FIRST_NAME,
-                    field_2=UserTableFields.EMAIL,
-                    field_3=UserTableFields.REG_DATE,
-                    field_4=UserTableFields.IS_ACTIVE,
-            )
+            query = self.sql_create_one
             data = self.insert_one(query, (user.name, user.email, user.registration_date, user.is_active))
-            return SomeUser(
-                id=data[0],
-                name=data[1],
-                email=data[2],
-                registration_date=data[3],
-                is_active=data[4]
-            )
+            return self.mapper(data)
 
         except (IntegrityError, Exception):
             raise
     
+    def insert_user_deferred(self, user: UserSchema) -> Future:
+        """
+        ## Отложенная вставка пользователя с групповой фиксацией.
+
+        Вставка выполняется общим потоком записи в одной транзакции с другими
+        отложенными операциями. Подходит для большого числа параллельных вставок,
+        когда допустима задержка в несколько миллисекунд.
+
+        Args:
+            user (UserSchema): Схема нового пользователя.
+
+        Returns:
+            Future: Результат `SomeUser` после фиксации транзакции.
+        """
+        return self.submit_write(self.sql_create_one, (user.name, user.email, user.registration_date, user.is_active), self.mapper)
+    
     def update_user(self, user: UserUpdate, id: int) -> SomeUser:
         """
         ## Обновление информации о пользователе.
 
+        Записываются только поля, явно заданные в `user`, и время обновления `updated_at`.
+
         Args:
             user (UserUpdate): Обновленная информация о пользователе.
             id (int): Идентификатор пользователя, которого нужно обновить.
@@ -106,24 +304,49 @@ class UserDAO(BaseDAO):
         """
         try:
             up_user = user.model_dump(exclude_unset=True)
-            cortege = up_user.values()
-            query = UPDATE_ONE.format(
-                table_name=self.table_name,
-                    field_1=UserTableFields.FIRST_NAME,
-                    main_field=UserTableFields.ID
-            )
-            data = self.update_one(query, (*cortege, id))
-            return SomeUser(
-                id=data[0],
-                name=data[1],
-                email=data[2],
-                registration_date=data[3],
-                is_active=data[4]
-            )
+            data = self.update_fields(self.table_name, id, up_user)
+            self.invalidate_cached((id,))
+            return self.mapper(data)
 
         except (IntegrityError, Exception):
             raise
     
+    def update_users(
+        self,
+        user: UserUpdate,
+        ids: Iterable[int],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[SomeUser]:
+        """
+        ## Пакетное обновление пользователей одинаковыми значениями.
+
+        Записываются только поля, явно заданные в `user`, одним запросом
+        `UPDATE ... WHERE id IN (...)` на пакет идентификаторов.
+
+        Args:
+            user (UserUpdate): Новые значения полей.
+            ids (Iterable[int]): Идентификаторы пользователей.
+            batch_size (int): Максимальное количество идентификаторов в одном запросе. По умолчанию `DEFAULT_BATCH_SIZE`.
+
+        Returns:
+            list[SomeUser]: Обновлённые записи.
+
+        Raises:
+            ValueError: Если в `user` не задано ни одно поле.
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        try:
+            ids = list(ids)
+            result = self.update_fields_by_ids(
+                self.table_name, ids, user.model_dump(exclude_unset=True), batch_size=batch_size
+            )
+            self.invalidate_cached(ids)
+            return self.mapper.many(result)
+
+        except (IntegrityError, Exception):
+            raise
+
     def get_user(self, id: int) -> SomeUser:
         """
         ## Получение информации о конкретном пользователе.
@@ -139,22 +362,89 @@ class UserDAO(BaseDAO):
             Exception: Для обработки других исключений.
         """
         try:
-            query = GET_ONE.format(
-                table_name=self.table_name,
-                    main_field=UserTableFields.ID
-            )
-            data = self.get_one(query, (id,))
-            return SomeUser(
-                id=data[0],
-                name=data[1],
-                email=data[2],
-                registration_date=data[3],
-                is_active=data[4]
-            )
+            query = self.sql_get_one
+            return self.get_cached(id, lambda: self.mapper(self.get_one(query, (id,))))
 
         except (IntegrityError, Exception):
             raise
     
+    def get_users_with_orders(
+        self,
+        ids: Optional[Iterable[int]] = None,
+        batch_size: int = DEFAULT_FETCH_SIZE,
+    ) -> list[UserWithOrders]:
+        """
+        ## Получение пользователей вместе с их заказами.
+
+        Пользователи и заказы читаются одним запросом `LEFT JOIN` по индексу
+        `orders.user_id` и группируются во вложенные модели. Пользователи
+        без заказов возвращаются с пустым списком `orders`.
+
+        Args:
+            ids (Optional[Iterable[int]]): Идентификаторы пользователей, `None` — все пользователи. По умолчанию `None`.
+            batch_size (int): Максимальное количество идентификаторов в одном запросе. По умолчанию `DEFAULT_FETCH_SIZE`.
+
+        Returns:
+            list[UserWithOrders]: Пользователи с заказами: в порядке `ids` или, если они не заданы, идентификаторов.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        try:
+            if ids is None:
+                rows = self.get_all(self.sql_get_with_orders)
+            else:
+                ids = list(dict.fromkeys(ids))
+                rows = self.execute_by_ids(
+                    GET_WITH_CHILDREN_BY_IDS, ids, batch_size,
+                        table_name=self.table_name,
+                        child_table=TablesName.ORDERS,
+                        foreign_key=OrdersTableFields.USER_ID,
+                        main_field=UserTableFields.ID,
+                )
+
+            split = len(USER_COLUMNS)
+            users: list[UserWithOrders] = []
+            for _, group in groupby(rows, key=lambda row: row[0]):
+                group = list(group)
+                user = self.with_orders_mapper(group[0])
+                user.orders = [self.order_mapper(row[split:]) for row in group if row[split] is not None]
+                users.append(user)
+
+            if ids is None:
+                return users
+            by_id = {user.id: user for user in users}
+            return [by_id[id] for id in ids if id in by_id]
+
+        except (IntegrityError, Exception):
+            raise
+
+    def get_users_by_ids(self, ids: Iterable[int], batch_size: int = DEFAULT_FETCH_SIZE) -> BatchResult[SomeUser]:
+        """
+        ## Пакетное получение пользователей по идентификаторам.
+
+        Заменяет вызов `get_user` в цикле: идентификаторы читаются пакетами
+        запросов `IN (...)` вместо отдельного запроса на каждый.
+
+        Args:
+            ids (Iterable[int]): Идентификаторы пользователей.
+            batch_size (int): Максимальное количество идентификаторов в одном запросе. По умолчанию `DEFAULT_FETCH_SIZE`.
+
+        Returns:
+            BatchResult[SomeUser]: Найденные записи в порядке идентификаторов и ненайденные идентификаторы.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        try:
+            rows, missing = self.get_by_ids(self.table_name, ids, batch_size=batch_size)
+            return BatchResult[SomeUser](items=self.mapper.many(rows), missing=missing)
+
+        except (IntegrityError, Exception):
+            raise
+
     def delete_user(self, id: int) -> SomeUser:
         """
         ## Удаление пользователя из базы данных.
@@ -170,22 +460,129 @@ class UserDAO(BaseDAO):
             Exception: Для обработки других исключений.
         """
         try:
-            query = DELETE_ONE.format(
-                table_name=self.table_name,
-                    main_field=UserTableFields.ID
-            )
+            query = self.sql_delete_one
+            order_ids = self._cached_order_ids((id,))
             data = self.delete_one(query, (id,))
-            return SomeUser(
-                id=data[0],
-                name=data[1],
-                email=data[2],
-                registration_date=data[3],
-                is_active=data[4]
+            self._invalidate_users((id,), order_ids)
+            return self.mapper(data)
+
+        except (IntegrityError, Exception):
+            raise
+
+
+    def insert_users(
+        self,
+        users: Iterable[UserSchema],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        returning: bool = False,
+    ) -> list[SomeUser]:
+        """
+        ## Пакетная вставка пользователей.
+
+        Пользователи вставляются пакетами по `batch_size`, по одной транзакции на пакет.
+
+        Args:
+            users (Iterable[UserSchema]): Пользователи для вставки.
+            batch_size (int): Количество записей в одной транзакции. По умолчанию `DEFAULT_BATCH_SIZE`.
+            returning (bool): Возвращать ли созданных пользователей. По умолчанию `False`.
+
+        Returns:
+            list[SomeUser]: Созданные пользователи или пустой список, если `returning=False`.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности (например, дублирование уникального поля).
+            Exception: Для обработки других исключений.
+        """
+        try:
+            query = self.sql_create_one if returning else self.sql_create_many
+            result = self.insert_many(
+                query,
+                ((user.name, user.email, user.registration_date, user.is_active) for user in users),
+                batch_size=batch_size,
+                returning=returning,
             )
+            return self.mapper.many(result)
 
         except (IntegrityError, Exception):
             raise
 
+    def delete_users(
+        self,
+        ids: Iterable[int],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        returning: bool = False,
+    ) -> list[SomeUser]:
+        """
+        ## Пакетное удаление пользователей.
+
+        Args:
+            ids (Iterable[int]): Идентификаторы удаляемых пользователей.
+            batch_size (int): Количество записей в одной транзакции. По умолчанию `DEFAULT_BATCH_SIZE`.
+            returning (bool): Возвращать ли удалённых пользователей. По умолчанию `False`.
+
+        Returns:
+            list[SomeUser]: Удалённые пользователи или пустой список, если `returning=False`.
+
+        Raises:
+            IntegrityError: Если возникает ошибка целостности.
+            Exception: Для обработки других исключений.
+        """
+        try:
+            query = self.sql_delete_one if returning else self.sql_delete_many
+            ids = list(ids)
+            order_ids = self._cached_order_ids(ids)
+            result = self.delete_many(query, ((id,) for id in ids), batch_size=batch_size, returning=returning)
+            self._invalidate_users(ids, order_ids)
+            return self.mapper.many(result)
+
+        except (IntegrityError, Exception):
+            raise
+
+
+    def _cached_order_ids(self, ids: Sequence[int]) -> frozenset[int]:
+        """
+        ## Идентификаторы заказов пользователей перед их удалением.
+
+        Платежи ссылаются на заказы, а не на пользователей, и после каскадного
+        удаления заказов их связь с пользователем уже не найти. Запрос выполняется,
+        только если в кэше есть платежи.
+
+        Args:
+            ids (Sequence[int]): Идентификаторы удаляемых пользователей.
+
+        Returns:
+            frozenset[int]: Идентификаторы заказов этих пользователей.
+        """
+        if not ids or not is_cached(TablesName.PAYMENTS):
+            return frozenset()
+        rows = self.execute_by_ids(
+            GET_IDS_BY_FIELD,
+            ids,
+            table_name=TablesName.ORDERS,
+            main_field=OrdersTableFields.ID,
+            field=OrdersTableFields.USER_ID,
+        )
+        return frozenset(row[0] for row in rows)
+
+    def _invalidate_users(self, ids: Iterable[int], order_ids: frozenset[int] = frozenset()) -> None:
+        """
+        ## Инвалидирует кэш удалённых пользователей и их каскадно удалённых заказов и платежей.
+
+        Args:
+            ids (Iterable[int]): Идентификаторы удалённых пользователей.
+            order_ids (frozenset[int]): Идентификаторы заказов этих пользователей, см. `_cached_order_ids`.
+        """
+        self.invalidate_cached(ids)
+        deleted = frozenset(ids)
+
+        def invalidate_orders() -> None:
+            invalidate_cascade(TablesName.ORDERS, lambda order: order.user_id in deleted)
+            if order_ids:
+                invalidate_cascade(TablesName.PAYMENTS, lambda payment: payment.order_id in order_ids)
+
+        invalidate_orders()
+        self.pool.call_on_release(invalidate_orders)
+
 
 
 user_dao = UserDAO()
\ No newline at end of file
@@ -0,0 +1,237 @@
+from atexit import register
+from concurrent.futures import Future
+from queue import Empty, SimpleQueue
+from threading import Lock, Thread
+from time import monotonic, perf_counter
+from typing import Any, Callable, NamedTuple, Optional
+
+from core.db.pool import ConnectionPool
+from core.modules.app_logger import app_logger
+
+from .instrumentation import instrumentation, QueryEvent
+
+
+
+class WriteOperation(NamedTuple):
+    """
+    ## Операция записи в очереди.
+
+    Attributes:
+        sql (str): `SQL`-запрос.
+        parameters (tuple): Параметры запроса.
+        mapper (Optional[Callable[[tuple], Any]]): Преобразование строки `RETURNING *` в результат.
+        future (Future): Результат операции.
+    """
+    sql: str
+    parameters: tuple
+    mapper: Optional[Callable[[tuple], Any]]
+    future: Future
+
+
+# Признак остановки потока записи
+_STOP = object()
+
+
+
+class GroupCommitWriter:
+    """
+    ## Единственный поток записи с групповой фиксацией.
+
+    Операции записи помещаются в очередь и выполняются выделенным потоком.
+    Поток собирает операции в пакет — до `max_batch` штук или пока с момента
+    поступления первой не пройдёт `max_latency` секунд — и выполняет пакет
+    в одной транзакции с одной фиксацией. Каждая операция выполняется в своей
+    точке сохранения, поэтому ошибка одной не отменяет остальные.
+    Результат операции (строка `RETURNING *`) становится доступен через `Future`
+    только после фиксации транзакции.
+
+    Attributes:
+        pool (ConnectionPool): Пул подключений к базе данных.
+        max_batch (int): Максимальное количество операций в одной транзакции.
+        max_latency (float): Максимальная задержка начала пакета (в секундах).
+    """
+    def __init__(self, pool: ConnectionPool, max_batch: int = 500, max_latency: float = 0.005) -> None:
+        """
+        ## Инициализация и запуск потока записи.
+
+        Args:
+            pool (ConnectionPool): Пул подключений к базе данных.
+            max_batch (int): Максимальное количество операций в транзакции. По умолчанию `500`.
+            max_latency (float): Максимальная задержка начала пакета. По умолчанию `0.005`.
+        """
+        if max_batch < 1:
+            raise ValueError('Размер пакета должен быть положительным')
+        self.pool = pool
+        self.max_batch = max_batch
+        self.max_latency = max_latency
+        self._queue: SimpleQueue = SimpleQueue()
+        self._closed = False
+        self._thread = Thread(target=self._run, name=f'writer-{pool.database}', daemon=True)
+        self._thread.start()
+
+    def submit(
+        self,
+        sql: str,
+        parameters: tuple = (),
+        mapper: Optional[Callable[[tuple], Any]] = None,
+    ) -> Future:
+        """
+        ## Ставит операцию записи в очередь.
+
+        Args:
+            sql (str): `SQL`-запрос на изменение данных.
+            parameters (tuple): Параметры для `SQL`-запроса. Defaults to ().
+            mapper (Optional[Callable[[tuple], Any]]): Преобразование строки `RETURNING *`. Defaults to None.
+
+        Returns:
+            Future: Результат операции после фиксации транзакции.
+
+        Raises:
+            RuntimeError: Если поток записи остановлен.
+        """
+        if self._closed:
+            raise RuntimeError('Поток записи остановлен')
+        future: Future = Future()
+        self._queue.put(WriteOperation(sql, parameters, mapper, future))
+        return future
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        ## Останавливает поток записи, предварительно выполнив все операции в очереди.
+
+        Args:
+            timeout (Optional[float]): Время ожидания завершения потока. Defaults to None.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _collect(self, first: WriteOperation) -> tuple[list[WriteOperation], bool]:
+        """
+        ## Собирает пакет операций, начиная с `first`.
+
+        Args:
+            first (WriteOperation): Первая операция пакета.
+
+        Returns:
+            tuple[list[WriteOperation], bool]: Пакет и признак запроса остановки.
+        """
+        batch = [first]
+        deadline = monotonic() + self.max_latency
+        while len(batch) < self.max_batch:
+            remaining = deadline - monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        """
+        ## Основной цикл потока записи.
+        """
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch, stop = self._collect(item)
+            try:
+                self._execute(batch)
+            except Exception as ex:
+                app_logger.exception('Ошибка групповой фиксации', exc_info=ex)
+                for operation in batch:
+                    if not operation.future.done():
+                        operation.future.set_exception(ex)
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except Empty:
+                break
+            if item is not _STOP:
+                item.future.set_exception(RuntimeError('Поток записи остановлен'))
+
+    def _execute(self, batch: list[WriteOperation]) -> None:
+        """
+        ## Выполняет пакет операций в одной транзакции.
+
+        Args:
+            batch (list[WriteOperation]): Пакет операций.
+        """
+        results: list[tuple[WriteOperation, Any]] = []
+        with self.pool.connection() as connection:
+            try:
+                connection.execute('BEGIN')
+                for operation in batch:
+                    if not operation.future.set_running_or_notify_cancel():
+                        continue
+                    connection.execute('SAVEPOINT write_behind')
+                    observed = bool(instrumentation.listeners)
+                    started = perf_counter() if observed else 0.0
+                    try:
+                        row = connection.execute(operation.sql, operation.parameters).fetchone()
+                        result = operation.mapper(row) if operation.mapper and row is not None else row
+                    except Exception as ex:
+                        connection.execute('ROLLBACK TO write_behind')
+                        operation.future.set_exception(ex)
+                        if observed:
+                            instrumentation.emit(QueryEvent(operation.sql, 'GroupCommitWriter', perf_counter() - started, 0, ex))
+                    else:
+                        results.append((operation, result))
+                        if observed:
+                            instrumentation.emit(
+                                QueryEvent(operation.sql, 'GroupCommitWriter', perf_counter() - started, int(row is not None))
+                            )
+                    finally:
+                        connection.execute('RELEASE write_behind')
+                started = perf_counter()
+                connection.commit()
+                if instrumentation.listeners:
+                    instrumentation.emit(QueryEvent('COMMIT', 'GroupCommitWriter', perf_counter() - started, 0))
+
+            except Exception:
+                connection.rollback()
+                raise
+        for operation, result in results:
+            operation.future.set_result(result)
+
+
+
+_writers: dict[str, GroupCommitWriter] = {}
+_writers_lock = Lock()
+
+
+def get_writer(pool: ConnectionPool, **options) -> GroupCommitWriter:
+    """
+    ## Возвращает общий поток записи для базы данных пула.
+
+    Поток создаётся при первом обращении, параметры `options` учитываются только в этот момент.
+
+    Args:
+        pool (ConnectionPool): Пул подключений к базе данных.
+        **options: Параметры `GroupCommitWriter`.
+
+    Returns:
+        GroupCommitWriter: Поток записи.
+    """
+    with _writers_lock:
+        writer = _writers.get(pool.database)
+        if writer is None:
+            writer = _writers[pool.database] = GroupCommitWriter(pool, **options)
+        return writer
+
+
+@register
+def _close_writers() -> None:
+    """
+    ## Дописывает очереди всех потоков записи при завершении процесса.
+    """
+    with _writers_lock:
+        writers = list(_writers.values())
+    for writer in writers:
+        writer.close()
@@ -1,62 +1,124 @@
-from traceback import print_exc
+from sqlite3 import Connection
+from threading import Lock
+from typing import Callable, Hashable, Iterable, Optional
 
-from sqlite3 import connect
-from sqlite3 import Cursor, Connection
-
-from .models import ALL_TABLES
+from .indexes import Index
+from .models import ALL_INDEXES, ALL_TABLES, SCHEMA_VERSION
+from .pool import ConnectionPool, get_pool
 
 from core.modules.app_logger import app_logger
 
 
+# Подготовки, уже запланированные в этом процессе: (файл базы данных, ключ подготовки)
+_prepared: set[tuple[str, Hashable]] = set()
+_prepared_lock = Lock()
+
+
+
+def ensure_schema(connection: Connection) -> None:
+    """
+    ## Создаёт таблицы и индексы `ALL_TABLES`/`ALL_INDEXES`, если схема базы устарела.
+
+    Версия схемы хранится в `PRAGMA user_version`: если она не меньше `SCHEMA_VERSION`,
+    `DDL` не выполняется. Иначе все скрипты и новая версия применяются одной транзакцией.
+
+    Args:
+        connection (Connection): Подключение.
+
+    Raises:
+        Exception: Ошибка `DDL` после отката транзакции. Подготовка остаётся в очереди
+            пула и повторяется при следующей выдаче подключения.
+    """
+    if connection.execute('PRAGMA user_version').fetchone()[0] >= SCHEMA_VERSION:
+        return
+    script = ''.join((
+        'BEGIN IMMEDIATE;',
+        *ALL_TABLES,
+        *(index.sql for index in ALL_INDEXES),
+        f'PRAGMA user_version = {SCHEMA_VERSION};',
+        'COMMIT;',
+    ))
+    try:
+        connection.executescript(script)
+    except Exception as ex:
+        connection.rollback()
+        app_logger.exception('Ошибка при создании таблиц', exc_info=ex)
+        raise
+
+
 
 class DataBase:
     """
     ## Класс для работы с базой данных `SQLite`.
 
-    Этот класс управляет подключением к базе данных, созданием таблиц и выполнением запросов.
+    Этот класс управляет пулом подключений к базе данных и созданием таблиц.
+    Все экземпляры, работающие с одним файлом базы данных, используют общий пул.
+    Создание экземпляра не открывает подключений: схема проверяется один раз
+    на процесс и файл базы данных при первой выдаче подключения из пула.
     
     Attributes:
         db_name (str): Имя базы данных, включая расширение `.db`.
-        connection (Connection): Объект подключения к базе данных.
-        cursor (Cursor): Объект курсора для выполнения SQL-запросов.
+        pool (ConnectionPool): Общий пул подключений к базе данных.
     """
-    def __init__(self, db_name: str = 'db_name') -> None:
+    def __init__(self, db_name: str = 'db_name', **pool_options) -> None:
         """
         ## Инициализация класса `DataBase`.
 
-        Создаёт подключение к базе данных и инициализирует курсор.
+        Получает общий пул подключений к базе данных.
 
         Args:
             db_name (str): Имя базы данных `НЕ УКАЗЫВАТЬ .db`. По умолчанию `'db_name'`.
+            **pool_options: Параметры `ConnectionPool`, применяются при первом создании пула.
         """        
         self.db_name = db_name + '.db'
-        self.connection: Connection = connect(self.db_name)
-        self.cursor: Cursor = self.connection.cursor()
+        self.pool: ConnectionPool = get_pool(self.db_name, **pool_options)
         self.__post_init_()
         
     def __post_init_(self):
         """ 
         ## Вызывает методы, необходимые для работы класса.
 
-        Этот метод вызывается после инициализации объекта и отвечает за создание таблиц.
+        Этот метод вызывается после инициализации объекта и планирует проверку схемы.
+        Для подключений только на чтение (`query_only`) схема не создаётся.
         """
-        self.__create_tables()
-    
-    def __create_tables(self):
-        """ 
-        ## Создаёт таблицы в базе данных.
+        if self.pool.profile.query_only:
+            return
+        self._prepare('schema', ensure_schema)
+
+    def _prepare(self, key: Hashable, initializer: Callable[[Connection], None]) -> None:
+        """
+        ## Планирует подготовку базы данных один раз на процесс и файл базы данных.
+
+        Args:
+            key (Hashable): Ключ подготовки; повторные вызовы с тем же ключом игнорируются.
+            initializer (Callable[[Connection], None]): Подготовка, выполняемая при первой выдаче подключения.
+        """
+        with _prepared_lock:
+            if (self.pool.database, key) in _prepared:
+                return
+            _prepared.add((self.pool.database, key))
+        self.pool.add_initializer(initializer)
 
-        Этот метод выполняет `SQL`-скрипты для создания таблиц, определённых в `ALL_TABLES`.
+    def create_indexes(self, indexes: Iterable[Index], connection: Optional[Connection] = None) -> None:
         """
-        def _create(t: str):
+        ## Создаёт индексы, если они ещё не существуют.
+
+        Args:
+            indexes (Iterable[Index]): Описания индексов.
+            connection (Optional[Connection]): Подключение, `None` — взять из пула. По умолчанию `None`.
+        """
+        if connection is None:
+            with self.pool.connection() as connection:
+                self.create_indexes(indexes, connection)
+            return
+        for index in indexes:
             try:
-                self.cursor.executescript(t)
-                self.connection.commit()
+                connection.executescript(index.sql)
+                connection.commit()
             except Exception as ex:
-                self.connection.rollback()
-                app_logger.exception('Ошибка при создании таблиц', exc_info=ex)
-        [_create(table) for table in ALL_TABLES]
-        
+                connection.rollback()
+                app_logger.exception(f'Ошибка при создании индекса {index.index_name}', exc_info=ex)
+
 
 
 db = DataBase('raw_ipr')
\ No newline at end of file
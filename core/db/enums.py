@@ -5,6 +5,12 @@ from enum import Enum
 # Названия таблиц
 TableNames = Literal['users', 'orders', 'payments']
 
+# Формат результатов чтения: модели `Pydantic` или компактные объекты строк
+ResultMode = Literal['model', 'row']
+
+# Агрегатные функции `SQL`, доступные в `aggregate`
+AggregateFunc = Literal['count', 'sum', 'avg', 'min', 'max']
+
 
 class OrderStatus(Enum):
     """
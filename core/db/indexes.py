@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+# Создание индекса
+CREATE_INDEX = """
+    CREATE {unique}INDEX IF NOT EXISTS {index_name}
+    ON {table_name} ({fields}){where};
+"""
+
+
+
+@dataclass(frozen=True)
+class Index:
+    """
+    ## Декларативное описание индекса.
+
+    Attributes:
+        table_name (str): Таблица, для которой строится индекс.
+        fields (tuple[str, ...]): Поля индекса, для составного — в порядке использования.
+        unique (bool): Уникальный индекс.
+        where (Optional[str]): Условие частичного индекса, например `'status = 1'`.
+        name (Optional[str]): Имя индекса, по умолчанию `ix_<таблица>_<поля>`.
+
+    Example:
+        >>> Index(TablesName.ORDERS, (OrdersTableFields.USER_ID, OrdersTableFields.ORDER_DATE))
+    """
+    table_name: str
+    fields: tuple[str, ...]
+    unique: bool = False
+    where: Optional[str] = None
+    name: Optional[str] = None
+
+    @property
+    def index_name(self) -> str:
+        """
+        ## Имя индекса в базе данных.
+        """
+        return self.name or f'ix_{self.table_name}_{"_".join(self.fields)}'
+
+    @property
+    def sql(self) -> str:
+        """
+        ## `SQL`-запрос на создание индекса.
+        """
+        return CREATE_INDEX.format(
+            unique='UNIQUE ' if self.unique else '',
+            index_name=self.index_name,
+            table_name=self.table_name,
+            fields=', '.join(self.fields),
+            where=f' WHERE {self.where}' if self.where else '',
+        )
@@ -58,6 +58,17 @@ class UserTableFields(StaticFields):
     IS_ACTIVE = 'is_active'
 
 
+# Столбцы таблицы пользователей в порядке `SELECT *`
+USER_COLUMNS: tuple[str, ...] = (
+    UserTableFields.ID,
+    UserTableFields.FIRST_NAME,
+    UserTableFields.EMAIL,
+    UserTableFields.REG_DATE,
+    UserTableFields.IS_ACTIVE,
+    UserTableFields.UPDATED_AT,
+)
+
+
 class OrdersTableFields(StaticFields):
     """
     ## Маппинги полей таблицы заказов.
@@ -80,6 +91,17 @@ class OrdersTableFields(StaticFields):
     STATUS = 'status'
 
 
+# Столбцы таблицы заказов в порядке `SELECT *`
+ORDER_COLUMNS: tuple[str, ...] = (
+    OrdersTableFields.ID,
+    OrdersTableFields.USER_ID,
+    OrdersTableFields.ORDER_DATE,
+    OrdersTableFields.TOTAL_AMOUNT,
+    OrdersTableFields.STATUS,
+    OrdersTableFields.UPDATED_AT,
+)
+
+
 class PaymentsTableFields(StaticFields):
     """
     ## Маппинги полей таблицы платежей.
@@ -89,12 +111,25 @@ class PaymentsTableFields(StaticFields):
     
     Attributes:
         ID (str): Уникальный идентификатор записи (Унаследован).
+        USER_ID (str): Идентификатор пользователя, совершившего платеж.
         ORDER_ID (str): Идентификатор заказа, к которому относится платеж.
         PAYMENT_DATE (str): Дата платежа.
         PAY_METHOD (str): Метод оплаты.
         CREATED_AT (str): Дата и время создания записи (Унаследован).
         UPDATED_AT (str): Дата и время последнего обновления записи (Унаследован).
     """  
+    USER_ID = 'user_id'
     ORDER_ID = 'order_id'
     PAYMENT_DATE = 'payment_date'
-    PAY_METHOD = 'payment_method'
\ No newline at end of file
+    PAY_METHOD = 'payment_method'
+
+
+# Столбцы таблицы платежей в порядке `SELECT *`
+PAYMENT_COLUMNS: tuple[str, ...] = (
+    PaymentsTableFields.ID,
+    PaymentsTableFields.USER_ID,
+    PaymentsTableFields.ORDER_ID,
+    PaymentsTableFields.PAYMENT_DATE,
+    PaymentsTableFields.PAY_METHOD,
+    PaymentsTableFields.UPDATED_AT,
+)
\ No newline at end of file
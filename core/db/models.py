@@ -1,3 +1,4 @@
+from .indexes import Index
 from .mapping import *
 
 
@@ -31,12 +32,60 @@ CREATE_ORDERS_TABLE = """
 """.format(table_name=TablesName.ORDERS, **ALL_STATIC_FIELDS)
 
 
+# Платежи ссылаются на заказы.
+# `user_id` — плательщик; внешний ключ на пользователей не задан, чтобы не требовать
+# ещё одного индекса при массовой загрузке: платежи удаляются каскадно вместе с заказами
+CREATE_PAYMENTS_TABLE = """
+    CREATE TABLE IF NOT EXISTS {table_name} (
+        {field_id},
+        user_id INT NOT NULL,
+        order_id INT NOT NULL,
+        payment_date DATE DEFAULT CURRENT_DATE,
+        payment_method INTEGER NOT NULL,
+        {field_updated_at},
+        CONSTRAINT fk_payments_orders
+            FOREIGN KEY (order_id)
+            REFERENCES orders(id)
+            ON DELETE CASCADE
+    );
+""".format(table_name=TablesName.PAYMENTS, **ALL_STATIC_FIELDS)
+
+
+
+# Версия схемы в `PRAGMA user_version`.
+# Увеличивается при любом изменении `ALL_TABLES` или `ALL_INDEXES`
+SCHEMA_VERSION = 3
+
 
 # Кортеж с запросами на создание таблицы
 ALL_TABLES: tuple[
     str,
     str,
+    str,
 ] = (
     CREATE_USER_TABLE,
     CREATE_ORDERS_TABLE,
-)
\ No newline at end of file
+    CREATE_PAYMENTS_TABLE,
+)
+
+
+# Индексы, создаваемые при запуске вместе с таблицами.
+# Поиск по `users.email` обслуживает автоматический индекс ограничения `UNIQUE`.
+# Индекс по одному полю содержит `rowid`, поэтому служит и индексом (поле, `id`).
+ALL_INDEXES: tuple[Index, ...] = (
+    # Keyset-пагинация пользователей по (`name`, `id`) и (`registration_date`, `id`)
+    Index(TablesName.USERS, (UserTableFields.FIRST_NAME, UserTableFields.ID)),
+    Index(TablesName.USERS, (UserTableFields.REG_DATE, UserTableFields.ID)),
+    # Заказы пользователя и каскадное удаление по `fk_orders_users`
+    Index(TablesName.ORDERS, (OrdersTableFields.USER_ID,)),
+    # Фильтрация по статусу заказа
+    Index(TablesName.ORDERS, (OrdersTableFields.STATUS,)),
+    # Диапазоны дат и keyset-пагинация по (`order_date`, `id`)
+    Index(TablesName.ORDERS, (OrdersTableFields.ORDER_DATE, OrdersTableFields.ID)),
+    # Keyset-пагинация заказов по (`total_amount`, `id`)
+    Index(TablesName.ORDERS, (OrdersTableFields.TOTAL_AMOUNT, OrdersTableFields.ID)),
+    # Агрегация по дням: фильтрация и группировка по `date(order_date)`
+    Index(TablesName.ORDERS, (f'date({OrdersTableFields.ORDER_DATE})',), name='ix_orders_order_day'),
+    # Платежи заказа и каскадное удаление по `fk_payments_orders`
+    Index(TablesName.PAYMENTS, (PaymentsTableFields.ORDER_ID,)),
+)
@@ -0,0 +1,444 @@
+from collections import deque
+from contextlib import contextmanager
+from threading import Condition, Lock, RLock, Thread, current_thread, local
+from time import monotonic
+from typing import Callable, Iterator, Optional, Union
+
+from sqlite3 import connect
+from sqlite3 import Connection, Error
+
+from core.modules.app_logger import app_logger
+
+from .profiles import ConnectionProfile, ProfileNames, get_profile
+
+
+
+class PoolTimeoutError(Exception):
+    """
+    ## Не удалось получить подключение из пула за отведённое время.
+    """
+
+
+class ConnectionPool:
+    """
+    ## Ограниченный потокобезопасный пул подключений к `SQLite`.
+
+    Подключения выдаются потокам во временное пользование. Повторный запрос
+    подключения из того же потока возвращает уже выданное ему подключение,
+    поэтому вложенные вызовы `DAO` работают с одним и тем же соединением.
+
+    Attributes:
+        database (str): Путь к файлу базы данных.
+        max_size (int): Максимальное количество открытых подключений.
+        timeout (float): Время ожидания снятия блокировки базы данных `SQLite` (в секундах).
+        checkout_timeout (float): Время ожидания свободного подключения из пула (в секундах).
+        check_same_thread (bool): Привязывать ли подключения к создавшему их потоку.
+        health_check (bool): Проверять ли подключение запросом `SELECT 1` перед выдачей.
+        cached_statements (int): Размер кэша подготовленных выражений каждого подключения.
+        profile (ConnectionProfile): Профиль `PRAGMA`, применяемый к каждому новому подключению.
+        checkouts (int): Количество выдач подключений (без повторных выдач в том же потоке).
+        waits (int): Количество выдач, ожидавших освобождения подключения.
+        wait_time (float): Суммарное время ожидания свободного подключения (в секундах).
+        timeouts (int): Количество выдач, завершившихся `PoolTimeoutError`.
+    """
+    def __init__(
+        self,
+        database: str,
+        max_size: int = 5,
+        timeout: float = 5.0,
+        checkout_timeout: float = 30.0,
+        check_same_thread: bool = False,
+        health_check: bool = True,
+        cached_statements: int = 256,
+        profile: Union[ProfileNames, ConnectionProfile] = 'throughput',
+    ) -> None:
+        """
+        ## Инициализация пула подключений.
+
+        Подключения открываются лениво, при первом запросе.
+
+        Args:
+            database (str): Путь к файлу базы данных.
+            max_size (int): Максимальное количество открытых подключений. По умолчанию `5`.
+            timeout (float): Время ожидания блокировки `SQLite`. По умолчанию `5.0`.
+            checkout_timeout (float): Время ожидания свободного подключения. По умолчанию `30.0`.
+            check_same_thread (bool): Привязка подключений к потоку. По умолчанию `False`.
+            health_check (bool): Проверка подключения перед выдачей. По умолчанию `True`.
+            cached_statements (int): Размер кэша подготовленных выражений. По умолчанию `256`.
+            profile (Union[ProfileNames, ConnectionProfile]): Профиль подключения или имя
+                встроенного профиля из `PROFILES`. По умолчанию `'throughput'`.
+        """
+        if max_size < 1:
+            raise ValueError('Размер пула должен быть положительным')
+        self.database = database
+        self.max_size = max_size
+        self.timeout = timeout
+        self.checkout_timeout = checkout_timeout
+        self.check_same_thread = check_same_thread
+        self.health_check = health_check
+        self.cached_statements = cached_statements
+        self.profile: ConnectionProfile = get_profile(profile)
+        self._idle: deque[Connection] = deque()
+        # Свободные подключения, закреплённые за потоками (`check_same_thread=True`)
+        self._parked: dict[Thread, Connection] = {}
+        self._size = 0
+        self._condition = Condition(RLock())
+        self._local = local()
+        self._closed = False
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.timeouts = 0
+        self._initializers: list[Callable[[Connection], None]] = []
+        self._initializers_lock = Lock()
+
+    def _create(self) -> Connection:
+        """
+        ## Открывает новое подключение к базе данных и применяет к нему профиль.
+
+        Returns:
+            Connection: Новое подключение.
+        """
+        connection = connect(
+            self.database,
+            timeout=self.timeout,
+            check_same_thread=self.check_same_thread,
+            cached_statements=self.cached_statements,
+        )
+        try:
+            self.profile.apply(connection)
+        except Exception:
+            connection.close()
+            raise
+        return connection
+
+    def _is_healthy(self, connection: Connection) -> bool:
+        """
+        ## Проверяет, что подключение пригодно для работы.
+
+        Args:
+            connection (Connection): Проверяемое подключение.
+
+        Returns:
+            bool: `True`, если подключение отвечает на запрос.
+        """
+        if not self.health_check:
+            return True
+        try:
+            connection.execute('SELECT 1').fetchone()
+            return True
+        except Error:
+            return False
+
+    def _discard(self, connection: Connection) -> None:
+        """
+        ## Закрывает подключение и освобождает место в пуле.
+
+        Args:
+            connection (Connection): Закрываемое подключение.
+        """
+        try:
+            connection.close()
+        except Error as ex:
+            app_logger.exception('Ошибка при закрытии подключения', exc_info=ex)
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    def _take_idle(self) -> Optional[Connection]:
+        """
+        ## Забирает свободное подключение, доступное текущему потоку.
+
+        При `check_same_thread=True` подключение закреплено за потоком,
+        поэтому берётся только из его локального хранилища.
+
+        Returns:
+            Optional[Connection]: Свободное подключение или `None`.
+        """
+        if self.check_same_thread:
+            return self._parked.pop(current_thread(), None)
+        return self._idle.pop() if self._idle else None
+
+    def _prune_parked(self) -> None:
+        """
+        ## Освобождает места подключений, закреплённых за завершившимися потоками.
+
+        Закрыть подключение из чужого потока при `check_same_thread=True` нельзя,
+        поэтому пул отпускает последнюю ссылку на него и `sqlite3` закрывает его
+        при сборке мусора. Вызывается под `self._condition`.
+        """
+        for thread in [thread for thread in self._parked if not thread.is_alive()]:
+            del self._parked[thread]
+            self._size -= 1
+            self._condition.notify()
+
+    def _close_parked(self) -> None:
+        """
+        ## Закрывает свободное подключение текущего потока. Вызывается под `self._condition`.
+        """
+        connection = self._parked.pop(current_thread(), None)
+        if connection is not None:
+            connection.close()
+            self._size -= 1
+
+    def acquire(self) -> Connection:
+        """
+        ## Выдаёт подключение текущему потоку.
+
+        Если поток уже владеет подключением, возвращается оно же.
+
+        Returns:
+            Connection: Подключение к базе данных.
+
+        Raises:
+            PoolTimeoutError: Если свободное подключение не появилось за `checkout_timeout`.
+        """
+        held: Optional[Connection] = getattr(self._local, 'connection', None)
+        if held is not None:
+            self._local.depth += 1
+            return held
+
+        deadline = monotonic() + self.checkout_timeout
+        wait_started: Optional[float] = None
+        with self._condition:
+            while True:
+                if self._closed:
+                    self._close_parked()
+                    raise RuntimeError(f'Пул подключений к {self.database} закрыт')
+                connection = self._take_idle()
+                if connection is not None:
+                    break
+                if self.check_same_thread and self._size >= self.max_size:
+                    self._prune_parked()
+                if self._size < self.max_size:
+                    # Место в пуле резервируется под блокировкой, а подключение
+                    # открывается после неё, чтобы не задерживать другие потоки
+                    self._size += 1
+                    break
+                if wait_started is None:
+                    wait_started = monotonic()
+                    self.waits += 1
+                remaining = deadline - monotonic()
+                if remaining <= 0 or not self._condition.wait(remaining):
+                    self.timeouts += 1
+                    self.wait_time += monotonic() - wait_started
+                    raise PoolTimeoutError(
+                        f'Нет свободных подключений к {self.database} за {self.checkout_timeout} с'
+                    )
+            self.checkouts += 1
+            if wait_started is not None:
+                self.wait_time += monotonic() - wait_started
+
+        if connection is None:
+            try:
+                connection = self._create()
+            except Exception:
+                with self._condition:
+                    self._size -= 1
+                    self._condition.notify()
+                raise
+        elif not self._is_healthy(connection):
+            app_logger.warning('Подключение к %s не прошло проверку и будет пересоздано', self.database)
+            self._discard(connection)
+            return self.acquire()
+
+        self._local.connection = connection
+        self._local.depth = 1
+        self._local.callbacks = []
+        if self._initializers:
+            try:
+                self._initialize(connection)
+            except Exception:
+                self.release(connection)
+                raise
+        return connection
+
+    def add_initializer(self, initializer: Callable[[Connection], None]) -> None:
+        """
+        ## Регистрирует однократную подготовку базы данных (создание схемы, индексов).
+
+        Обработчик выполняется при следующей выдаче подключения до того, как его
+        получит вызывающий код; остальные потоки ждут завершения подготовки.
+        Пока подключения не запрашиваются, база данных не открывается.
+
+        Args:
+            initializer (Callable[[Connection], None]): Обработчик, получающий подключение.
+        """
+        with self._initializers_lock:
+            self._initializers.append(initializer)
+
+    def _initialize(self, connection: Connection) -> None:
+        """
+        ## Выполняет ожидающие обработчики подготовки базы данных.
+
+        Обработчик снимается с очереди только после успешного выполнения.
+
+        Args:
+            connection (Connection): Выданное подключение.
+        """
+        with self._initializers_lock:
+            while self._initializers:
+                self._initializers[0](connection)
+                self._initializers.pop(0)
+
+    def release(self, connection: Connection) -> None:
+        """
+        ## Возвращает подключение в пул.
+
+        Подключение возвращается только при выходе из самого внешнего `acquire`.
+        Незавершённая транзакция откатывается.
+
+        Args:
+            connection (Connection): Ранее выданное подключение.
+        """
+        if getattr(self._local, 'connection', None) is not connection:
+            raise RuntimeError('Подключение не принадлежит текущему потоку')
+        self._local.depth -= 1
+        if self._local.depth:
+            return
+        self._local.connection = None
+        try:
+            self._return(connection)
+        finally:
+            callbacks, self._local.callbacks = self._local.callbacks, []
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception as ex:
+                    app_logger.exception('Ошибка в обработчике возврата подключения', exc_info=ex)
+
+    def _return(self, connection: Connection) -> None:
+        """
+        ## Откатывает незавершённую транзакцию и кладёт подключение в пул.
+
+        Args:
+            connection (Connection): Освобождаемое подключение.
+        """
+        try:
+            if connection.in_transaction:
+                connection.rollback()
+        except Error:
+            self._discard(connection)
+            return
+
+        with self._condition:
+            if self._closed:
+                self._size -= 1
+                connection.close()
+                return
+            if self.check_same_thread:
+                self._parked[current_thread()] = connection
+            else:
+                self._idle.append(connection)
+            self._condition.notify()
+
+    def call_on_release(self, callback: Callable[[], None]) -> None:
+        """
+        ## Откладывает вызов до возврата подключения текущего потока в пул.
+
+        Используется для действий, которые должны выполняться после завершения
+        транзакции (например, `unit_of_work`), а не в её середине. Если поток
+        не владеет подключением, `callback` вызывается сразу.
+
+        Args:
+            callback (Callable[[], None]): Отложенное действие.
+        """
+        if getattr(self._local, 'connection', None) is None:
+            callback()
+        else:
+            self._local.callbacks.append(callback)
+
+    def in_transaction(self) -> bool:
+        """
+        ## Проверяет, открыта ли транзакция на подключении текущего потока.
+
+        Returns:
+            bool: `True`, если поток владеет подключением с незафиксированной транзакцией.
+        """
+        held: Optional[Connection] = getattr(self._local, 'connection', None)
+        return held is not None and held.in_transaction
+
+    @contextmanager
+    def connection(self) -> Iterator[Connection]:
+        """
+        ## Контекстный менеджер для временного получения подключения.
+
+        Yields:
+            Connection: Подключение к базе данных.
+        """
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    @property
+    def size(self) -> int:
+        """
+        ## Количество открытых подключений.
+        """
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        """
+        ## Количество свободных подключений, включая закреплённые за потоками.
+        """
+        with self._condition:
+            if self.check_same_thread:
+                self._prune_parked()
+            return len(self._idle) + len(self._parked)
+
+    def close(self) -> None:
+        """
+        ## Закрывает все свободные подключения пула.
+
+        Выданные подключения закрываются при возврате. При `check_same_thread=True`
+        свободное подключение текущего потока закрывается сразу, подключения
+        завершившихся потоков освобождаются, а подключения других живых потоков
+        закрываются ими самими при следующем обращении к пулу или при завершении потока.
+        """
+        with self._condition:
+            self._closed = True
+            while self._idle:
+                self._idle.pop().close()
+                self._size -= 1
+            self._close_parked()
+            self._prune_parked()
+            self._condition.notify_all()
+
+
+
+_pools: dict[str, ConnectionPool] = {}
+_pools_lock = RLock()
+
+
+def get_pool(database: str, **options) -> ConnectionPool:
+    """
+    ## Возвращает общий пул подключений для файла базы данных.
+
+    Пул создаётся при первом обращении, параметры `options` учитываются только в этот момент.
+
+    Args:
+        database (str): Путь к файлу базы данных.
+        **options: Параметры `ConnectionPool`.
+
+    Returns:
+        ConnectionPool: Пул подключений к базе данных.
+    """
+    with _pools_lock:
+        pool = _pools.get(database)
+        if pool is None:
+            pool = _pools[database] = ConnectionPool(database, **options)
+        return pool
+
+
+def get_pools() -> list[ConnectionPool]:
+    """
+    ## Возвращает все созданные пулы подключений.
+
+    Returns:
+        list[ConnectionPool]: Пулы подключений.
+    """
+    with _pools_lock:
+        return list(_pools.values())
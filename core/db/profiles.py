@@ -0,0 +1,111 @@
+from dataclasses import dataclass
+from typing import Literal, Optional, Union
+
+from sqlite3 import Connection
+
+
+# Названия встроенных профилей подключения
+ProfileNames = Literal['durable', 'throughput', 'read_only']
+
+
+
+@dataclass(frozen=True)
+class ConnectionProfile:
+    """
+    ## Профиль настройки подключения `SQLite`.
+
+    Набор `PRAGMA`, применяемых к каждому новому подключению пула.
+    Поля со значением `None` оставляют настройку `SQLite` по умолчанию.
+
+    Attributes:
+        journal_mode (Optional[str]): Режим журнала (`'WAL'`, `'DELETE'`, ...). Сохраняется в файле базы данных.
+        synchronous (Optional[str]): Уровень синхронизации с диском (`'FULL'`, `'NORMAL'`, `'OFF'`).
+        mmap_size (Optional[int]): Размер отображаемой в память части файла (в байтах).
+        cache_size (Optional[int]): Размер кэша страниц: положительный — в страницах, отрицательный — в КиБ.
+        temp_store (Optional[str]): Хранилище временных таблиц и индексов (`'DEFAULT'`, `'FILE'`, `'MEMORY'`).
+        busy_timeout (Optional[int]): Время ожидания снятия блокировки (в миллисекундах).
+        foreign_keys (bool): Проверять внешние ключи и выполнять `ON DELETE CASCADE`.
+        query_only (bool): Запретить изменение данных через подключение.
+    """
+    journal_mode: Optional[str] = 'WAL'
+    synchronous: Optional[str] = 'NORMAL'
+    mmap_size: Optional[int] = None
+    cache_size: Optional[int] = None
+    temp_store: Optional[str] = None
+    busy_timeout: Optional[int] = 5000
+    foreign_keys: bool = True
+    query_only: bool = False
+
+    @property
+    def pragmas(self) -> tuple[str, ...]:
+        """
+        ## Команды `PRAGMA` профиля в порядке применения.
+        """
+        values = {
+            'journal_mode': self.journal_mode,
+            'synchronous': self.synchronous,
+            'mmap_size': self.mmap_size,
+            'cache_size': self.cache_size,
+            'temp_store': self.temp_store,
+            'busy_timeout': self.busy_timeout,
+            'foreign_keys': 'ON' if self.foreign_keys else 'OFF',
+            'query_only': 'ON' if self.query_only else 'OFF',
+        }
+        return tuple(f'PRAGMA {name} = {value}' for name, value in values.items() if value is not None)
+
+    def apply(self, connection: Connection) -> None:
+        """
+        ## Применяет профиль к подключению.
+
+        Args:
+            connection (Connection): Новое подключение, вне транзакции.
+        """
+        for pragma in self.pragmas:
+            connection.execute(pragma).fetchall()
+
+
+
+PROFILES: dict[str, ConnectionProfile] = {
+    # Максимальная надёжность: каждая фиксация синхронизируется с диском
+    'durable': ConnectionProfile(
+        synchronous='FULL',
+    ),
+    # Высокая пропускная способность: `WAL` + `NORMAL` теряют при сбое питания
+    # только последние транзакции, но не повреждают базу
+    'throughput': ConnectionProfile(
+        synchronous='NORMAL',
+        mmap_size=256 * 1024 * 1024,
+        cache_size=-64 * 1024,
+        temp_store='MEMORY',
+    ),
+    # Реплика для чтения: запись запрещена, режим журнала не меняется
+    'read_only': ConnectionProfile(
+        journal_mode=None,
+        synchronous=None,
+        mmap_size=256 * 1024 * 1024,
+        cache_size=-64 * 1024,
+        temp_store='MEMORY',
+        query_only=True,
+    ),
+}
+
+
+def get_profile(profile: Union[ProfileNames, ConnectionProfile]) -> ConnectionProfile:
+    """
+    ## Возвращает профиль подключения по имени или сам профиль.
+
+    Args:
+        profile (Union[ProfileNames, ConnectionProfile]): Имя встроенного профиля или профиль.
+
+    Returns:
+        ConnectionProfile: Профиль подключения.
+
+    Raises:
+        ValueError: Если профиль с таким именем не существует.
+    """
+    if isinstance(profile, ConnectionProfile):
+        return profile
+    try:
+        return PROFILES[profile]
+    except KeyError:
+        raise ValueError(f'Неизвестный профиль подключения: {profile}') from None
@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+from datetime import date
+from sqlite3 import Cursor
+from typing import Optional, Union
+
+from core.db.schemas import SomeOrder, SomeUser
+
+
+# Компактные объекты строк для аналитических чтений.
+# Поля повторяют столбцы таблиц (`USER_COLUMNS`, `ORDER_COLUMNS` в `mapping.py`)
+# и хранят значения в том виде, в котором их вернул `sqlite3`, без валидации.
+
+
+@dataclass(slots=True, frozen=True)
+class UserRow:
+    """
+    ## Строка таблицы пользователей.
+
+    Attributes:
+        id (int): Идентификатор пользователя.
+        name (str): Имя пользователя.
+        email (str): Электронная почта пользователя.
+        registration_date (str): Дата регистрации в формате `YYYY-MM-DD`.
+        is_active (int): Статус активности пользователя (`0`/`1`).
+        updated_at (Optional[str]): Дата и время последнего обновления записи.
+    """
+    id: int
+    name: str
+    email: str
+    registration_date: Union[str, date]
+    is_active: int
+    updated_at: Optional[str] = None
+
+    @classmethod
+    def from_db(cls, cursor: Cursor, row: tuple) -> 'UserRow':
+        """
+        ## Фабрика строк для `Cursor.row_factory`.
+        """
+        return cls(*row)
+
+    def to_model(self) -> SomeUser:
+        """
+        ## Преобразует строку в модель `SomeUser` с валидацией.
+
+        Returns:
+            SomeUser: Модель пользователя.
+        """
+        return SomeUser(
+            id=self.id,
+            name=self.name,
+            email=self.email,
+            registration_date=self.registration_date,
+            is_active=self.is_active
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class OrderRow:
+    """
+    ## Строка таблицы заказов.
+
+    Attributes:
+        id (int): Идентификатор заказа.
+        user_id (int): Идентификатор пользователя, сделавшего заказ.
+        order_date (str): Дата заказа в формате `YYYY-MM-DD`.
+        total_amount (float): Общая сумма заказа.
+        status (int): Статус заказа.
+        updated_at (Optional[str]): Дата и время последнего обновления записи.
+    """
+    id: int
+    user_id: int
+    order_date: Union[str, date]
+    total_amount: float
+    status: int
+    updated_at: Optional[str] = None
+
+    @classmethod
+    def from_db(cls, cursor: Cursor, row: tuple) -> 'OrderRow':
+        """
+        ## Фабрика строк для `Cursor.row_factory`.
+        """
+        return cls(*row)
+
+    def to_model(self) -> SomeOrder:
+        """
+        ## Преобразует строку в модель `SomeOrder` с валидацией.
+
+        Returns:
+            SomeOrder: Модель заказа.
+        """
+        return SomeOrder(
+            id=self.id,
+            user_id=self.user_id,
+            order_date=self.order_date,
+            total_amount=self.total_amount,
+            status=self.status
+        )
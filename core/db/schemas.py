@@ -1,11 +1,13 @@
 from datetime import datetime, date
-from typing import Annotated, Optional
+from typing import Annotated, Generic, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
 from core.db.enums import OrderStatus, PayMethods
 
 
+T = TypeVar('T')
+
 
 class StaticFieldsSchema(BaseModel):
     """
@@ -140,6 +142,19 @@ class UpdateOrder(StaticFieldsSchema):
     status: Optional[int] = None
 
 
+class UserWithOrders(SomeUser):
+    """
+    ## Модель пользователя вместе с его заказами.
+
+    Args:
+        SomeUser (SomeUser): Модель пользователя.
+
+    Attributes:
+        orders (list[SomeOrder]): Заказы пользователя в порядке идентификаторов.
+    """
+    orders: list[SomeOrder] = []
+
+
 class PaymentsSchema(StaticFieldsSchema):
     """
     ## Схема платежа.
@@ -160,4 +175,65 @@ class PaymentsSchema(StaticFieldsSchema):
     user_id: int
     order_id: int
     payment_date: date
-    payment_method: PayMethods
\ No newline at end of file
+    payment_method: PayMethods
+
+
+class SomePayment(PaymentsSchema):
+    """
+    ## Модель платежа.
+
+    Attributes:
+        id (int): Идентификатор платежа.
+    """
+    id: int
+
+
+class UpdatePayment(StaticFieldsSchema):
+    """
+    ## Модель для обновления информации о платеже.
+
+    Позволяет обновлять поля платежа, при этом все поля являются необязательными.
+    """
+    user_id: Optional[int] = None
+    order_id: Optional[int] = None
+    payment_date: Optional[date] = None
+    payment_method: Optional[PayMethods] = None
+
+
+class Page(BaseModel, Generic[T]):
+    """
+    ## Страница записей при keyset-пагинации.
+
+    Args:
+        BaseModel (BaseModel): Базовая модель `Pydantic` для валидации данных.
+
+    Attributes:
+        items (list[T]): Записи текущей страницы.
+        next_token (Optional[str]): Токен продолжения для следующей страницы, `None` на последней странице.
+
+    Example:
+        >>> page = user_dao.get_users_page(limit=50)
+        >>> next_page = user_dao.get_users_page(limit=50, token=page.next_token)
+    """
+    items: list[T]
+    next_token: Optional[str] = None
+
+
+class BatchResult(BaseModel, Generic[T]):
+    """
+    ## Результат пакетного получения записей по идентификаторам.
+
+    Args:
+        BaseModel (BaseModel): Базовая модель `Pydantic` для валидации данных.
+
+    Attributes:
+        items (list[T]): Найденные записи в порядке запрошенных идентификаторов (без повторов).
+        missing (list[int]): Запрошенные идентификаторы, для которых записи не найдены.
+
+    Example:
+        >>> result = user_dao.get_users_by_ids([3, 1, 2])
+        >>> [user.id for user in result.items], result.missing
+        ([3, 1], [2])
+    """
+    items: list[T]
+    missing: list[int] = []
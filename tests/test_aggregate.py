@@ -0,0 +1,60 @@
+import os
+import unittest
+from datetime import date, timedelta
+from tempfile import TemporaryDirectory
+
+from core.dao.orders import OrderDAO
+from core.dao.users import UserDAO
+from core.db.schemas import OrdersSchema, UserSchema
+
+
+
+class AggregateOrdersTest(unittest.TestCase):
+    """
+    ## Агрегация заказов по дням для дат со временем (`CURRENT_TIMESTAMP`) и без него.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = TemporaryDirectory()
+        db_name = os.path.join(cls.directory.name, 'aggregate')
+        cls.users = UserDAO(db_name=db_name)
+        cls.orders = OrderDAO(db_name=db_name)
+        user = cls.users.insert_user(UserSchema(name='user', email='aggregate@example.com', registration_date=date.today()))
+        with cls.orders.pool.connection() as connection:
+            cls.today = date.fromisoformat(connection.execute("SELECT date('now')").fetchone()[0])
+            # `order_date` по умолчанию: 'YYYY-MM-DD HH:MM:SS'
+            connection.execute('INSERT INTO orders (user_id, total_amount, status) VALUES (?, ?, ?)', (user.id, 5.0, 1))
+            connection.commit()
+        cls.orders.insert_orders([
+            OrdersSchema(user_id=user.id, order_date=cls.today, total_amount=10.0, status=1),
+            OrdersSchema(user_id=user.id, order_date=cls.today - timedelta(days=1), total_amount=20.0, status=1),
+        ])
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.orders.pool.close()
+        cls.directory.cleanup()
+
+    def test_single_day_range_includes_timestamps(self) -> None:
+        (row,) = self.orders.aggregate_orders({'n': ('count', '*')}, date_from=self.today, date_to=self.today)
+        self.assertEqual(row.n, 2)
+
+    def test_group_by_day(self) -> None:
+        rows = self.orders.aggregate_orders({'n': ('count', '*'), 'revenue': ('sum', 'total_amount')}, group_by=('order_date',))
+        self.assertEqual(
+            [(row.order_date, row.n, row.revenue) for row in rows],
+            [((self.today - timedelta(days=1)).isoformat(), 1, 20.0), (self.today.isoformat(), 2, 15.0)],
+        )
+
+    def test_rejects_keyword_aliases(self) -> None:
+        for name in ('order', 'group', 'class', '_n', 'n-1'):
+            with self.subTest(name=name), self.assertRaises(ValueError):
+                self.orders.aggregate_orders({name: ('count', '*')})
+
+    def test_plain_alias_is_accepted(self) -> None:
+        (row,) = self.orders.aggregate_orders({'orders_count': ('count', '*')})
+        self.assertEqual(row.orders_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
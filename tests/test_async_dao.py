@@ -0,0 +1,90 @@
+import asyncio
+import os
+import unittest
+from array import array
+from datetime import date
+from tempfile import TemporaryDirectory
+
+from core.dao.async_dao import AsyncOrderDAO, AsyncPaymentDAO, AsyncUserDAO
+from core.dao.orders import OrderDAO
+from core.dao.payments import PaymentDAO
+from core.dao.users import UserDAO
+from core.db.enums import PayMethods
+from core.db.mapping import OrdersTableFields, UserTableFields
+from core.db.schemas import OrdersSchema, PaymentsSchema, UpdatePayment, UserSchema
+
+
+
+class AsyncDAOTest(unittest.TestCase):
+    """
+    ## Асинхронные `DAO`: материализация аргументов и методы поиска, чтения и обновления.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = TemporaryDirectory()
+        db_name = os.path.join(cls.directory.name, 'async_dao')
+        cls.users = AsyncUserDAO(UserDAO(db_name=db_name))
+        cls.orders = AsyncOrderDAO(OrderDAO(db_name=db_name))
+        cls.payments = AsyncPaymentDAO(PaymentDAO(db_name=db_name))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.users.dao.pool.close()
+        cls.directory.cleanup()
+
+    def test_round_trip(self) -> None:
+        asyncio.run(self._round_trip())
+
+    async def _round_trip(self) -> None:
+        # Генераторы материализуются до передачи в пул потоков
+        users = await self.users.insert_users(
+            (UserSchema(name='user', email=f'async.{i}@example.com', registration_date=date.today()) for i in range(3)),
+            returning=True,
+        )
+        self.assertEqual(len(users), 3)
+        orders = await self.orders.insert_orders(
+            (
+                OrdersSchema(user_id=user.id, order_date=date.today(), total_amount=float(i), status=1)
+                for i, user in enumerate(users)
+            ),
+            returning=True,
+        )
+        payments = await self.payments.insert_payments(
+            (
+                PaymentsSchema(
+                    user_id=order.user_id, order_id=order.id,
+                    payment_date=date.today(), payment_method=PayMethods.CREDIT_CARD,
+                )
+                for order in orders
+            ),
+            returning=True,
+        )
+
+        query = self.users.query().select(UserTableFields.ID).like(UserTableFields.EMAIL, 'async.%')
+        found = await self.users.find_users(query)
+        self.assertEqual(sorted(row.id for row in found), sorted(user.id for user in users))
+        found = await self.orders.find_orders(self.orders.query().where(OrdersTableFields.TOTAL_AMOUNT, '>', 0))
+        self.assertEqual(len(found), 2)
+        found = await self.payments.find_payments(self.payments.query().eq(order_id=orders[0].id))
+        self.assertEqual([payment.id for payment in found], [payments[0].id])
+
+        columns = await self.orders.fetch_columns((OrdersTableFields.TOTAL_AMOUNT,))
+        self.assertIsInstance(columns[OrdersTableFields.TOTAL_AMOUNT], array)
+        self.assertEqual(sorted(columns[OrdersTableFields.TOTAL_AMOUNT]), [0.0, 1.0, 2.0])
+
+        updated = await self.payments.update_payments(
+            UpdatePayment(payment_method=PayMethods.CASH), (payment.id for payment in payments)
+        )
+        self.assertEqual({payment.payment_method for payment in updated}, {PayMethods.CASH})
+        self.assertEqual(
+            [payment.id async for payment in self.payments.iter_payments(page_size=2)],
+            sorted(payment.id for payment in payments),
+        )
+
+        deleted = await self.users.delete_users((user.id for user in users), returning=True)
+        self.assertEqual(len(deleted), 3)
+        self.assertEqual(await self.orders.get_orders(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
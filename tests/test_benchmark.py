@@ -0,0 +1,58 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+from tempfile import TemporaryDirectory
+
+
+# Корень репозитория с `benchmark.py`
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+
+class BenchmarkTest(unittest.TestCase):
+    """
+    ## Запуски `benchmark.py` на небольшой базе.
+    """
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def _run(self, *options: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [
+                sys.executable, os.path.join(ROOT, 'benchmark.py'),
+                '--db-name', os.path.join(self.directory.name, 'bench'),
+                '--users', '50', '--orders', '300', '--ops', '20', '--threads', '2',
+                *options,
+            ],
+            cwd=self.directory.name,
+            env={**os.environ, 'PYTHONPATH': ROOT},
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+
+    def test_repeated_runs_on_kept_database(self) -> None:
+        for options in ((), ('--keep', '--skip', 'seed'), ('--keep', '--skip', 'seed')):
+            result = self._run(*options)
+            self.assertEqual(result.returncode, 0, result.stderr)
+            report = json.loads(result.stdout)
+            names = {item['name'] for item in report['results']}
+            self.assertIn('users.delete_user[cascade]', names)
+            self.assertEqual([item.get('errors', 0) for item in report['results'] if item.get('errors')], [])
+
+    def test_skip_seed_requires_keep(self) -> None:
+        result = self._run('--skip', 'seed')
+        self.assertEqual(result.returncode, 2)
+        self.assertIn('--keep', result.stderr)
+
+    def test_unknown_profile_is_rejected(self) -> None:
+        self.assertEqual(self._run('--profile', 'fast').returncode, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
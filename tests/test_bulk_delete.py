@@ -0,0 +1,102 @@
+import os
+import unittest
+from datetime import date
+from tempfile import TemporaryDirectory
+
+from core.dao.orders import OrderDAO
+from core.dao.payments import PaymentDAO
+from core.dao.users import UserDAO
+from core.db.enums import PayMethods
+from core.db.schemas import OrdersSchema, PaymentsSchema, UserSchema
+
+
+
+class BulkDeleteTest(unittest.TestCase):
+    """
+    ## Пакетное удаление нескольких записей через `executemany`.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = TemporaryDirectory()
+        db_name = os.path.join(cls.directory.name, 'bulk_delete')
+        cls.users = UserDAO(db_name=db_name)
+        cls.orders = OrderDAO(db_name=db_name)
+        cls.payments = PaymentDAO(db_name=db_name)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.users.pool.close()
+        cls.directory.cleanup()
+
+    def _insert_users(self, count: int) -> list[int]:
+        users = self.users.insert_users(
+            [
+                UserSchema(name=f'user {i}', email=f'{id(self)}.{i}@example.com', registration_date=date.today())
+                for i in range(count)
+            ],
+            returning=True,
+        )
+        return [user.id for user in users]
+
+    def _insert_orders(self, user_id: int, count: int) -> list[int]:
+        orders = self.orders.insert_orders(
+            [
+                OrdersSchema(user_id=user_id, order_date=date.today(), total_amount=10.0, status=1)
+                for _ in range(count)
+            ],
+            returning=True,
+        )
+        return [order.id for order in orders]
+
+    def _insert_payments(self, user_id: int, order_id: int, count: int) -> list[int]:
+        payments = self.payments.insert_payments(
+            [
+                PaymentsSchema(
+                    user_id=user_id, order_id=order_id,
+                    payment_date=date.today(), payment_method=PayMethods.CASH,
+                )
+                for _ in range(count)
+            ],
+            returning=True,
+        )
+        return [payment.id for payment in payments]
+
+    def test_delete_users(self) -> None:
+        ids = self._insert_users(3)
+        self.assertEqual(self.users.delete_users(ids[:2]), [])
+        self.assertEqual(self.users.get_users_by_ids(ids).missing, ids[:2])
+
+    def test_delete_users_returning(self) -> None:
+        ids = self._insert_users(2)
+        deleted = self.users.delete_users(ids, returning=True)
+        self.assertEqual(sorted(user.id for user in deleted), ids)
+
+    def test_delete_orders(self) -> None:
+        user_id = self._insert_users(1)[0]
+        self.orders.delete_orders(self._insert_orders(user_id, 3))
+        self.assertEqual(self.orders.get_orders_for_user(user_id), [])
+
+    def test_delete_payments(self) -> None:
+        user_id = self._insert_users(1)[0]
+        order_id = self._insert_orders(user_id, 1)[0]
+        ids = self._insert_payments(user_id, order_id, 3)
+        self.assertEqual(self.payments.delete_payments(ids[:2]), [])
+        self.assertEqual([payment.id for payment in self.payments.get_payments_for_order(order_id)], ids[2:])
+
+    def test_delete_users_invalidates_only_their_payments(self) -> None:
+        cache = self.payments.enable_cache()
+        try:
+            deleted, kept = self._insert_users(2)
+            deleted_payment = self._insert_payments(deleted, self._insert_orders(deleted, 1)[0], 1)[0]
+            kept_payment = self._insert_payments(kept, self._insert_orders(kept, 1)[0], 1)[0]
+            for id in (deleted_payment, kept_payment):
+                self.payments.get_payment(id)
+            self.users.delete_users([deleted])
+            self.payments.get_payment(kept_payment)
+            self.assertEqual(cache.hits, 1)
+            self.assertEqual(self.payments.get_payments_by_ids([deleted_payment]).missing, [deleted_payment])
+        finally:
+            self.payments.disable_cache()
+
+if __name__ == '__main__':
+    unittest.main()
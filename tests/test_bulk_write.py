@@ -0,0 +1,64 @@
+import os
+import unittest
+from datetime import date
+from sqlite3 import IntegrityError
+from tempfile import TemporaryDirectory
+
+from core.dao.instrumentation import instrumentation, QueryEvent
+from core.dao.users import UserDAO
+from core.db.schemas import UserSchema
+
+
+
+class BulkWriteTest(unittest.TestCase):
+    """
+    ## Пакетная запись через `executemany` с фиксацией по пакетам.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = TemporaryDirectory()
+        cls.users = UserDAO(db_name=os.path.join(cls.directory.name, 'bulk_write'))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.users.pool.close()
+        cls.directory.cleanup()
+
+    def setUp(self) -> None:
+        self.events: list[QueryEvent] = []
+        instrumentation.add_listener(self.events.append)
+
+    def tearDown(self) -> None:
+        instrumentation.remove_listener(self.events.append)
+
+    def _schemas(self, prefix: str, count: int) -> list[UserSchema]:
+        return [
+            UserSchema(name='user', email=f'{prefix}.{i}@example.com', registration_date=date.today())
+            for i in range(count)
+        ]
+
+    def _count(self, prefix: str) -> int:
+        with self.users.pool.connection() as connection:
+            return connection.execute('SELECT COUNT(*) FROM users WHERE email LIKE ?', (f'{prefix}.%',)).fetchone()[0]
+
+    def test_one_executemany_and_commit_per_batch(self) -> None:
+        self.assertEqual(self.users.insert_users(self._schemas('batches', 10), batch_size=4), [])
+        self.assertEqual(self._count('batches'), 10)
+        statements = [(event.sql.split()[0], event.rows) for event in self.events]
+        self.assertEqual([statement for statement, _ in statements], ['INSERT', 'COMMIT'] * 3)
+        self.assertEqual([rows for statement, rows in statements if statement == 'INSERT'], [4, 4, 2])
+
+    def test_returning_rows(self) -> None:
+        users = self.users.insert_users(self._schemas('returning', 3), batch_size=2, returning=True)
+        self.assertEqual([user.email for user in users], [f'returning.{i}@example.com' for i in range(3)])
+
+    def test_failed_batch_keeps_committed_batches(self) -> None:
+        schemas = self._schemas('partial', 5)
+        schemas[3] = schemas[0]
+        with self.assertRaises(IntegrityError):
+            self.users.insert_users(schemas, batch_size=2)
+        self.assertEqual(self._count('partial'), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import os
+import unittest
+from datetime import date
+from tempfile import TemporaryDirectory
+
+from core.dao.users import UserDAO
+from core.db.schemas import UserSchema
+
+
+
+class CachedReadTest(unittest.TestCase):
+    """
+    ## Чтение пользователей через кэш.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = TemporaryDirectory()
+        cls.users = UserDAO(db_name=os.path.join(cls.directory.name, 'cache'))
+        cls.cache = cls.users.enable_cache()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.users.pool.close()
+        cls.directory.cleanup()
+
+    def test_callers_get_independent_copies(self) -> None:
+        user = self.users.insert_user(UserSchema(name='user', email='cache@example.com', registration_date=date.today()))
+        first = self.users.get_user(user.id)
+        first.name = 'changed'
+        second = self.users.get_user(user.id)
+        self.assertEqual(second.name, 'user')
+        self.assertGreaterEqual(self.cache.hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
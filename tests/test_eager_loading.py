@@ -0,0 +1,68 @@
+import os
+import unittest
+from datetime import date
+from tempfile import TemporaryDirectory
+
+from core.dao.instrumentation import instrumentation, QueryEvent
+from core.dao.orders import OrderDAO
+from core.dao.users import UserDAO
+from core.db.schemas import OrdersSchema, UserSchema
+
+
+
+class EagerLoadingTest(unittest.TestCase):
+    """
+    ## Заказы пользователя и пользователи с заказами одним запросом.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = TemporaryDirectory()
+        db_name = os.path.join(cls.directory.name, 'eager')
+        cls.users = UserDAO(db_name=db_name)
+        cls.orders = OrderDAO(db_name=db_name)
+        users = cls.users.insert_users(
+            [
+                UserSchema(name=f'user {i}', email=f'eager.{i}@example.com', registration_date=date.today())
+                for i in range(3)
+            ],
+            returning=True,
+        )
+        cls.ids = [user.id for user in users]
+        # У последнего пользователя заказов нет
+        cls.orders.insert_orders(
+            [
+                OrdersSchema(user_id=user_id, order_date=date.today(), total_amount=float(n), status=1)
+                for user_id, count in zip(cls.ids, (2, 1, 0))
+                for n in range(count)
+            ]
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.users.pool.close()
+        cls.directory.cleanup()
+
+    def test_orders_for_user(self) -> None:
+        orders = self.orders.get_orders_for_user(self.ids[0])
+        self.assertEqual([order.total_amount for order in orders], [0.0, 1.0])
+        self.assertEqual(self.orders.get_orders_for_user(self.ids[2]), [])
+
+    def test_users_with_orders_in_one_query(self) -> None:
+        events: list[QueryEvent] = []
+        instrumentation.add_listener(events.append)
+        try:
+            users = self.users.get_users_with_orders()
+        finally:
+            instrumentation.remove_listener(events.append)
+        self.assertEqual(len(events), 1)
+        self.assertEqual([user.id for user in users], self.ids)
+        self.assertEqual([len(user.orders) for user in users], [2, 1, 0])
+        self.assertEqual(users[0].orders, self.orders.get_orders_for_user(self.ids[0]))
+
+    def test_users_with_orders_by_ids(self) -> None:
+        users = self.users.get_users_with_orders([self.ids[2], self.ids[0], self.ids[2]])
+        self.assertEqual([(user.id, len(user.orders)) for user in users], [(self.ids[2], 0), (self.ids[0], 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import unittest
+from array import array
+from datetime import date
+from tempfile import TemporaryDirectory
+
+from core.dao.orders import OrderDAO
+from core.dao.users import UserDAO
+from core.db.schemas import OrdersSchema, UserSchema
+
+
+
+class FetchColumnsTest(unittest.TestCase):
+    """
+    ## Столбцовое чтение заказов.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = TemporaryDirectory()
+        db_name = os.path.join(cls.directory.name, 'fetch_columns')
+        user = UserDAO(db_name=db_name).insert_user(
+            UserSchema(name='user', email='columns@example.com', registration_date=date.today())
+        )
+        cls.orders = OrderDAO(db_name=db_name)
+        cls.orders.insert_orders([
+            OrdersSchema(user_id=user.id, order_date=date(1970, 1, 2), total_amount=amount, status=1)
+            for amount in (1.5, 2.5)
+        ])
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.orders.pool.close()
+        cls.directory.cleanup()
+
+    def test_default_returns_arrays_regardless_of_numpy(self) -> None:
+        columns = self.orders.fetch_columns(('total_amount', 'order_date'))
+        self.assertIsInstance(columns['total_amount'], array)
+        self.assertEqual(list(columns['total_amount']), [1.5, 2.5])
+        self.assertEqual(list(columns['order_date']), [1, 1])
+
+    def test_empty_column_list_is_rejected(self) -> None:
+        with self.assertRaisesRegex(ValueError, 'столбец'):
+            self.orders.fetch_columns(())
+
+    def test_typecodes_and_batches(self) -> None:
+        columns = self.orders.fetch_columns(('id', 'user_id', 'total_amount'), batch_size=1)
+        self.assertEqual({name: buffer.typecode for name, buffer in columns.items()},
+                         {'id': 'q', 'user_id': 'q', 'total_amount': 'd'})
+        self.assertEqual(list(columns['total_amount']), [1.5, 2.5])
+        self.assertEqual(len(set(columns['id'])), 2)
+
+    def test_unknown_column_is_rejected(self) -> None:
+        with self.assertRaisesRegex(ValueError, 'email'):
+            self.orders.fetch_columns(('total_amount', 'email'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import unittest
+from datetime import date
+from tempfile import TemporaryDirectory
+
+from core.dao.plan import explain
+from core.dao.users import UserDAO
+from core.db.indexes import Index
+from core.db.mapping import OrdersTableFields, TablesName
+from core.db.models import ALL_INDEXES
+from core.db.schemas import UserSchema
+
+
+
+class IndexesTest(unittest.TestCase):
+    """
+    ## Декларативные индексы и их создание вместе со схемой.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = TemporaryDirectory()
+        cls.users = UserDAO(db_name=os.path.join(cls.directory.name, 'indexes'))
+        cls.users.insert_user(UserSchema(name='user', email='indexes@example.com', registration_date=date.today()))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.users.pool.close()
+        cls.directory.cleanup()
+
+    def _index_names(self) -> set[str]:
+        with self.users.pool.connection() as connection:
+            return {row[0] for row in connection.execute("SELECT name FROM sqlite_schema WHERE type = 'index'")}
+
+    def test_schema_creates_all_indexes(self) -> None:
+        self.assertLessEqual({index.index_name for index in ALL_INDEXES}, self._index_names())
+
+    def test_index_sql(self) -> None:
+        index = Index(TablesName.ORDERS, (OrdersTableFields.STATUS,), unique=True, where='status = 1', name='ix_open')
+        self.assertEqual(
+            ' '.join(index.sql.split()),
+            'CREATE UNIQUE INDEX IF NOT EXISTS ix_open ON orders (status) WHERE status = 1;',
+        )
+        self.assertEqual(Index(TablesName.ORDERS, ('user_id', 'order_date')).index_name, 'ix_orders_user_id_order_date')
+
+    def test_create_indexes_is_idempotent_and_used(self) -> None:
+        index = Index(TablesName.USERS, ('is_active',))
+        self.users.create_indexes([index])
+        self.users.create_indexes([index])
+        self.assertIn(index.index_name, self._index_names())
+        with self.users.pool.connection() as connection:
+            plan = explain(connection, 'SELECT * FROM users WHERE is_active = ?')
+        self.assertEqual([access.kind for access in plan.accesses], ['search'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import logging
+import os
+import unittest
+from datetime import date
+from tempfile import TemporaryDirectory
+
+from core.dao.instrumentation import instrumentation, QueryEvent, QueryHistogram, SlowQueryLogger
+from core.dao.users import UserDAO
+from core.db.schemas import UserSchema
+
+
+
+class QueryHistogramTest(unittest.TestCase):
+    """
+    ## Гистограмма запросов `DAO`.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = TemporaryDirectory()
+        cls.users = UserDAO(db_name=os.path.join(cls.directory.name, 'instrumentation'))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.users.pool.close()
+        cls.directory.cleanup()
+
+    def setUp(self) -> None:
+        self.histogram = instrumentation.add_listener(QueryHistogram())
+
+    def tearDown(self) -> None:
+        instrumentation.remove_listener(self.histogram)
+
+    def test_reads_have_no_commit_shape(self) -> None:
+        user = self.users.insert_user(UserSchema(name='user', email='histogram@example.com', registration_date=date.today()))
+        self.histogram.reset()
+        for _ in range(10):
+            self.users.get_user(user.id)
+        stats = self.histogram.snapshot()
+        self.assertNotIn('COMMIT', stats)
+        self.assertEqual(sum(s.count for s in stats.values()), 10)
+        self.assertEqual({source for s in stats.values() for source in s.sources}, {'UserDAO.get_user'})
+
+    def test_write_has_one_commit(self) -> None:
+        self.users.insert_user(UserSchema(name='user', email='histogram.write@example.com', registration_date=date.today()))
+        self.assertEqual(self.histogram.snapshot()['COMMIT'].count, 1)
+
+
+
+class SlowQueryLoggerTest(unittest.TestCase):
+    """
+    ## Журнал медленных запросов.
+    """
+    def setUp(self) -> None:
+        self.logger = logging.getLogger('tests.slow_queries')
+        self.slow = SlowQueryLogger(threshold=0.5, logger=self.logger)
+
+    def test_fast_query_is_not_logged(self) -> None:
+        with self.assertNoLogs(self.logger):
+            self.slow(QueryEvent('SELECT 1', 'UserDAO.get_user', 0.1, 1, None))
+
+    def test_slow_query_is_logged(self) -> None:
+        error = RuntimeError('boom')
+        with self.assertLogs(self.logger, logging.WARNING) as logs:
+            self.slow(QueryEvent('SELECT  *\n  FROM users', 'UserDAO.get_users', 0.75, 3, error))
+        (message,) = logs.output
+        self.assertIn('750.0 мс', message)
+        self.assertIn('UserDAO.get_users', message)
+        self.assertIn(repr(error), message)
+        self.assertIn('SELECT * FROM users', message)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from datetime import date
+
+from pydantic import ValidationError
+
+from core.dao.mappers import RowMapper
+from core.db.mapping import ORDER_COLUMNS, USER_COLUMNS
+from core.db.schemas import SomeOrder, SomeUser
+
+
+
+class RowMapperTest(unittest.TestCase):
+    """
+    ## Сборка моделей из строк `SQLite` без валидации `Pydantic`.
+    """
+    row = (1, 'user', 'mapper@example.com', '2024-01-02', 1, '2024-01-02 10:00:00')
+
+    def test_trusted_matches_validated(self) -> None:
+        trusted = RowMapper(SomeUser, USER_COLUMNS)(self.row)
+        validated = RowMapper(SomeUser, USER_COLUMNS, trusted=False)(self.row)
+        self.assertEqual(trusted, validated)
+        self.assertEqual(trusted.registration_date, date(2024, 1, 2))
+        self.assertIs(trusted.is_active, True)
+        self.assertEqual(trusted.model_dump(), validated.model_dump())
+
+    def test_timestamp_is_converted_to_date(self) -> None:
+        order = RowMapper(SomeOrder, ORDER_COLUMNS)((1, 2, '2024-01-02 10:00:00', 5, 1, None))
+        self.assertEqual(order.order_date, date(2024, 1, 2))
+        self.assertEqual(order.total_amount, 5.0)
+        self.assertIsInstance(order.total_amount, float)
+
+    def test_only_strict_mode_validates(self) -> None:
+        row = ('not an id', *self.row[1:])
+        self.assertEqual(RowMapper(SomeUser, USER_COLUMNS)(row).id, 'not an id')
+        with self.assertRaises(ValidationError):
+            RowMapper(SomeUser, USER_COLUMNS, trusted=False)(row)
+
+
+if __name__ == '__main__':
+    unittest.main()
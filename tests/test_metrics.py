@@ -0,0 +1,59 @@
+import os
+import unittest
+from datetime import date
+from tempfile import TemporaryDirectory
+
+from core.dao.instrumentation import instrumentation
+from core.dao.metrics import MetricsRegistry
+from core.dao.users import UserDAO
+from core.db.schemas import UserSchema, UserUpdate
+
+
+
+class CommitMetricsTest(unittest.TestCase):
+    """
+    ## Счётчик фиксаций учитывает только реальные транзакции.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = TemporaryDirectory()
+        cls.users = UserDAO(db_name=os.path.join(cls.directory.name, 'metrics'))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.users.pool.close()
+        cls.directory.cleanup()
+
+    def setUp(self) -> None:
+        self.metrics = MetricsRegistry()
+        instrumentation.add_listener(self.metrics)
+
+    def tearDown(self) -> None:
+        instrumentation.remove_listener(self.metrics)
+
+    def test_reads_do_not_count_as_commits(self) -> None:
+        user = self.users.insert_user(UserSchema(name='user', email='metrics@example.com', registration_date=date.today()))
+        for _ in range(10):
+            self.users.get_user(user.id)
+        text = self.metrics.render()
+        self.assertIn('dao_commits_total 1\n', text)
+        self.assertIn('dao_queries_total{table="users",operation="SELECT"} 10\n', text)
+
+    def test_update_is_labelled_with_table(self) -> None:
+        users = self.users.insert_users(
+            [
+                UserSchema(name='user', email=f'metrics.update.{i}@example.com', registration_date=date.today())
+                for i in range(2)
+            ],
+            returning=True,
+        )
+        self.users.update_user(UserUpdate(name='renamed'), users[0].id)
+        self.users.update_users(UserUpdate(is_active=False), [user.id for user in users])
+        text = self.metrics.render()
+        self.assertIn('dao_queries_total{table="users",operation="UPDATE"} 2\n', text)
+        self.assertIn('dao_rows_written_total{table="users"} 5\n', text)
+        self.assertNotIn('table="",operation="UPDATE"', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
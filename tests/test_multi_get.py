@@ -0,0 +1,67 @@
+import os
+import unittest
+from datetime import date
+from tempfile import TemporaryDirectory
+
+from core.dao.instrumentation import instrumentation, QueryEvent
+from core.dao.orders import OrderDAO
+from core.dao.users import UserDAO
+from core.db.schemas import OrdersSchema, UserSchema
+
+
+
+class MultiGetTest(unittest.TestCase):
+    """
+    ## Пакетное получение записей по идентификаторам.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = TemporaryDirectory()
+        db_name = os.path.join(cls.directory.name, 'multi_get')
+        cls.users = UserDAO(db_name=db_name)
+        cls.orders = OrderDAO(db_name=db_name)
+        users = cls.users.insert_users(
+            [
+                UserSchema(name=f'user {i}', email=f'multi.{i}@example.com', registration_date=date.today())
+                for i in range(10)
+            ],
+            returning=True,
+        )
+        cls.ids = [user.id for user in users]
+        orders = cls.orders.insert_orders(
+            [OrdersSchema(user_id=cls.ids[0], order_date=date.today(), total_amount=1.0, status=1) for _ in range(3)],
+            returning=True,
+        )
+        cls.order_ids = [order.id for order in orders]
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.users.pool.close()
+        cls.directory.cleanup()
+
+    def test_order_duplicates_and_missing(self) -> None:
+        missing = max(self.ids) + 100
+        requested = [self.ids[3], missing, self.ids[1], self.ids[3]]
+        result = self.users.get_users_by_ids(requested)
+        self.assertEqual([user.id for user in result.items], [self.ids[3], self.ids[1]])
+        self.assertEqual(result.missing, [missing])
+        self.assertEqual(result.items[0], self.users.get_user(self.ids[3]))
+
+    def test_orders(self) -> None:
+        result = self.orders.get_orders_by_ids(reversed(self.order_ids))
+        self.assertEqual([order.id for order in result.items], self.order_ids[::-1])
+        self.assertEqual(result.missing, [])
+
+    def test_reads_in_batches(self) -> None:
+        events: list[QueryEvent] = []
+        instrumentation.add_listener(events.append)
+        try:
+            result = self.users.get_users_by_ids(self.ids, batch_size=4)
+        finally:
+            instrumentation.remove_listener(events.append)
+        self.assertEqual([user.id for user in result.items], self.ids)
+        self.assertEqual(len(events), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
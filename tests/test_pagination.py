@@ -0,0 +1,94 @@
+import os
+import unittest
+from datetime import date
+from tempfile import TemporaryDirectory
+
+from core.dao.orders import OrderDAO
+from core.dao.plan import explain
+from core.dao.sql_registry import sql_registry
+from core.dao.users import UserDAO
+from core.db.mapping import OrdersTableFields, UserTableFields
+from core.db.schemas import OrdersSchema, UserSchema
+
+
+
+class KeysetPaginationTest(unittest.TestCase):
+    """
+    ## Keyset-пагинация: полный обход страниц, `NULL` в поле сортировки и индексы.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = TemporaryDirectory()
+        db_name = os.path.join(cls.directory.name, 'pagination')
+        cls.users = UserDAO(db_name=db_name)
+        cls.orders = OrderDAO(db_name=db_name)
+        user, *_ = cls.users.insert_users(
+            [
+                UserSchema(name=f'user {i % 2}', email=f'pagination.{i}@example.com', registration_date=date.today())
+                for i in range(3)
+            ],
+            returning=True,
+        )
+        cls.orders.insert_orders(
+            [
+                OrdersSchema(user_id=user.id, order_date=date.today(), total_amount=float(i % 4), status=1)
+                for i in range(23)
+            ]
+        )
+        with cls.orders.pool.connection() as connection:
+            connection.execute('UPDATE orders SET total_amount = NULL WHERE id % 3 = 0')
+            connection.commit()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.users.pool.close()
+        cls.directory.cleanup()
+
+    def _walk(self, sort_by: tuple[str, ...], descending: bool) -> list[tuple]:
+        keys = []
+        token = None
+        while True:
+            page = self.orders.get_orders_page(limit=4, token=token, sort_by=sort_by, descending=descending)
+            keys.extend((order.total_amount, order.id) for order in page.items)
+            token = page.next_token
+            if token is None:
+                return keys
+
+    def _expected(self, descending: bool) -> list[tuple]:
+        with self.orders.pool.connection() as connection:
+            rows = connection.execute('SELECT total_amount, id FROM orders').fetchall()
+        # `NULL` меньше любого значения, как в `SQLite`
+        return sorted(rows, key=lambda row: (row[0] is not None, row[0] or 0, row[1]), reverse=descending)
+
+    def test_walks_all_rows_with_nulls_ascending(self) -> None:
+        self.assertEqual(self._walk((OrdersTableFields.TOTAL_AMOUNT,), False), self._expected(False))
+
+    def test_walks_all_rows_with_nulls_descending(self) -> None:
+        self.assertEqual(self._walk((OrdersTableFields.TOTAL_AMOUNT,), True), self._expected(True))
+
+    def test_walks_all_rows_by_id(self) -> None:
+        keys = self._walk((), False)
+        self.assertEqual([key[1] for key in keys], sorted(key[1] for key in self._expected(False)))
+
+    def test_rejects_several_sort_fields(self) -> None:
+        with self.assertRaises(ValueError):
+            self.orders.get_orders_page(sort_by=(OrdersTableFields.STATUS, OrdersTableFields.ORDER_DATE))
+
+    def test_sortable_fields_are_indexed(self) -> None:
+        for dao, fields in ((self.users, UserDAO.SORTABLE_FIELDS), (self.orders, OrderDAO.SORTABLE_FIELDS)):
+            for field in fields - {UserTableFields.ID}:
+                for descending in (False, True):
+                    page = dao.get_page(dao.table_name, 1, sort_fields=(field,), descending=descending)
+                    while page[1] is not None:
+                        page = dao.get_page(dao.table_name, 1, page[1], (field,), descending)
+        with self.orders.pool.connection() as connection:
+            plans = [explain(connection, sql) for sql in sql_registry if 'ORDER BY' in sql and 'LIMIT' in sql]
+        self.assertTrue(plans)
+        for plan in plans:
+            with self.subTest(sql=' '.join(plan.sql.split())):
+                self.assertFalse(plan.temp_btree)
+                self.assertNotIn('full scan', [access.kind for access in plan.accesses if access.nested or plan.filtered])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import unittest
+from datetime import date
+from tempfile import TemporaryDirectory
+
+from core.dao.instrumentation import instrumentation, QueryEvent
+from core.dao.users import UserDAO
+from core.db.schemas import UserSchema, UserUpdate
+
+
+
+class PartialUpdateTest(unittest.TestCase):
+    """
+    ## Частичное обновление: записываются только заданные поля.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = TemporaryDirectory()
+        cls.users = UserDAO(db_name=os.path.join(cls.directory.name, 'partial_update'))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.users.pool.close()
+        cls.directory.cleanup()
+
+    def setUp(self) -> None:
+        self.events: list[QueryEvent] = []
+        instrumentation.add_listener(self.events.append)
+
+    def tearDown(self) -> None:
+        instrumentation.remove_listener(self.events.append)
+
+    def _insert(self, count: int) -> list[int]:
+        users = self.users.insert_users(
+            [
+                UserSchema(name=f'user {i}', email=f'{self.id()}.{i}@example.com', registration_date=date.today())
+                for i in range(count)
+            ],
+            returning=True,
+        )
+        self.events.clear()
+        return [user.id for user in users]
+
+    def test_writes_only_set_fields(self) -> None:
+        (user_id,) = self._insert(1)
+        user = self.users.update_user(UserUpdate(name='renamed'), user_id)
+        self.assertEqual((user.name, user.email, user.is_active), ('renamed', f'{self.id()}.0@example.com', True))
+        (update,) = [event.sql for event in self.events if event.sql.lstrip().startswith('UPDATE')]
+        assignments = update.split('SET', 1)[1].split('WHERE', 1)[0]
+        self.assertIn('name = ?', assignments)
+        self.assertNotIn('email', assignments)
+        self.assertNotIn('is_active', assignments)
+
+    def test_empty_update_only_reads(self) -> None:
+        (user_id,) = self._insert(1)
+        self.assertEqual(self.users.update_user(UserUpdate(), user_id), self.users.get_user(user_id))
+        self.assertFalse([event for event in self.events if event.sql.lstrip().startswith('UPDATE')])
+
+    def test_bulk_update_by_ids(self) -> None:
+        ids = self._insert(5)
+        users = self.users.update_users(UserUpdate(is_active=False), ids, batch_size=2)
+        self.assertEqual(sorted(user.id for user in users), ids)
+        self.assertFalse(any(user.is_active for user in self.users.get_users_by_ids(ids).items))
+        self.assertEqual(len([event for event in self.events if event.sql.lstrip().startswith('UPDATE')]), 3)
+        with self.assertRaises(ValueError):
+            self.users.update_users(UserUpdate(), ids)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import unittest
+from datetime import date
+from sqlite3 import IntegrityError
+from tempfile import TemporaryDirectory
+
+from core.dao.orders import OrderDAO
+from core.dao.payments import PaymentDAO
+from core.dao.users import UserDAO
+from core.db.enums import PayMethods
+from core.db.schemas import OrdersSchema, PaymentsSchema, UpdatePayment, UserSchema
+
+
+
+class PaymentsTest(unittest.TestCase):
+    """
+    ## Платежи: пакетная загрузка, выборка по заказу, обновления и каскадное удаление.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = TemporaryDirectory()
+        db_name = os.path.join(cls.directory.name, 'payments')
+        cls.users = UserDAO(db_name=db_name)
+        cls.orders = OrderDAO(db_name=db_name)
+        cls.payments = PaymentDAO(db_name=db_name)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.users.pool.close()
+        cls.directory.cleanup()
+
+    def _order(self) -> tuple[int, int]:
+        user = self.users.insert_user(
+            UserSchema(name='user', email=f'{self.id()}@example.com', registration_date=date.today())
+        )
+        order = self.orders.insert_order(
+            OrdersSchema(user_id=user.id, order_date=date.today(), total_amount=10.0, status=1)
+        )
+        return user.id, order.id
+
+    def _schemas(self, user_id: int, order_id: int, count: int) -> list[PaymentsSchema]:
+        return [
+            PaymentsSchema(
+                user_id=user_id, order_id=order_id, payment_date=date.today(), payment_method=PayMethods.CREDIT_CARD,
+            )
+            for _ in range(count)
+        ]
+
+    def test_bulk_insert_and_read_by_order(self) -> None:
+        user_id, order_id = self._order()
+        self.assertEqual(self.payments.insert_payments(self._schemas(user_id, order_id, 5), batch_size=2), [])
+        payments = self.payments.get_payments_for_order(order_id)
+        self.assertEqual(len(payments), 5)
+        self.assertEqual([payment.id for payment in payments], sorted(payment.id for payment in payments))
+        result = self.payments.get_payments_by_ids([payments[1].id, payments[0].id])
+        self.assertEqual(result.items, [payments[1], payments[0]])
+
+    def test_foreign_key_is_enforced(self) -> None:
+        user_id, order_id = self._order()
+        with self.assertRaises(IntegrityError):
+            self.payments.insert_payments(self._schemas(user_id, order_id + 1000, 1))
+
+    def test_partial_and_bulk_updates(self) -> None:
+        user_id, order_id = self._order()
+        payments = self.payments.insert_payments(self._schemas(user_id, order_id, 3), returning=True)
+        payment = self.payments.update_payment(UpdatePayment(payment_method=PayMethods.CASH), payments[0].id)
+        self.assertEqual((payment.payment_method, payment.order_id), (PayMethods.CASH, order_id))
+        updated = self.payments.update_payments(UpdatePayment(payment_method=PayMethods.CASH), [p.id for p in payments])
+        self.assertEqual({p.payment_method for p in updated}, {PayMethods.CASH})
+
+    def test_deleting_order_cascades(self) -> None:
+        user_id, order_id = self._order()
+        self.payments.insert_payments(self._schemas(user_id, order_id, 2))
+        self.orders.delete_order(order_id)
+        self.assertEqual(self.payments.get_payments_for_order(order_id), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+import unittest
+from datetime import date
+from tempfile import TemporaryDirectory
+
+from core.dao.plan import audit, INTENTIONAL_SCANS
+from core.dao.users import UserDAO
+from core.db.mapping import UserTableFields
+from core.db.schemas import UserSchema
+
+
+# Корень репозитория с пакетом `core`
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+
+class PlanAuditTest(unittest.TestCase):
+    """
+    ## Проверка планов запросов и `python -m core.dao.plan`.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = TemporaryDirectory()
+        cls.users = UserDAO(db_name=os.path.join(cls.directory.name, 'plan'))
+        cls.users.insert_user(UserSchema(name='user', email='plan@example.com', registration_date=date.today()))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.users.pool.close()
+        cls.directory.cleanup()
+
+    def test_like_is_intentional_scan(self) -> None:
+        sql, _ = self.users.query().like(UserTableFields.EMAIL, '%@example.com').compile()
+        with self.users.pool.connection() as connection:
+            self.assertFalse(audit(connection, [sql]).ok)
+            self.assertTrue(audit(connection, [sql], allow=INTENTIONAL_SCANS).ok)
+
+    def test_unindexed_filter_is_violation(self) -> None:
+        sql, _ = self.users.query().eq(is_active=True).compile()
+        with self.users.pool.connection() as connection:
+            result = audit(connection, [sql], allow=INTENTIONAL_SCANS)
+        self.assertEqual([access.table for _, access in result.violations], ['users'])
+
+    def test_cli_passes_on_fresh_database(self) -> None:
+        with TemporaryDirectory() as directory:
+            process = subprocess.run(
+                [sys.executable, '-m', 'core.dao.plan'],
+                cwd=directory,
+                env={**os.environ, 'PYTHONPATH': ROOT},
+                capture_output=True,
+                text=True,
+                timeout=120,
+            )
+        self.assertEqual(process.returncode, 0, process.stdout + process.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
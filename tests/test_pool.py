@@ -0,0 +1,117 @@
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from threading import current_thread, Event, Thread
+
+from core.db.pool import ConnectionPool
+
+
+
+class ThreadBoundPoolTest(unittest.TestCase):
+    """
+    ## Пул с подключениями, закреплёнными за потоками (`check_same_thread=True`).
+    """
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        self.database = os.path.join(self.directory.name, 'pool.db')
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def _use(self, pool: ConnectionPool) -> None:
+        with pool.connection() as connection:
+            connection.execute('SELECT 1').fetchone()
+
+    def _in_thread(self, target) -> None:
+        thread = Thread(target=target)
+        thread.start()
+        thread.join()
+
+    def test_exited_thread_frees_its_slot(self) -> None:
+        pool = ConnectionPool(self.database, max_size=1, checkout_timeout=0.5, check_same_thread=True)
+        self._in_thread(lambda: self._use(pool))
+        self._use(pool)
+        self.assertEqual((pool.size, pool.idle), (1, 1))
+        pool.close()
+        self.assertEqual((pool.size, pool.idle), (0, 0))
+
+    def test_close_reaches_connections_of_live_threads(self) -> None:
+        pool = ConnectionPool(self.database, max_size=2, check_same_thread=True)
+        parked, closed, errors = Event(), Event(), []
+
+        def worker() -> None:
+            self._use(pool)
+            parked.set()
+            closed.wait()
+            try:
+                self._use(pool)
+            except RuntimeError as ex:
+                errors.append(ex)
+
+        thread = Thread(target=worker)
+        thread.start()
+        parked.wait()
+        self.assertEqual(pool.idle, 1)
+        pool.close()
+        closed.set()
+        thread.join()
+        self.assertEqual(len(errors), 1)
+        self.assertEqual((pool.size, pool.idle), (0, 0))
+
+
+
+class ConnectOutsideLockTest(unittest.TestCase):
+    """
+    ## Подключение открывается вне блокировки пула, место освобождается при ошибке.
+    """
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        self.database = os.path.join(self.directory.name, 'pool.db')
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_slow_connect_does_not_block_other_threads(self) -> None:
+        pool = ConnectionPool(self.database, max_size=2, checkout_timeout=5)
+        create = pool._create
+        connecting, proceed = Event(), Event()
+
+        def slow_create():
+            if current_thread() is thread:
+                connecting.set()
+                proceed.wait(5)
+            return create()
+
+        pool._create = slow_create
+        thread = Thread(target=lambda: pool.release(pool.acquire()))
+        thread.start()
+        self.assertTrue(connecting.wait(5))
+        try:
+            with pool.connection() as connection:
+                connection.execute('SELECT 1').fetchone()
+            self.assertFalse(proceed.is_set())
+        finally:
+            proceed.set()
+            thread.join()
+        self.assertEqual(pool.size, 2)
+        pool.close()
+
+    def test_failed_connect_frees_slot(self) -> None:
+        pool = ConnectionPool(self.database, max_size=1, checkout_timeout=0.5)
+        create = pool._create
+
+        def failing_create():
+            raise OSError('connect failed')
+
+        pool._create = failing_create
+        with self.assertRaises(OSError):
+            pool.acquire()
+        self.assertEqual(pool.size, 0)
+        pool._create = create
+        pool.release(pool.acquire())
+        self.assertEqual((pool.size, pool.idle), (1, 1))
+        pool.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import sqlite3
+import unittest
+from tempfile import TemporaryDirectory
+
+from core.db.pool import ConnectionPool
+from core.db.profiles import ConnectionProfile, get_profile
+
+
+
+class ConnectionProfileTest(unittest.TestCase):
+    """
+    ## Профили `PRAGMA` для подключений пула.
+    """
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        self.database = os.path.join(self.directory.name, 'profiles.db')
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def _pragmas(self, profile, *names: str) -> dict:
+        pool = ConnectionPool(self.database, profile=profile)
+        try:
+            with pool.connection() as connection:
+                return {name: connection.execute(f'PRAGMA {name}').fetchone()[0] for name in names}
+        finally:
+            pool.close()
+
+    def test_throughput(self) -> None:
+        self.assertEqual(
+            self._pragmas('throughput', 'journal_mode', 'synchronous', 'cache_size', 'temp_store', 'foreign_keys'),
+            {'journal_mode': 'wal', 'synchronous': 1, 'cache_size': -64 * 1024, 'temp_store': 2, 'foreign_keys': 1},
+        )
+
+    def test_durable(self) -> None:
+        self.assertEqual(self._pragmas('durable', 'journal_mode', 'synchronous'), {'journal_mode': 'wal', 'synchronous': 2})
+
+    def test_read_only_rejects_writes(self) -> None:
+        pool = ConnectionPool(self.database, profile='read_only')
+        try:
+            with pool.connection() as connection, self.assertRaises(sqlite3.OperationalError):
+                connection.execute('CREATE TABLE t (id INTEGER)')
+        finally:
+            pool.close()
+
+    def test_custom_and_unknown_profiles(self) -> None:
+        profile = ConnectionProfile(journal_mode=None, busy_timeout=None, cache_size=-1000)
+        self.assertIs(get_profile(profile), profile)
+        self.assertEqual(
+            profile.pragmas,
+            ('PRAGMA synchronous = NORMAL', 'PRAGMA cache_size = -1000', 'PRAGMA foreign_keys = ON', 'PRAGMA query_only = OFF'),
+        )
+        with self.assertRaises(ValueError):
+            get_profile('fastest')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import os
+import unittest
+from datetime import date
+from tempfile import TemporaryDirectory
+
+from core.dao.sql_registry import sql_registry
+from core.dao.users import UserDAO
+from core.db.mapping import UserTableFields
+from core.db.schemas import UserSchema
+
+
+
+class QueryBuilderTest(unittest.TestCase):
+    """
+    ## Построитель запросов `Query`: проекция и кэш скомпилированных форм.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = TemporaryDirectory()
+        cls.users = UserDAO(db_name=os.path.join(cls.directory.name, 'query'))
+        cls.users.insert_user(UserSchema(name='user', email='query@example.com', registration_date=date.today()))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.users.pool.close()
+        cls.directory.cleanup()
+
+    def test_repeated_column_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            self.users.query().select(UserTableFields.ID, UserTableFields.ID)
+
+    def test_projection(self) -> None:
+        query = self.users.query().select(UserTableFields.ID, UserTableFields.EMAIL)
+        self.assertEqual([row.email for row in self.users.find_users(query)], ['query@example.com'])
+
+    def test_compiled_shapes_do_not_grow_registry(self) -> None:
+        before = len(sql_registry)
+        texts = [self.users.query().where(UserTableFields.ID, '>', n).limit(n, n).compile()[0] for n in range(1, 50)]
+        for n in range(1, 50):
+            self.users.find_users(self.users.query().where_in(UserTableFields.ID, range(n)))
+        self.assertEqual(len(sql_registry), before)
+        self.assertTrue(all(text is texts[0] for text in texts))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import os
+import unittest
+from dataclasses import FrozenInstanceError
+from datetime import date
+from tempfile import TemporaryDirectory
+
+from core.dao.orders import OrderDAO
+from core.dao.users import UserDAO
+from core.db.rows import OrderRow, UserRow
+from core.db.schemas import OrdersSchema, UserSchema
+
+
+
+class ResultRowsTest(unittest.TestCase):
+    """
+    ## Компактные объекты строк в режиме `'row'`.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = TemporaryDirectory()
+        db_name = os.path.join(cls.directory.name, 'rows')
+        cls.users = UserDAO(db_name=db_name, result_mode='row')
+        cls.orders = OrderDAO(db_name=db_name)
+        user = cls.users.insert_user(UserSchema(name='user', email='rows@example.com', registration_date=date.today()))
+        cls.orders.insert_order(OrdersSchema(user_id=user.id, order_date=date.today(), total_amount=2.5, status=1))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.users.pool.close()
+        cls.directory.cleanup()
+
+    def test_default_result_mode(self) -> None:
+        (row,) = self.users.get_users()
+        self.assertIsInstance(row, UserRow)
+        self.assertEqual(row.to_model(), self.users.get_users(mode='model')[0])
+
+    def test_per_call_mode(self) -> None:
+        (row,) = self.orders.get_orders(mode='row')
+        self.assertIsInstance(row, OrderRow)
+        self.assertEqual(row.to_model(), self.orders.get_orders()[0])
+        self.assertEqual(list(self.orders.iter_orders(mode='row')), [row])
+
+    def test_rows_are_slotted_and_frozen(self) -> None:
+        (row,) = self.users.get_users()
+        self.assertFalse(hasattr(row, '__dict__'))
+        with self.assertRaises(FrozenInstanceError):
+            row.name = 'other'
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import os
+import sqlite3
+import unittest
+from tempfile import TemporaryDirectory
+
+from core.dao.users import UserDAO
+from core.db.models import SCHEMA_VERSION
+from core.modules.app_logger import app_logger
+
+
+
+class EnsureSchemaTest(unittest.TestCase):
+    """
+    ## Ошибка создания схемы не скрывается, а подготовка повторяется.
+    """
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        self.db_name = os.path.join(self.directory.name, 'schema')
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_failed_schema_raises_and_is_retried(self) -> None:
+        # Таблица без столбцов, на которые строятся индексы схемы
+        with sqlite3.connect(self.db_name + '.db') as connection:
+            connection.execute('CREATE TABLE users (id INTEGER PRIMARY KEY)')
+        connection.close()
+
+        users = UserDAO(db_name=self.db_name)
+        with self.assertLogs(app_logger, 'ERROR'), self.assertRaises(sqlite3.OperationalError):
+            users.get_users()
+
+        with sqlite3.connect(self.db_name + '.db') as connection:
+            self.assertEqual(connection.execute('PRAGMA user_version').fetchone()[0], 0)
+            connection.execute('DROP TABLE users')
+        connection.close()
+
+        self.assertEqual(UserDAO(db_name=self.db_name).get_users(), [])
+        with users.pool.connection() as connection:
+            self.assertEqual(connection.execute('PRAGMA user_version').fetchone()[0], SCHEMA_VERSION)
+        users.pool.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
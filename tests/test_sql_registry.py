@@ -0,0 +1,35 @@
+import os
+import unittest
+from tempfile import TemporaryDirectory
+
+from core.dao.sql_registry import SqlRegistry
+from core.dao.sql_templates import GET_ONE
+from core.dao.users import UserDAO
+
+
+
+class SqlRegistryTest(unittest.TestCase):
+    """
+    ## Реестр готовых `SQL`-запросов.
+    """
+    def test_renders_each_combination_once(self) -> None:
+        registry = SqlRegistry()
+        first = registry.render(GET_ONE, table_name='users', main_field='id')
+        second = registry.render(GET_ONE, main_field='id', table_name='users')
+        self.assertIs(first, second)
+        self.assertEqual(first, GET_ONE.format(table_name='users', main_field='id'))
+        self.assertEqual(len(registry), 1)
+        registry.render(GET_ONE, table_name='orders', main_field='id')
+        self.assertEqual(len(registry), 2)
+        self.assertIn(first, list(registry))
+
+    def test_daos_share_query_objects(self) -> None:
+        with TemporaryDirectory() as directory:
+            first = UserDAO(db_name=os.path.join(directory, 'first'))
+            second = UserDAO(db_name=os.path.join(directory, 'second'))
+            self.assertIs(first.sql_get_one, second.sql_get_one)
+            self.assertIs(first.sql_get_all, second.sql_get_all)
+
+
+if __name__ == '__main__':
+    unittest.main()
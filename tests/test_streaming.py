@@ -0,0 +1,62 @@
+import os
+import unittest
+from datetime import date
+from tempfile import TemporaryDirectory
+
+from core.dao.orders import OrderDAO
+from core.dao.users import UserDAO
+from core.db.rows import UserRow
+from core.db.schemas import OrdersSchema, UserSchema
+
+
+
+class StreamingReadTest(unittest.TestCase):
+    """
+    ## Потоковое чтение `iter_users`/`iter_orders` пакетами `fetchmany`.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = TemporaryDirectory()
+        db_name = os.path.join(cls.directory.name, 'streaming')
+        cls.users = UserDAO(db_name=db_name)
+        cls.orders = OrderDAO(db_name=db_name)
+        users = cls.users.insert_users(
+            [
+                UserSchema(name=f'user {i}', email=f'streaming.{i}@example.com', registration_date=date.today())
+                for i in range(7)
+            ],
+            returning=True,
+        )
+        cls.orders.insert_orders(
+            [OrdersSchema(user_id=user.id, order_date=date.today(), total_amount=1.0, status=1) for user in users]
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.users.pool.close()
+        cls.directory.cleanup()
+
+    def test_matches_full_read(self) -> None:
+        self.assertEqual(list(self.users.iter_users(batch_size=3)), self.users.get_users())
+        self.assertEqual(list(self.orders.iter_orders(batch_size=3)), self.orders.get_orders())
+
+    def test_row_mode(self) -> None:
+        rows = list(self.users.iter_users(batch_size=2, mode='row'))
+        self.assertTrue(all(isinstance(row, UserRow) for row in rows))
+        self.assertEqual([row.to_model() for row in rows], self.users.get_users())
+
+    def test_connection_is_held_until_generator_closes(self) -> None:
+        idle = self.users.pool.idle
+        users = self.users.iter_users(batch_size=2)
+        next(users)
+        self.assertEqual(self.users.pool.idle, idle - 1)
+        users.close()
+        self.assertEqual(self.users.pool.idle, idle)
+
+    def test_rejects_non_positive_batch(self) -> None:
+        with self.assertRaises(ValueError):
+            next(self.users.iter_users(batch_size=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
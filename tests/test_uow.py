@@ -0,0 +1,71 @@
+import os
+import unittest
+from datetime import date
+from tempfile import TemporaryDirectory
+
+from core.dao.orders import OrderDAO
+from core.dao.uow import unit_of_work
+from core.dao.users import UserDAO
+from core.db.schemas import OrdersSchema, UserSchema
+
+
+
+class UnitOfWorkTest(unittest.TestCase):
+    """
+    ## Единица работы: одна транзакция для нескольких `DAO`.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = TemporaryDirectory()
+        db_name = os.path.join(cls.directory.name, 'uow')
+        cls.users = UserDAO(db_name=db_name)
+        cls.orders = OrderDAO(db_name=db_name)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.users.pool.close()
+        cls.directory.cleanup()
+
+    def _create(self, uow, email: str) -> int:
+        user = uow.users.insert_user(UserSchema(name='user', email=email, registration_date=date.today()))
+        uow.orders.insert_order(OrdersSchema(user_id=user.id, order_date=date.today(), total_amount=1.0, status=1))
+        return user.id
+
+    def _exists(self, user_id: int) -> tuple[bool, bool]:
+        with self.users.pool.connection() as connection:
+            return (
+                connection.execute('SELECT 1 FROM users WHERE id = ?', (user_id,)).fetchone() is not None,
+                connection.execute('SELECT 1 FROM orders WHERE user_id = ?', (user_id,)).fetchone() is not None,
+            )
+
+    def test_commits_together(self) -> None:
+        with unit_of_work(self.users, self.orders) as uow:
+            user_id = self._create(uow, 'uow.commit@example.com')
+        self.assertEqual(self._exists(user_id), (True, True))
+
+    def test_rolls_back_together(self) -> None:
+        with self.assertRaises(RuntimeError):
+            with unit_of_work(self.users, self.orders) as uow:
+                user_id = self._create(uow, 'uow.rollback@example.com')
+                raise RuntimeError('abort')
+        self.assertEqual(self._exists(user_id), (False, False))
+
+    def test_nested_unit_rolls_back_to_savepoint(self) -> None:
+        with unit_of_work(self.users, self.orders) as outer:
+            kept = self._create(outer, 'uow.outer@example.com')
+            with self.assertRaises(RuntimeError):
+                with unit_of_work(self.users, self.orders) as inner:
+                    dropped = self._create(inner, 'uow.inner@example.com')
+                    raise RuntimeError('abort')
+        self.assertEqual(self._exists(kept), (True, True))
+        self.assertEqual(self._exists(dropped), (False, False))
+
+    def test_rejects_daos_of_different_databases(self) -> None:
+        other = OrderDAO(db_name=os.path.join(self.directory.name, 'other'))
+        with self.assertRaises(ValueError):
+            unit_of_work(self.users, other)
+        other.pool.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
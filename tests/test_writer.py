@@ -0,0 +1,62 @@
+import os
+import unittest
+from datetime import date
+from sqlite3 import IntegrityError
+from tempfile import TemporaryDirectory
+
+from core.dao.instrumentation import instrumentation, QueryEvent
+from core.dao.users import UserDAO
+from core.dao.writer import GroupCommitWriter
+from core.db.schemas import UserSchema
+
+
+
+class GroupCommitWriterTest(unittest.TestCase):
+    """
+    ## Поток записи с групповой фиксацией.
+    """
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        self.users = UserDAO(db_name=os.path.join(self.directory.name, 'writer'))
+        self.users.get_users()
+        self.writer = GroupCommitWriter(self.users.pool, max_latency=0.05)
+        self.events: list[QueryEvent] = []
+        instrumentation.add_listener(self.events.append)
+
+    def tearDown(self) -> None:
+        instrumentation.remove_listener(self.events.append)
+        self.writer.close()
+        self.users.pool.close()
+        self.directory.cleanup()
+
+    def _submit(self, email: str):
+        user = UserSchema(name='user', email=email, registration_date=date.today())
+        return self.writer.submit(
+            self.users.sql_create_one,
+            (user.name, user.email, user.registration_date, user.is_active),
+            self.users.mapper,
+        )
+
+    def test_batch_is_committed_once(self) -> None:
+        futures = [self._submit(f'writer.{i}@example.com') for i in range(20)]
+        users = [future.result(5) for future in futures]
+        self.assertEqual([user.email for user in users], [f'writer.{i}@example.com' for i in range(20)])
+        commits = [event for event in self.events if event.sql == 'COMMIT']
+        self.assertLess(len(commits), 20)
+        self.assertEqual(len(self.users.get_users()), 20)
+
+    def test_failed_operation_does_not_cancel_batch(self) -> None:
+        futures = [self._submit(email) for email in ('a@example.com', 'a@example.com', 'b@example.com')]
+        self.assertEqual(futures[0].result(5).email, 'a@example.com')
+        self.assertIsInstance(futures[1].exception(5), IntegrityError)
+        self.assertEqual(futures[2].result(5).email, 'b@example.com')
+        self.assertEqual(len(self.users.get_users()), 2)
+
+    def test_closed_writer_rejects_operations(self) -> None:
+        self.writer.close()
+        with self.assertRaises(RuntimeError):
+            self._submit('closed@example.com')
+
+
+if __name__ == '__main__':
+    unittest.main()